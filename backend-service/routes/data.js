@@ -158,11 +158,11 @@ async function saveContentItem(item) {
   const query = `
     INSERT INTO content (
       id, title, content, summary, url, source, source_id,
-      published_at, collected_at, author_name, author_url,
+      published_at, published_date, collected_at, author_name, author_url,
       likes, shares, comments, sentiment_score
     ) VALUES (
       @id, @title, @content, @summary, @url, @source, @source_id,
-      @published_at, @collected_at, @author_name, @author_url,
+      @published_at, CAST(@published_at AS DATE), @collected_at, @author_name, @author_url,
       @likes, @shares, @comments, @sentiment_score
     )
   `;
@@ -25,6 +25,8 @@ def main():
     parser.add_argument('--date', type=str, help='Filter by date (YYYY-MM-DD)')
     parser.add_argument('--source', type=str, help='Filter by source (twitter, linkedin, rss)')
     parser.add_argument('--limit', type=int, default=30, help='Maximum number of items to retrieve')
+    parser.add_argument('--cursor', action='store_true', help='Return a page object {"items": [...], "next_cursor": ...} instead of a list')
+    parser.add_argument('--after', type=str, help='Cursor returned with the previous page; implies --cursor')
     parser.add_argument('--get-dates', action='store_true', help='Get available dates instead of content')
     args = parser.parse_args()
 
@@ -32,6 +34,19 @@ def main():
         # Get available dates
         dates = ContentStorage.get_available_dates(limit=args.limit)
         print(json.dumps(dates, default=json_serial))
+    elif args.cursor or args.after:
+        # Get one page of content; pass next_cursor as --after to get the next one
+        try:
+            page = ContentStorage.get_content_page(
+                limit=args.limit,
+                source=args.source,
+                date=args.date,
+                after=args.after
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+        print(json.dumps(page, default=json_serial))
     else:
         # Get content with optional filters
         content_list = ContentStorage.get_recent_content(
@@ -9,7 +9,7 @@ import sys
 sys.path.append('.')
 
 from src.models.database import get_db
-from src.models.content import Content, Category
+from src.models.content import Content, ContentDailyStats, Category
 from src.utils.logger import setup_logger
 from src.utils.config import ACTIVE_DATABASE_URL
 
@@ -55,8 +55,9 @@ def main():
                 db.commit()
                 logger.info("Cleared all content-category relationships")
 
-                # Now delete all content records
+                # Now delete all content records and their daily counts
                 deleted_content = db.query(Content).delete()
+                db.query(ContentDailyStats).delete()
                 db.commit()
                 logger.info(f"Deleted {deleted_content} content records")
                 print(f"Deleted {deleted_content} content records")
@@ -12,19 +12,18 @@ Usage:
     python collect_and_save_data.py
     python collect_and_save_data.py --limit 10
     python collect_and_save_data.py --source rss
+    python collect_and_save_data.py --stream
 """
 
 import sys
 import os
 import argparse
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 # Add the root directory to the Python path to allow imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from collectors.base_collector import DataCollector
-from src.models.storage import ContentStorage
 from src.utils.logger import setup_logger
 
 # Set up logger
@@ -32,10 +31,20 @@ logger = setup_logger('collect_data')
 
 def main():
     """Collect data from RSS sources and save it to the database."""
+    # Imported here rather than at module level: feed parse workers re-import
+    # this script, and these modules load the configuration, create the
+    # database engine and start the summarization service
+    from collectors.base_collector import DataCollector
+    from collectors.seen_filter import SeenIdFilter
+    from src.models.storage import ContentStorage
+    from src.services.stream_pipeline import StreamingPipeline
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Collect data from RSS sources and save it to the database')
     parser.add_argument('--days-ago', type=int, default=7, help='Number of days back to collect data')
     parser.add_argument('--max-results', type=int, default=10, help='Maximum number of results to collect per source')
+    parser.add_argument('--stream', action='store_true', help='Stream entries through fetch, summarize and store stages straight into the database')
+    parser.add_argument('--full-refresh', action='store_true', help='Ignore feed caches, high-water marks, the polling schedule and the stored-entry filter, and re-process every entry in the date window')
     args = parser.parse_args()
 
     days_ago = args.days_ago
@@ -44,8 +53,25 @@ def main():
     try:
         logger.info(f"Starting RSS data collection process (days_ago={days_ago}, max_results={max_results})")
 
+        # Load the keys already stored so known entries are never re-summarized
+        seen_filter = None
+        if not args.full_refresh:
+            since = datetime.utcnow() - timedelta(days=days_ago + 1)
+            seen_filter = SeenIdFilter.from_source_ids('rss', ContentStorage.get_known_source_ids('rss', since=since))
+
         # Initialize the data collector (RSS only)
-        collector = DataCollector()
+        collector = DataCollector(seen_filter=seen_filter, full_refresh=args.full_refresh)
+
+        if args.stream:
+            # Entries are written to the database as soon as they are summarized
+            summary = StreamingPipeline(collector.rss_collector).run(days_ago=days_ago)
+
+            logger.info("RSS streaming collection completed successfully")
+            logger.info(f"Summary: {summary}")
+
+            print(f"RSS streaming collection completed. Total items: {summary['collected']}")
+            print(f"Items saved to database: {summary['total']}")
+            return
 
         # TWITTER COLLECTION - TEMPORARILY COMMENTED OUT
         # logger.info(f"Collecting data from Twitter for the past {days_ago} day(s)")
@@ -96,7 +122,9 @@ def main():
 
         # Save data to the database
         logger.info("Saving RSS data to database")
-        summary = ContentStorage.save_all_data(all_data)
+        stored_ids = set()
+        summary = ContentStorage.save_all_data(all_data, rss_stored_ids=stored_ids)
+        collector.rss_collector.commit_state(rss_data, stored_ids)
 
         logger.info(f"RSS data collection and storage completed successfully")
         logger.info(f"Summary: {summary}")
@@ -19,13 +19,30 @@ class DataCollector:
     Main data collection class that aggregates data from all sources.
     """
 
-    def __init__(self):
+    def __init__(self, seen_filter=None, full_refresh=False, archive=None):
         """
         Initialize the data collector with all source collectors.
+
+        Args:
+            seen_filter (SeenIdFilter): Keys already stored in the database;
+                matching items are dropped before summarization.
+            full_refresh (bool): Ignore the per-feed cache, high-water marks,
+                polling schedule and seen_filter and re-process every entry
+                inside the date window; stored items are updated in place.
+            archive (PayloadArchive): Archive that raw payloads are recorded
+                to, or, in replay mode, served from instead of the network.
         """
+        self.archive = archive
+
         # self.twitter_collector = TwitterCollector()        # Temporarily commented out
         # self.linkedin_collector = LinkedInCollector()      # Temporarily commented out
-        self.rss_collector = RSSCollector()
+        self.rss_collector = RSSCollector(
+            use_cache=False if full_refresh else None,
+            incremental=False if full_refresh else None,
+            adaptive_polling=False if full_refresh else None,
+            seen_filter=None if full_refresh else seen_filter,
+            archive=archive
+        )
 
         # Create data directory if it doesn't exist
         os.makedirs('data', exist_ok=True)
@@ -53,6 +70,12 @@ class DataCollector:
         #     logger.error(f"Error collecting Twitter data: {str(e)}")
         #     twitter_data = []
         twitter_data = []  # Empty for now
+        if self.archive is not None and self.archive.replay and (
+                self.archive.keys('twitter_hashtag') or self.archive.keys('twitter_account')):
+            # Archived Twitter payloads can be replayed without API access
+            from .twitter_collector import TwitterCollector
+            twitter_data = TwitterCollector(archive=self.archive).collect_all_tweets(max_results, days_ago)
+            logger.info(f"Replayed {len(twitter_data)} items from Twitter")
 
         # Collect data from LinkedIn - TEMPORARILY COMMENTED OUT
         # try:
@@ -69,6 +92,11 @@ class DataCollector:
         #     logger.error(f"Error collecting LinkedIn data: {str(e)}")
         #     linkedin_data = []
         linkedin_data = []  # Empty for now
+        if self.archive is not None and self.archive.replay and self.archive.keys('linkedin'):
+            # Archived LinkedIn payloads can be replayed without API access
+            from .linkedin_collector import LinkedInCollector
+            linkedin_data = LinkedInCollector(archive=self.archive).replay_posts(max_results)
+            logger.info(f"Replayed {len(linkedin_data)} items from LinkedIn")
 
         # Collect data from RSS feeds
         try:
@@ -0,0 +1,242 @@
+"""
+Persistent per-feed state for the RSS collector.
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from statistics import median
+
+from src.utils.config import RSS_STATE_FILE, RSS_MIN_POLL_MINUTES, RSS_MAX_POLL_HOURS, RSS_POLL_GRACE_MINUTES
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('feed_state')
+
+# Number of recent publish times kept per feed to estimate its cadence
+PUBLISH_HISTORY_SIZE = 20
+
+class FeedStateStore:
+    """
+    JSON-backed store of per-feed bookkeeping kept between collection runs.
+
+    Each feed name maps to a plain dictionary. The RSS collector keeps the
+    HTTP validators (ETag / Last-Modified) and a hash of the last response
+    body there so unchanged feeds can be skipped on the next run, along with
+    the feed's high-water mark and recent publish times used to schedule the
+    next poll, and running totals of feed-summary decisions.
+
+    Values that must only be kept once a feed's entries are stored are
+    staged with stage() and merged in by commit(); staged values are never
+    written to disk.
+    """
+
+    def __init__(self, path=None, persist=True):
+        """
+        Initialize the store and load any previously saved state.
+
+        Args:
+            path (str): Path of the JSON state file. Defaults to RSS_STATE_FILE.
+            persist (bool): Load from and save to disk. An in-memory store is
+                used for offline replays so they never touch the real state.
+        """
+        self.path = path or RSS_STATE_FILE
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._state = self._load() if persist else {}
+        self._pending = {}
+
+    def _load(self):
+        """
+        Load state from disk.
+
+        Returns:
+            dict: Saved state, or an empty dictionary if none is available.
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+            logger.info(f"Loaded feed state for {len(state)} feeds from {self.path}")
+            return state
+        except Exception as e:
+            logger.warning(f"Could not read feed state from {self.path}: {str(e)}")
+            return {}
+
+    def get(self, feed_name):
+        """
+        Get a copy of the saved state for a feed.
+
+        Args:
+            feed_name (str): Name of the feed.
+
+        Returns:
+            dict: State for the feed (empty if the feed has never been seen).
+        """
+        with self._lock:
+            return dict(self._state.get(feed_name, {}))
+
+    def update(self, feed_name, **values):
+        """
+        Merge values into the saved state for a feed.
+
+        Args:
+            feed_name (str): Name of the feed.
+            **values: Fields to set. Fields set to None are removed.
+        """
+        with self._lock:
+            state = self._state.setdefault(feed_name, {})
+            for key, value in values.items():
+                if value is None:
+                    state.pop(key, None)
+                else:
+                    state[key] = value
+
+    def stage(self, feed_name, **values):
+        """
+        Stage values for a feed until its entries have been stored.
+
+        Args:
+            feed_name (str): Name of the feed.
+            **values: Fields to set on commit. Fields set to None are removed.
+        """
+        with self._lock:
+            self._pending.setdefault(feed_name, {}).update(values)
+
+    def staged_feeds(self):
+        """
+        Get the feeds with staged values.
+
+        Returns:
+            list: Feed names.
+        """
+        with self._lock:
+            return list(self._pending)
+
+    def commit(self, feed_name):
+        """
+        Merge a feed's staged values into its saved state.
+
+        Args:
+            feed_name (str): Name of the feed.
+        """
+        with self._lock:
+            values = self._pending.pop(feed_name, {})
+        if values:
+            self.update(feed_name, **values)
+
+    def discard(self, feed_name):
+        """
+        Drop a feed's staged values, e.g. because its entries were not stored.
+
+        Args:
+            feed_name (str): Name of the feed.
+        """
+        with self._lock:
+            self._pending.pop(feed_name, None)
+
+    def record_poll(self, feed_name, publish_times, now=None):
+        """
+        Record a successful poll and schedule the next one from the feed's cadence.
+
+        The poll interval is the median gap between recent publish times,
+        clamped to [RSS_MIN_POLL_MINUTES, RSS_MAX_POLL_HOURS]. Feeds that
+        publish hourly are polled hourly; weekly newsletters once a day.
+
+        Args:
+            feed_name (str): Name of the feed.
+            publish_times (list): Naive UTC publish times seen in this poll.
+            now (datetime): Current naive UTC time (defaults to utcnow).
+
+        Returns:
+            datetime: When the feed is next due.
+        """
+        now = now or datetime.utcnow()
+        min_interval = timedelta(minutes=RSS_MIN_POLL_MINUTES)
+        max_interval = timedelta(hours=RSS_MAX_POLL_HOURS)
+
+        with self._lock:
+            state = self._state.setdefault(feed_name, {})
+
+            known = set(state.get('publish_times', []))
+            known.update(value.isoformat() for value in publish_times)
+            history = sorted(known)[-PUBLISH_HISTORY_SIZE:]
+
+            interval = max_interval
+            if len(history) >= 2:
+                times = [datetime.fromisoformat(value) for value in history]
+                gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+                interval = min(max(median(gaps), min_interval), max_interval)
+
+            next_due = now + interval
+            state['publish_times'] = history
+            state['last_polled'] = now.isoformat()
+            state['poll_interval_minutes'] = round(interval.total_seconds() / 60, 1)
+            state['next_due'] = next_due.isoformat()
+
+        return next_due
+
+    def record_summary_decisions(self, feed_name, decisions):
+        """
+        Add feed-summary decisions to a feed's running totals.
+
+        The totals ('accepted' and one count per rejection reason) measure
+        how many summarization requests the feed's own summaries save.
+
+        Args:
+            feed_name (str): Name of the feed.
+            decisions (dict): Number of entries per decision reason in this poll.
+        """
+        with self._lock:
+            state = self._state.setdefault(feed_name, {})
+            totals = state.setdefault('feed_summary_decisions', {})
+            for reason, count in decisions.items():
+                totals[reason] = totals.get(reason, 0) + count
+
+    def is_due(self, feed_name, now=None):
+        """
+        Check whether a feed should be polled in this run.
+
+        Feeds without a schedule are always due. A grace period of
+        RSS_POLL_GRACE_MINUTES absorbs jitter in the start time of scheduled
+        runs, so a feed due "a few minutes from now" is polled today rather
+        than skipped until tomorrow.
+
+        Args:
+            feed_name (str): Name of the feed.
+            now (datetime): Current naive UTC time (defaults to utcnow).
+
+        Returns:
+            bool: True if the feed should be polled.
+        """
+        next_due = self.get(feed_name).get('next_due')
+        if not next_due:
+            return True
+
+        now = now or datetime.utcnow()
+        return now + timedelta(minutes=RSS_POLL_GRACE_MINUTES) >= datetime.fromisoformat(next_due)
+
+    def save(self):
+        """
+        Write the state to disk atomically.
+        """
+        if not self.persist:
+            return
+
+        with self._lock:
+            data = json.dumps(self._state, indent=2, sort_keys=True)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+            logger.debug(f"Feed state saved to {self.path}")
+        except Exception as e:
+            logger.error(f"Error saving feed state to {self.path}: {str(e)}")
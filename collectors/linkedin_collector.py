@@ -7,7 +7,6 @@ LinkedIn content, as mentioned in the project README.
 import requests
 import urllib.parse
 from datetime import datetime, timedelta
-import time
 import json
 import os
 import sys
@@ -25,6 +24,7 @@ if __name__ == "__main__":
 # Now imports from src will work whether run as a module or directly
 from src.utils.config import LINKEDIN_API_KEY
 from src.utils.logger import setup_logger
+from src.utils.rate_limiter import rate_limiter
 
 # Set up logger
 logger = setup_logger('linkedin_collector')
@@ -37,16 +37,19 @@ class LinkedInCollector:
     access to LinkedIn content through their APIs.
     """
 
-    def __init__(self, service_name="lix", api_key=None):
+    def __init__(self, service_name="lix", api_key=None, archive=None):
         """
         Initialize the LinkedIn collector with third-party service credentials.
 
         Args:
             service_name (str): Name of the third-party service ('lix')
             api_key (str): API key for the third-party service
+            archive (PayloadArchive): Archive that raw responses are recorded
+                to, or, in replay mode, read from instead of the API
         """
         self.service_name = service_name
         self.api_key = api_key
+        self.archive = archive
 
         # If no API key is provided, try to get it from config
         if not self.api_key:
@@ -90,6 +93,9 @@ class LinkedInCollector:
         Returns:
             dict: API response
         """
+        if self.archive is not None and self.archive.replay:
+            return self.archive.get_json('linkedin', search_term)
+
         if not self.api_key:
             logger.error("No API key provided for Lix service")
             return None
@@ -116,8 +122,12 @@ class LinkedInCollector:
 
         try:
             logger.debug(f"Making request to {url}")
+            # Space out requests made with this API key to the service host
+            rate_limiter.acquire(url, api_key=self.api_key)
             response = requests.request("GET", url, headers=headers, data=payload)
             response.raise_for_status()
+            if self.archive is not None:
+                self.archive.put('linkedin', search_term, response.content)
             response_data = response.json()
             # Log the response structure for debugging
             logger.debug(f"Response structure: {json.dumps(response_data, indent=2)[:500]}...")
@@ -165,7 +175,8 @@ class LinkedInCollector:
         """
         logger.info(f"Collecting LinkedIn posts for keyword: {keyword}")
 
-        if not self.api_key:
+        replaying = self.archive is not None and self.archive.replay
+        if not self.api_key and not replaying:
             logger.error("No API key provided for Lix service. Cannot collect real data.")
             return []
 
@@ -323,8 +334,6 @@ class LinkedInCollector:
             try:
                 company_posts = self.collect_company_posts(company, max_results)
                 all_posts.extend(company_posts)
-                # Add delay to avoid rate limiting
-                time.sleep(1)
             except Exception as e:
                 logger.error(f"Error collecting posts from company {company}: {str(e)}")
 
@@ -333,8 +342,6 @@ class LinkedInCollector:
             try:
                 influencer_posts = self.collect_influencer_posts(influencer, max_results)
                 all_posts.extend(influencer_posts)
-                # Add delay to avoid rate limiting
-                time.sleep(1)
             except Exception as e:
                 logger.error(f"Error collecting posts from influencer {influencer}: {str(e)}")
 
@@ -343,8 +350,6 @@ class LinkedInCollector:
             try:
                 keyword_posts = self.collect_posts_by_keyword(keyword, max_results)
                 all_posts.extend(keyword_posts)
-                # Add delay to avoid rate limiting
-                time.sleep(1)
             except Exception as e:
                 logger.error(f"Error collecting posts for keyword {keyword}: {str(e)}")
 
@@ -359,6 +364,31 @@ class LinkedInCollector:
         logger.info(f"Collected {len(unique_posts)} unique LinkedIn posts")
         return unique_posts
 
+    def replay_posts(self, max_results=10):
+        """
+        Re-run post processing over every response in the archived run.
+
+        Args:
+            max_results (int): Maximum number of posts to keep per search term
+
+        Returns:
+            list: List of unique posts, as collect_all_posts would return them
+        """
+        all_posts = []
+        for search_term in self.archive.keys('linkedin'):
+            all_posts.extend(self.collect_posts_by_keyword(search_term, max_results))
+
+        # Remove duplicate posts
+        unique_posts = []
+        seen_ids = set()
+        for post in all_posts:
+            if post['id'] not in seen_ids:
+                seen_ids.add(post['id'])
+                unique_posts.append(post)
+
+        logger.info(f"Replayed {len(unique_posts)} unique LinkedIn posts from run {self.archive.run_id}")
+        return unique_posts
+
     def _simulate_company_posts(self, company_id, count=5, days_ago=7):
         """Generate simulated company posts for testing"""
         posts = []
@@ -0,0 +1,276 @@
+"""
+Near-duplicate detection for collected articles.
+
+Syndicated stories show up in several feeds with slightly different
+markup, intros or footers. Each article's cleaned text is reduced to a
+64-bit SimHash; articles whose hashes differ in at most DEDUP_MAX_DISTANCE
+bits are treated as copies of the first one seen (the canonical item).
+
+Lookups use LSH banding: the hash is split into DEDUP_MAX_DISTANCE + 1
+bands, and by the pigeonhole principle two hashes within the distance share
+at least one band exactly, so candidates are found with indexed equality
+lookups instead of a scan over every stored hash.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from src.utils.config import DEDUP_INDEX_PATH, DEDUP_MAX_DISTANCE, DEDUP_RETENTION_DAYS
+from src.utils.logger import setup_logger
+from src.utils.text_utils import extract_text
+
+# Set up logger
+logger = setup_logger('near_duplicates')
+
+HASH_BITS = 64
+
+# Words per shingle and the amount of text hashed per article
+SHINGLE_SIZE = 3
+TEXT_TOKEN_BUDGET = 2000
+
+# Articles with fewer words than this are too short to compare reliably
+MIN_WORDS = 20
+
+WORD_RE = re.compile(r'\w+')
+
+
+def _to_signed(value):
+    """Map an unsigned 64-bit integer to SQLite's signed INTEGER range."""
+    return value - (1 << HASH_BITS) if value >= (1 << (HASH_BITS - 1)) else value
+
+
+def _to_unsigned(value):
+    return value + (1 << HASH_BITS) if value < 0 else value
+
+
+def simhash(text):
+    """
+    Compute the 64-bit SimHash of a text over overlapping word shingles.
+
+    Args:
+        text (str): Plain text.
+
+    Returns:
+        int: Unsigned 64-bit SimHash, or None if the text is too short.
+    """
+    words = WORD_RE.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    hashes = np.array([
+        int.from_bytes(hashlib.blake2b(' '.join(words[i:i + SHINGLE_SIZE]).encode('utf-8'), digest_size=8).digest(), 'big')
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    ], dtype=np.uint64)
+
+    # A bit is set when more shingle hashes have it set than not
+    bits = (hashes[:, None] >> np.arange(HASH_BITS, dtype=np.uint64)) & np.uint64(1)
+    majority = bits.sum(axis=0) * 2 > len(hashes)
+    return sum(1 << bit for bit in np.flatnonzero(majority).tolist())
+
+
+class NearDuplicateIndex:
+    """
+    Persistent SimHash index with LSH banding, stored in SQLite.
+
+    Items are identified by "source:source_id" keys. The summary of a
+    canonical item is stored alongside its hash once known, so copies seen
+    in later runs can reuse it.
+
+    New canonical items are held in memory until confirm() is called for
+    them once they are stored. Copies within a run can link to them, but an
+    item that is never stored is never offered as canonical to later runs.
+    """
+
+    def __init__(self, path=None, max_distance=None, retention_days=None):
+        """
+        Initialize the index. The database is opened on first use.
+
+        Args:
+            path (str): Path of the SQLite database. Defaults to DEDUP_INDEX_PATH.
+            max_distance (int): Maximum Hamming distance between near
+                duplicates. Defaults to DEDUP_MAX_DISTANCE.
+            retention_days (int): Items older than this are pruned. Defaults
+                to DEDUP_RETENTION_DAYS.
+        """
+        self.path = path or DEDUP_INDEX_PATH
+        self.max_distance = DEDUP_MAX_DISTANCE if max_distance is None else max_distance
+        self.retention_days = retention_days or DEDUP_RETENTION_DAYS
+        self._conn = None
+        self._lock = threading.Lock()
+        # Canonical items added in this run and not yet confirmed: key -> (simhash, bands, summary)
+        self._pending = {}
+
+        # Split the hash into max_distance + 1 bands of nearly equal width
+        band_count = self.max_distance + 1
+        widths = [HASH_BITS // band_count + (1 if i < HASH_BITS % band_count else 0) for i in range(band_count)]
+        self._bands = []
+        offset = 0
+        for width in widths:
+            self._bands.append((offset, (1 << width) - 1))
+            offset += width
+
+    def _connect(self):
+        """Open the database, create the tables and prune old items. Call with the lock held."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS items ('
+                'item_key TEXT PRIMARY KEY, simhash INTEGER NOT NULL, '
+                'summary TEXT, added_at REAL NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS bands ('
+                'band INTEGER NOT NULL, value INTEGER NOT NULL, item_key TEXT NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS ix_bands_lookup ON bands (band, value)')
+
+            cutoff = time.time() - self.retention_days * 86400
+            self._conn.execute('DELETE FROM bands WHERE item_key IN (SELECT item_key FROM items WHERE added_at < ?)', (cutoff,))
+            self._conn.execute('DELETE FROM items WHERE added_at < ?', (cutoff,))
+            self._conn.commit()
+        return self._conn
+
+    def _band_values(self, value):
+        return [(band, value >> offset & mask) for band, (offset, mask) in enumerate(self._bands)]
+
+    def find_or_add(self, item_key, text):
+        """
+        Find the canonical item an article duplicates, or index it as a new canonical item.
+
+        Args:
+            item_key (str): "source:source_id" key of the article.
+            text (str): Article title and content (HTML is stripped).
+
+        Returns:
+            str: Key of the canonical item if the article is a near duplicate,
+                otherwise None.
+        """
+        value = simhash(extract_text(text, TEXT_TOKEN_BUDGET))
+        if value is None:
+            return None
+
+        bands = self._band_values(value)
+        try:
+            with self._lock:
+                conn = self._connect()
+
+                candidates = set()
+                for band, band_value in bands:
+                    rows = conn.execute('SELECT item_key FROM bands WHERE band = ? AND value = ?', (band, band_value))
+                    candidates.update(row[0] for row in rows)
+                candidates.discard(item_key)
+
+                best_key, best_distance = None, self.max_distance + 1
+                for candidate in candidates:
+                    row = conn.execute('SELECT simhash FROM items WHERE item_key = ?', (candidate,)).fetchone()
+                    if row is None:
+                        continue
+                    distance = bin(_to_unsigned(row[0]) ^ value).count('1')
+                    if distance < best_distance:
+                        best_key, best_distance = candidate, distance
+
+                # Items of this run are few enough to compare directly
+                for candidate, (candidate_value, _, _) in self._pending.items():
+                    distance = bin(candidate_value ^ value).count('1')
+                    if candidate != item_key and distance < best_distance:
+                        best_key, best_distance = candidate, distance
+
+                if best_key is not None:
+                    logger.info(f"{item_key} is a near duplicate of {best_key} (distance {best_distance})")
+                    return best_key
+
+                self._pending[item_key] = (value, bands, None)
+                return None
+        except sqlite3.Error as e:
+            logger.error(f"Error using near-duplicate index {self.path}: {str(e)}")
+            return None
+
+    def confirm(self, item_keys):
+        """
+        Persist canonical items added in this run once they have been stored.
+
+        Args:
+            item_keys (iterable): "source:source_id" keys of the stored items.
+                Keys that are not pending are ignored.
+        """
+        try:
+            with self._lock:
+                items = [(key, self._pending.pop(key)) for key in item_keys if key in self._pending]
+                if not items:
+                    return
+
+                conn = self._connect()
+                now = time.time()
+                for item_key, (value, bands, summary) in items:
+                    conn.execute(
+                        'INSERT INTO items (item_key, simhash, summary, added_at) VALUES (?, ?, ?, ?) '
+                        'ON CONFLICT (item_key) DO UPDATE SET simhash = excluded.simhash, '
+                        'summary = COALESCE(excluded.summary, items.summary)',
+                        (item_key, _to_signed(value), summary, now)
+                    )
+                    conn.execute('DELETE FROM bands WHERE item_key = ?', (item_key,))
+                    conn.executemany(
+                        'INSERT INTO bands (band, value, item_key) VALUES (?, ?, ?)',
+                        [(band, band_value, item_key) for band, band_value in bands]
+                    )
+                conn.commit()
+                logger.debug(f"Confirmed {len(items)} canonical items")
+        except sqlite3.Error as e:
+            logger.error(f"Error writing near-duplicate index {self.path}: {str(e)}")
+
+    def get_summary(self, item_key):
+        """
+        Get the stored summary of a canonical item.
+
+        Args:
+            item_key (str): "source:source_id" key of the item.
+
+        Returns:
+            str: The summary, or None if it is not known yet.
+        """
+        try:
+            with self._lock:
+                if item_key in self._pending:
+                    return self._pending[item_key][2]
+                row = self._connect().execute('SELECT summary FROM items WHERE item_key = ?', (item_key,)).fetchone()
+                return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.error(f"Error reading near-duplicate index {self.path}: {str(e)}")
+            return None
+
+    def set_summary(self, item_key, summary):
+        """
+        Store the summary of a canonical item for its duplicates to reuse.
+
+        Args:
+            item_key (str): "source:source_id" key of the item.
+            summary (str): The item's summary.
+        """
+        try:
+            with self._lock:
+                if item_key in self._pending:
+                    value, bands, _ = self._pending[item_key]
+                    self._pending[item_key] = (value, bands, summary)
+                    return
+                conn = self._connect()
+                conn.execute('UPDATE items SET summary = ? WHERE item_key = ?', (summary, item_key))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing near-duplicate index {self.path}: {str(e)}")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -2,32 +2,230 @@
 RSS feed aggregator module for the AI Dashboard.
 """
 import feedparser
+import hashlib
 import json
+import multiprocessing
+import requests
+import threading
 from datetime import datetime, timedelta
-import time
-from dateutil import parser as date_parser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-from src.utils.config import RSS_FEEDS
+from src.utils.feed_parser import parse_feed_body
+from collectors.feed_state import FeedStateStore
+from collectors.near_duplicates import NearDuplicateIndex
+from collectors.seen_filter import SeenIdFilter
+from src.utils.config import (
+    RSS_FEEDS, RSS_MAX_WORKERS, RSS_REQUEST_TIMEOUT, RSS_CACHE_ENABLED, RSS_INCREMENTAL,
+    RSS_PARSE_WORKERS, RSS_ADAPTIVE_POLLING, DEDUP_ENABLED, FEED_SUMMARY_ENABLED
+)
 from src.utils.logger import setup_logger
+from src.utils.rate_limiter import rate_limiter
+from src.services.feed_summary import select_feed_summary
 from src.services.summarization_service import summarization_service
+from src.services.summary_scheduler import SummaryScheduler
 
 # Set up logger
 logger = setup_logger('rss_collector')
 
+def parse_pool_context():
+    """
+    Get the multiprocessing context for the feed parse pool.
+
+    The pool is started from fetch threads, so plain fork is unsafe. Where
+    available a forkserver is used: it is a single-threaded process that
+    imports the entry script and the parser once, and every worker is forked
+    from it, instead of each spawned worker importing them again. Elsewhere
+    (Windows) workers are spawned.
+
+    Returns:
+        multiprocessing.context.BaseContext: The context.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(['__main__', 'src.utils.feed_parser'])
+    return context
+
+
 class RSSCollector:
     """
     Collects AI-related content from RSS feeds.
     """
 
-    def __init__(self, feeds=None):
+    def __init__(self, feeds=None, max_workers=None, use_cache=None, state=None,
+                 incremental=None, seen_filter=None, parse_workers=None, adaptive_polling=None,
+                 archive=None, near_duplicates=None, scheduler=None, use_feed_summaries=None):
         """
         Initialize the RSS collector with feed URLs.
 
         Args:
             feeds (dict): Dictionary of feed names and URLs.
+            max_workers (int): Number of feeds fetched in parallel. Defaults to
+                RSS_MAX_WORKERS; 1 collects feeds sequentially.
+            use_cache (bool): Skip feeds that have not changed since the last
+                run. Defaults to RSS_CACHE_ENABLED.
+            state (FeedStateStore): Per-feed state store. A store backed by
+                RSS_STATE_FILE is created if not provided.
+            incremental (bool): Skip entries at or below each feed's high-water
+                mark. Defaults to RSS_INCREMENTAL.
+            seen_filter (SeenIdFilter): Keys already stored in the database.
+                Matching entries are dropped before summarization.
+            parse_workers (int): Number of processes used to parse feed
+                bodies. Defaults to RSS_PARSE_WORKERS; 0 parses in the
+                fetching thread.
+            adaptive_polling (bool): Only fetch feeds whose learned next-due
+                time has passed. Defaults to RSS_ADAPTIVE_POLLING.
+            archive (PayloadArchive): Archive that downloaded bodies are
+                recorded to, or, in replay mode, read from instead of the network.
+                While recording, every feed is fetched unconditionally so the
+                archive holds a complete run.
+            near_duplicates (NearDuplicateIndex): Index used to link syndicated
+                copies to a canonical entry. A persistent index is used when
+                DEDUP_ENABLED.
+            scheduler (SummaryScheduler): Orders summarization by priority and
+                defers work past the time budget.
+            use_feed_summaries (bool): Store adequate feed-provided summaries
+                instead of generating them. Defaults to FEED_SUMMARY_ENABLED.
         """
+        self.archive = archive
+        if archive is not None and archive.replay:
+            # Replays serve every archived feed from disk and never touch the real state
+            feeds = feeds or {name: RSS_FEEDS.get(name, f"archive://{name}") for name in archive.keys('rss')}
+            use_cache, incremental, adaptive_polling = False, False, False
+            state = state or FeedStateStore(persist=False)
+            if near_duplicates is None and DEDUP_ENABLED:
+                near_duplicates = NearDuplicateIndex(path=':memory:')
+        elif archive is not None:
+            # 304s and feeds skipped by the schedule would leave holes in the recorded run
+            use_cache, adaptive_polling = False, False
+
         self.feeds = feeds or RSS_FEEDS
-        logger.info(f"RSS collector initialized with {len(self.feeds)} feeds")
+        self.max_workers = max(1, max_workers or RSS_MAX_WORKERS)
+        self.use_cache = RSS_CACHE_ENABLED if use_cache is None else use_cache
+        self.state = state or FeedStateStore()
+        self.incremental = RSS_INCREMENTAL if incremental is None else incremental
+        self.seen_filter = seen_filter or SeenIdFilter()
+        self.parse_workers = RSS_PARSE_WORKERS if parse_workers is None else parse_workers
+        self.adaptive_polling = RSS_ADAPTIVE_POLLING if adaptive_polling is None else adaptive_polling
+        if near_duplicates is None and DEDUP_ENABLED:
+            near_duplicates = NearDuplicateIndex()
+        self.near_duplicates = near_duplicates
+        self.scheduler = scheduler or SummaryScheduler(summarization_service)
+        self.use_feed_summaries = FEED_SUMMARY_ENABLED if use_feed_summaries is None else use_feed_summaries
+        self._parse_pool = None
+        self._parse_pool_lock = threading.Lock()
+        logger.info(f"RSS collector initialized with {len(self.feeds)} feeds ({self.max_workers} workers)")
+
+    def due_feeds(self):
+        """
+        Get the feeds that should be polled in this run.
+
+        Returns:
+            dict: Feed names and URLs, in configuration order.
+        """
+        if not self.adaptive_polling:
+            return dict(self.feeds)
+
+        due = {name: url for name, url in self.feeds.items() if self.state.is_due(name)}
+        if len(due) < len(self.feeds):
+            logger.info(f"{len(due)} of {len(self.feeds)} feeds are due for polling")
+        return due
+
+    def fetch_feed(self, feed_url, feed_name):
+        """
+        Download a feed, using the cached validators for a conditional GET.
+
+        Args:
+            feed_url (str): URL of the RSS feed.
+            feed_name (str): Name of the feed for identification.
+
+        Returns:
+            tuple: (body, cache_info). body is None when the feed is unchanged
+                since the last run. cache_info holds the validators to store
+                once the body has been processed successfully.
+        """
+        if self.archive is not None and self.archive.replay:
+            body = self.archive.get('rss', feed_name)
+            if body is None:
+                logger.warning(f"Feed {feed_name} is not in archived run {self.archive.run_id}")
+                return None, None
+            return body, {'body_hash': hashlib.sha256(body).hexdigest()}
+
+        cached = self.state.get(feed_name) if self.use_cache else {}
+
+        headers = {'User-Agent': f"feedparser/{feedparser.__version__} +https://github.com/kurtmckee/feedparser/"}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('modified'):
+            headers['If-Modified-Since'] = cached['modified']
+
+        # Wait for this host's politeness slot; other hosts are unaffected
+        rate_limiter.acquire(feed_url)
+        response = requests.get(feed_url, headers=headers, timeout=RSS_REQUEST_TIMEOUT)
+
+        if response.status_code == 304:
+            logger.info(f"Feed not modified since last run: {feed_name}")
+            return None, None
+
+        response.raise_for_status()
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+
+        if self.archive is not None:
+            self.archive.put('rss', feed_name, body)
+
+        cache_info = {
+            'etag': response.headers.get('ETag'),
+            'modified': response.headers.get('Last-Modified'),
+            'body_hash': body_hash
+        }
+
+        if self.use_cache and cached.get('body_hash') == body_hash:
+            logger.info(f"Feed body unchanged since last run: {feed_name}")
+            # Keep any refreshed validators even though the body is the same
+            self.state.update(feed_name, **cache_info)
+            return None, None
+
+        return body, cache_info
+
+    def _parse_body(self, body, feed_name, cutoff_date):
+        """
+        Parse a raw feed body, using the process pool when one is configured.
+
+        Fetching stays on the I/O threads; only the CPU-bound feedparser and
+        dateutil work is handed to worker processes.
+
+        Args:
+            body (bytes): Raw feed document.
+            feed_name (str): Name of the feed for identification.
+            cutoff_date (datetime): Entries published before this are dropped.
+
+        Returns:
+            tuple: (records, total) as returned by parse_feed_body.
+        """
+        if self.parse_workers <= 0:
+            return parse_feed_body(body, feed_name, cutoff_date)
+
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=parse_pool_context()
+                )
+                logger.info(f"Started feed parse pool with {self.parse_workers} processes")
+            pool = self._parse_pool
+
+        return pool.submit(parse_feed_body, body, feed_name, cutoff_date).result()
+
+    def close(self):
+        """
+        Shut down the parse process pool, if one was started.
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
 
     def parse_feed(self, feed_url, feed_name, days_ago=7):
         """
@@ -41,78 +239,205 @@ class RSSCollector:
         Returns:
             list: List of parsed entries.
         """
+        entries = self.extract_entries(feed_url, feed_name, days_ago)
+        pending = [entry_data for entry_data in entries if not self._reuse_canonical_summary(entry_data)]
+        for i, summary in summarization_service.iter_summaries(pending):
+            pending[i]['summary'] = summary
+            self._remember_summary(pending[i])
+        return entries
+
+    def summarize_entry(self, entry_data):
+        """
+        Generate and attach a summary to a parsed entry.
+
+        Entries that kept their feed's summary are left as they are, near
+        duplicates reuse their canonical entry's summary, and once the
+        scheduler's time budget has run out entries are deferred.
+
+        Args:
+            entry_data (dict): Entry produced by extract_entries.
+
+        Returns:
+            dict: The same entry with its 'summary' field set.
+        """
+        if entry_data.get('summary_source') == 'feed' or self._reuse_canonical_summary(entry_data):
+            return entry_data
+
+        if self.scheduler.expired():
+            self.scheduler.defer(entry_data)
+            return entry_data
+
+        try:
+            entry_data['summary'] = summarization_service.generate_summary(
+                entry_data['content'], entry_data['title'], retry_key=(entry_data['source'], entry_data['id']),
+                priority=entry_data.get('priority'))
+            self._remember_summary(entry_data)
+        except Exception as e:
+            logger.warning(f"Failed to generate summary for entry {entry_data['title']}: {str(e)}")
+        return entry_data
+
+    def summarize_entries(self, entries):
+        """
+        Summarize entries from all feeds in priority order within the time budget.
+
+        Entries with an adequate feed summary keep it, near duplicates reuse
+        their canonical entry's summary, and entries left when the budget
+        runs out are deferred to the backfill queue.
+
+        Args:
+            entries (list): Entries produced by extract_entries.
+
+        Returns:
+            list: The same entries with their 'summary' fields set.
+        """
+        from_feed = [entry_data for entry_data in entries if entry_data.get('summary_source') == 'feed']
+        pending = [
+            entry_data for entry_data in entries
+            if entry_data.get('summary_source') != 'feed' and not self._reuse_canonical_summary(entry_data)
+        ]
+        stats = self.scheduler.summarize(pending, on_summary=self._remember_summary)
+        logger.info(f"Summarized {stats['summarized']} entries, deferred {stats['deferred']}, "
+                    f"kept {len(from_feed)} feed summaries, "
+                    f"{len(entries) - len(pending) - len(from_feed)} near duplicates reused a summary")
+        return entries
+
+    def _reuse_canonical_summary(self, entry_data):
+        """
+        Give a near-duplicate entry its canonical entry's summary, if known.
+
+        Duplicates are never sent to the summarization API. If the canonical
+        entry is still being summarized, the summary is filled in from it
+        when the entries are saved.
+
+        Args:
+            entry_data (dict): Entry produced by extract_entries.
+
+        Returns:
+            bool: True if the entry is a near duplicate.
+        """
+        canonical_id = entry_data.get('canonical_source_id')
+        if not canonical_id:
+            return False
+
+        entry_data['summary'] = self.near_duplicates.get_summary(f"rss:{canonical_id}")
+        return True
+
+    def _remember_summary(self, entry_data):
+        """
+        Store a canonical entry's summary in the near-duplicate index for later copies.
+
+        Args:
+            entry_data (dict): Summarized entry.
+        """
+        if self.near_duplicates is not None and entry_data.get('summary'):
+            self.near_duplicates.set_summary(f"rss:{entry_data['id']}", entry_data['summary'])
+
+    def extract_entries(self, feed_url, feed_name, days_ago=7):
+        """
+        Fetch a single RSS feed and extract new entries without summarizing them.
+
+        Args:
+            feed_url (str): URL of the RSS feed.
+            feed_name (str): Name of the feed for identification.
+            days_ago (int): How many days back to include entries.
+
+        Returns:
+            list: List of parsed entries with 'summary' set to None.
+        """
         logger.info(f"Parsing RSS feed: {feed_name} ({feed_url})")
 
         try:
-            # Parse the feed
-            feed = feedparser.parse(feed_url)
+            # Download the feed, skipping it entirely if nothing has changed
+            body, cache_info = self.fetch_feed(feed_url, feed_name)
+            if body is None:
+                self.state.record_poll(feed_name, [])
+                return []
+
+            # Parse the feed (in a worker process when a parse pool is configured)
+            # Replays use the capture time so archived runs never age out
+            now = self.archive.created_at if self.archive is not None and self.archive.replay else datetime.utcnow()
+            cutoff_date = now - timedelta(days=days_ago)
+            records, total = self._parse_body(body, feed_name, cutoff_date)
 
-            if not feed.entries:
+            if not total:
                 logger.warning(f"No entries found in feed: {feed_name}")
+                self.state.stage(feed_name, **cache_info)
+                self.state.record_poll(feed_name, [])
                 return []
 
-            # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=days_ago)
+            # Newest entry ingested by a previous run
+            high_water = self.state.get(feed_name).get('high_water') if self.incremental else None
+            high_water_date = datetime.fromisoformat(high_water['published']) if high_water else None
+            newest = None
+            skipped = 0
 
             entries = []
-            for entry in feed.entries:
-                # Extract publication date
-                if hasattr(entry, 'published'):
-                    try:
-                        pub_date = date_parser.parse(entry.published)
-                        # Ensure timezone awareness consistency
-                        if pub_date.tzinfo is not None:
-                            pub_date = pub_date.replace(tzinfo=None)
-                    except:
-                        # If date parsing fails, use current time
-                        pub_date = datetime.now()
-                elif hasattr(entry, 'updated'):
-                    try:
-                        pub_date = date_parser.parse(entry.updated)
-                        # Ensure timezone awareness consistency
-                        if pub_date.tzinfo is not None:
-                            pub_date = pub_date.replace(tzinfo=None)
-                    except:
-                        pub_date = datetime.now()
-                else:
-                    # No date available, use current time
-                    pub_date = datetime.now()
-
-                # Skip entries older than cutoff date - both are now timezone naive
-                if pub_date < cutoff_date:
-                    continue
+            decisions = {}
+            for record in records:
+                entry_id = record['id']
+                pub_date = record['published']
+                has_date = record['has_date']
 
-                # Extract content
-                content = ""
-                if hasattr(entry, 'content'):
-                    content = entry.content[0].value
-                elif hasattr(entry, 'summary'):
-                    content = entry.summary
-                elif hasattr(entry, 'description'):
-                    content = entry.description
-
-                # Generate summary for the content
-                summary = None
-                try:
-                    summary = summarization_service.generate_summary(content, entry.title)
-                except Exception as e:
-                    logger.warning(f"Failed to generate summary for entry {entry.title}: {str(e)}")
+                # Skip entries already ingested, before paying for a summary
+                if high_water_date and has_date and (
+                        pub_date < high_water_date
+                        or (pub_date == high_water_date and entry_id == high_water['id'])):
+                    skipped += 1
+                    continue
+                if not self.seen_filter.add('rss', entry_id):
+                    skipped += 1
+                    continue
 
                 # Create entry object
                 entry_data = {
-                    'id': entry.get('id', entry.link),
-                    'title': entry.title,
-                    'link': entry.link,
+                    'id': entry_id,
+                    'title': record['title'],
+                    'link': record['link'],
                     'published': pub_date.isoformat(),
-                    'content': content,
-                    'summary': summary,  # Add the generated summary
+                    'content': record['content'],
+                    'summary': None,  # Filled in by summarize_entry
                     'source': 'rss',
                     'feed_name': feed_name,
-                    'author': entry.get('author', feed.feed.get('title', feed_name))
+                    'author': record['author'],
+                    'canonical_source_id': None,
+                    'summary_source': None  # 'feed' when the feed's own summary is kept
                 }
 
+                # Link syndicated copies to the first copy seen; new canonical entries
+                # are only offered to later runs once stored (see commit_state)
+                if self.near_duplicates is not None:
+                    canonical = self.near_duplicates.find_or_add(f"rss:{entry_id}", f"{record['title']}\n{record['content']}")
+                    if canonical:
+                        entry_data['canonical_source_id'] = canonical.split(':', 1)[1]
+
+                # Keep the feed's own summary when it is good enough to skip the API
+                if self.use_feed_summaries and not entry_data['canonical_source_id']:
+                    decision = select_feed_summary(record.get('feed_summary'), record['title'])
+                    decisions[decision['reason']] = decisions.get(decision['reason'], 0) + 1
+                    logger.debug(f"Feed summary for {entry_id}: {decision['reason']} (score {decision['score']})")
+                    if decision['accepted']:
+                        entry_data['summary'] = decision['summary']
+                        entry_data['summary_source'] = 'feed'
+                        self._remember_summary(entry_data)
+
                 entries.append(entry_data)
 
+                # The newest dated new entry becomes the high-water mark once it is stored
+                if has_date and (newest is None or pub_date > newest[0]):
+                    newest = (pub_date, entry_id)
+
+            # Only remember the validators once the entries are stored (see commit_state)
+            self.state.stage(feed_name, **cache_info)
+            if newest and (high_water_date is None or newest[0] > high_water_date):
+                self.state.stage(feed_name, high_water={'published': newest[0].isoformat(), 'id': newest[1]})
+            self.state.record_poll(feed_name, [record['published'] for record in records if record['has_date']])
+
+            if decisions:
+                self.state.record_summary_decisions(feed_name, decisions)
+                logger.info(f"Feed summaries for {feed_name}: {json.dumps(decisions, sort_keys=True)}")
+
+            if skipped:
+                logger.info(f"Skipped {skipped} already ingested entries from feed: {feed_name}")
             logger.info(f"Parsed {len(entries)} entries from feed: {feed_name}")
             return entries
 
@@ -120,28 +445,114 @@ class RSSCollector:
             logger.error(f"Error parsing feed {feed_name}: {str(e)}")
             return []
 
+    def commit_state(self, entries, stored_ids=None):
+        """
+        Keep the feed state of a run once its entries are stored, and save it.
+
+        Only runs that store their entries call this; otherwise nothing is
+        saved and the next run fetches and offers the same entries again. A
+        feed keeps its new validators, body hash and high-water mark only if
+        all of its entries were stored; a feed with unstored entries drops
+        them and is made due for polling again. Stored canonical entries are
+        confirmed in the near-duplicate index so later copies can link to them.
+
+        Args:
+            entries (list): Entries produced by extract_entries in this run.
+            stored_ids (set): Source IDs written to the database. None means
+                every entry was stored.
+        """
+        failed_feeds = set()
+        if stored_ids is not None:
+            failed_feeds = {entry_data['feed_name'] for entry_data in entries if str(entry_data['id']) not in stored_ids}
+
+        for feed_name in set(self.state.staged_feeds()) | failed_feeds:
+            if feed_name in failed_feeds:
+                logger.warning(f"Not all entries from feed {feed_name} were stored; it will be fetched again")
+                self.state.discard(feed_name)
+                self.state.update(feed_name, next_due=None)
+            else:
+                self.state.commit(feed_name)
+
+        if self.near_duplicates is not None:
+            self.near_duplicates.confirm(
+                f"rss:{entry_data['id']}" for entry_data in entries
+                if not entry_data.get('canonical_source_id') and (stored_ids is None or str(entry_data['id']) in stored_ids)
+            )
+
+        self.state.save()
+
     def collect_all_feeds(self, days_ago=7):
         """
         Collect entries from all configured RSS feeds.
 
+        The feed state is not saved here; call commit_state once the entries
+        are stored.
+
         Args:
             days_ago (int): How many days back to include entries.
 
         Returns:
             list: List of all collected entries.
         """
-        all_entries = []
+        # The time budget covers fetching as well as summarization
+        self.scheduler.start()
 
-        for feed_name, feed_url in self.feeds.items():
-            entries = self.parse_feed(feed_url, feed_name, days_ago)
-            all_entries.extend(entries)
+        feeds = self.due_feeds()
+        if self.max_workers > 1 and len(feeds) > 1:
+            all_entries = self._collect_concurrently(feeds, days_ago)
+        else:
+            all_entries = []
 
-            # Add a small delay between requests to be nice to servers
-            time.sleep(1)
+            try:
+                for feed_name, feed_url in feeds.items():
+                    entries = self.extract_entries(feed_url, feed_name, days_ago)
+                    all_entries.extend(entries)
+            finally:
+                self.close()
+
+        # Summarize across feeds so the most important entries go first
+        self.summarize_entries(all_entries)
 
         logger.info(f"Collected {len(all_entries)} entries from all RSS feeds")
         return all_entries
 
+    def _collect_concurrently(self, feeds, days_ago=7):
+        """
+        Collect entries from the given feeds using a thread pool, without summarizing them.
+
+        Each feed is handled by extract_entries, which already isolates its own
+        errors, so one failing feed cannot affect the others. Results are
+        combined in the order of feeds regardless of completion order.
+
+        Args:
+            feeds (dict): Feed names and URLs to collect.
+            days_ago (int): How many days back to include entries.
+
+        Returns:
+            list: List of all collected entries.
+        """
+        workers = min(self.max_workers, len(feeds))
+        logger.info(f"Collecting {len(feeds)} RSS feeds with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rss') as executor:
+            futures = [
+                executor.submit(self.extract_entries, feed_url, feed_name, days_ago)
+                for feed_name, feed_url in feeds.items()
+            ]
+
+            all_entries = []
+            try:
+                for (feed_name, _), future in zip(feeds.items(), futures):
+                    try:
+                        all_entries.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"Error collecting feed {feed_name}: {str(e)}")
+            finally:
+                self.close()
+
+        logger.info(f"Extracted {len(all_entries)} entries from {len(feeds)} RSS feeds")
+        return all_entries
+
 
 # For testing
 if __name__ == "__main__":
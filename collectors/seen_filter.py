@@ -0,0 +1,91 @@
+"""
+Compact filter of already ingested content keys.
+"""
+import hashlib
+import threading
+
+
+class SeenIdFilter:
+    """
+    In-memory set of (source, source_id) keys that are already stored.
+
+    Keys are kept as 64-bit hashes rather than full strings, which keeps the
+    filter small enough to load for the whole collection window on every
+    run. A hash collision can only cause a new item to be skipped, with a
+    probability that is negligible at the volumes we collect.
+    """
+
+    def __init__(self, keys=None):
+        """
+        Initialize the filter.
+
+        Args:
+            keys (iterable): Optional (source, source_id) tuples to preload.
+        """
+        self._hashes = set()
+        self._lock = threading.Lock()
+        for source, source_id in keys or []:
+            self._hashes.add(self._hash(source, source_id))
+
+    @classmethod
+    def from_source_ids(cls, source, source_ids):
+        """
+        Build a filter for a single source.
+
+        Args:
+            source (str): Source name (twitter, linkedin, rss).
+            source_ids (iterable): Source IDs already stored for that source.
+
+        Returns:
+            SeenIdFilter: The populated filter.
+        """
+        return cls((source, source_id) for source_id in source_ids)
+
+    @staticmethod
+    def _hash(source, source_id):
+        """
+        Hash a key to a 64-bit integer.
+
+        Args:
+            source (str): Source name.
+            source_id (str): Original ID from the source.
+
+        Returns:
+            int: 64-bit hash of the key.
+        """
+        digest = hashlib.blake2b(f"{source}\x00{source_id}".encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big')
+
+    def contains(self, source, source_id):
+        """
+        Check whether a key has been seen.
+
+        Args:
+            source (str): Source name.
+            source_id (str): Original ID from the source.
+
+        Returns:
+            bool: True if the key is known.
+        """
+        return self._hash(source, str(source_id)) in self._hashes
+
+    def add(self, source, source_id):
+        """
+        Record a key as seen.
+
+        Args:
+            source (str): Source name.
+            source_id (str): Original ID from the source.
+
+        Returns:
+            bool: True if the key was new, False if it had already been seen.
+        """
+        key_hash = self._hash(source, str(source_id))
+        with self._lock:
+            if key_hash in self._hashes:
+                return False
+            self._hashes.add(key_hash)
+            return True
+
+    def __len__(self):
+        return len(self._hashes)
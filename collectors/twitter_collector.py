@@ -4,27 +4,43 @@ Twitter data collection module for the AI Dashboard.
 import tweepy
 import json
 from datetime import datetime, timedelta
-import time
+from dateutil import parser as date_parser
 
 from src.utils.config import (
     TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_ACCESS_TOKEN, 
     TWITTER_ACCESS_SECRET, TWITTER_BEARER_TOKEN,
     TWITTER_AI_HASHTAGS, TWITTER_KEY_ACCOUNTS
 )
+from src.utils.date_utils import to_utc
 from src.utils.logger import setup_logger
+from src.utils.rate_limiter import rate_limiter
 
 # Set up logger
 logger = setup_logger('twitter_collector')
 
+# Twitter API v2 host, used as the rate limiter key together with the token
+TWITTER_API_HOST = 'api.twitter.com'
+
 class TwitterCollector:
     """
     Collects AI-related tweets from Twitter using the Twitter API v2.
     """
     
-    def __init__(self):
+    def __init__(self, archive=None):
         """
         Initialize the Twitter collector with API credentials.
+        
+        Args:
+            archive (PayloadArchive): Archive that raw responses are recorded
+                to, or, in replay mode, read from instead of the API.
         """
+        self.archive = archive
+        self.client = None
+        
+        if archive is not None and archive.replay:
+            logger.info(f"Twitter collector replaying archived run {archive.run_id}")
+            return
+        
         try:
             # Initialize the Twitter API client
             self.client = tweepy.Client(
@@ -40,6 +56,104 @@ class TwitterCollector:
             logger.error(f"Error initializing Twitter API client: {str(e)}")
             raise
     
+    @property
+    def replaying(self):
+        """bool: True when payloads are served from an archived run."""
+        return self.archive is not None and self.archive.replay
+    
+    def _record(self, kind, key, payload):
+        """
+        Record a raw API payload in the archive, if one is configured.
+        
+        Args:
+            kind (str): Payload type.
+            key (str): Hashtag or account the payload belongs to.
+            payload (dict): Raw JSON payload.
+        """
+        if self.archive is not None and not self.replaying:
+            self.archive.put(kind, key, json.dumps(payload))
+    
+    @staticmethod
+    def _format_tweet(tweet, users=None, **extra):
+        """
+        Map a raw API v2 tweet object to our tweet format.
+        
+        Args:
+            tweet (dict): Raw tweet JSON.
+            users (dict): Raw user JSON keyed by user ID.
+            **extra: Additional fields to set (hashtag, account, url, author).
+            
+        Returns:
+            dict: Formatted tweet.
+        """
+        metrics = tweet.get('public_metrics', {})
+        tweet_data = {
+            'id': int(tweet['id']),
+            'text': tweet.get('text'),
+            # API v2 timestamps end in 'Z', which fromisoformat rejects before Python 3.11
+            'created_at': to_utc(date_parser.isoparse(tweet['created_at'])).isoformat(),
+            'likes': metrics.get('like_count'),
+            'retweets': metrics.get('retweet_count'),
+            'replies': metrics.get('reply_count'),
+            'source': 'twitter',
+            'url': f"https://twitter.com/user/status/{tweet['id']}"
+        }
+        tweet_data.update(extra)
+        
+        # Add user information if available
+        author_id = str(tweet.get('author_id'))
+        if users and author_id in users:
+            user = users[author_id]
+            tweet_data['author'] = {
+                'id': int(user['id']),
+                'username': user.get('username'),
+                'name': user.get('name'),
+                'profile_image_url': user.get('profile_image_url')
+            }
+        
+        return tweet_data
+    
+    def _process_search_payload(self, payload, hashtag):
+        """
+        Format the tweets in a raw search payload.
+        
+        Args:
+            payload (dict): Raw payload with 'data' and 'includes' keys.
+            hashtag (str): Hashtag that was searched.
+            
+        Returns:
+            list: Formatted tweets.
+        """
+        # Create a dictionary to map user IDs to user data
+        users = {str(user['id']): user for user in payload.get('includes', {}).get('users', [])}
+        return [self._format_tweet(tweet, users, hashtag=hashtag) for tweet in payload.get('data') or []]
+    
+    def _process_account_payload(self, payload, account):
+        """
+        Format the tweets in a raw account timeline payload.
+        
+        Args:
+            payload (dict): Raw payload with 'user' and 'data' keys.
+            account (str): Account username.
+            
+        Returns:
+            list: Formatted tweets.
+        """
+        user = payload['user']
+        return [
+            self._format_tweet(
+                tweet,
+                account=account,
+                url=f"https://twitter.com/{account}/status/{tweet['id']}",
+                author={
+                    'id': int(user['id']),
+                    'username': account,
+                    'name': user.get('name')
+                }
+            )
+            for tweet in payload.get('data') or []
+        ]
+    
     def collect_tweets_by_hashtags(self, hashtags=None, max_results=10, days_ago=1):
         """
         Collect tweets containing specific AI-related hashtags.
@@ -53,11 +167,8 @@ class TwitterCollector:
             list: List of collected tweets.
         """
         if hashtags is None:
-            hashtags = TWITTER_AI_HASHTAGS
+            hashtags = self.archive.keys('twitter_hashtag') if self.replaying else TWITTER_AI_HASHTAGS
             
-        # Create query string from hashtags
-        query = " OR ".join(hashtags)
-        
         # Set time range
         end_time = datetime.utcnow() - timedelta(minutes=1)
         start_time = end_time - timedelta(days=days_ago)
@@ -68,47 +179,27 @@ class TwitterCollector:
             # Search for tweets
             tweets = []
             for hashtag in hashtags:
-                response = self.client.search_recent_tweets(
-                    query=hashtag,
-                    max_results=max_results,
-                    tweet_fields=['created_at', 'public_metrics', 'author_id', 'text'],
-                    user_fields=['username', 'name', 'profile_image_url'],
-                    expansions=['author_id'],
-                    start_time=start_time,
-                    end_time=end_time
-                )
-                
-                if response.data:
-                    # Create a dictionary to map user IDs to user data
-                    users = {user.id: user for user in response.includes['users']} if 'users' in response.includes else {}
-                    
-                    for tweet in response.data:
-                        tweet_data = {
-                            'id': tweet.id,
-                            'text': tweet.text,
-                            'created_at': tweet.created_at.isoformat(),
-                            'likes': tweet.public_metrics['like_count'],
-                            'retweets': tweet.public_metrics['retweet_count'],
-                            'replies': tweet.public_metrics['reply_count'],
-                            'source': 'twitter',
-                            'hashtag': hashtag,
-                            'url': f"https://twitter.com/user/status/{tweet.id}"
-                        }
-                        
-                        # Add user information if available
-                        if tweet.author_id in users:
-                            user = users[tweet.author_id]
-                            tweet_data['author'] = {
-                                'id': user.id,
-                                'username': user.username,
-                                'name': user.name,
-                                'profile_image_url': user.profile_image_url
-                            }
-                        
-                        tweets.append(tweet_data)
+                if self.replaying:
+                    payload = self.archive.get_json('twitter_hashtag', hashtag) or {}
+                else:
+                    # Respect rate limits
+                    rate_limiter.acquire(TWITTER_API_HOST, api_key=TWITTER_BEARER_TOKEN)
+                    response = self.client.search_recent_tweets(
+                        query=hashtag,
+                        max_results=max_results,
+                        tweet_fields=['created_at', 'public_metrics', 'author_id', 'text'],
+                        user_fields=['username', 'name', 'profile_image_url'],
+                        expansions=['author_id'],
+                        start_time=start_time,
+                        end_time=end_time
+                    )
+                    payload = {
+                        'data': [tweet.data for tweet in response.data or []],
+                        'includes': {'users': [user.data for user in response.includes.get('users', [])]}
+                    }
+                    self._record('twitter_hashtag', hashtag, payload)
                 
-                # Respect rate limits
-                time.sleep(1)
+                tweets.extend(self._process_search_payload(payload, hashtag))
             
             logger.info(f"Collected {len(tweets)} tweets with hashtags")
             return tweets
@@ -130,7 +221,7 @@ class TwitterCollector:
             list: List of collected tweets.
         """
         if accounts is None:
-            accounts = TWITTER_KEY_ACCOUNTS
+            accounts = self.archive.keys('twitter_account') if self.replaying else TWITTER_KEY_ACCOUNTS
             
         tweets = []
         
@@ -138,45 +229,37 @@ class TwitterCollector:
             logger.info(f"Collecting tweets from accounts: {accounts}")
             
             for account in accounts:
-                # Get user ID from username
-                user_response = self.client.get_user(username=account)
-                if not user_response.data:
-                    logger.warning(f"User {account} not found")
-                    continue
+                if self.replaying:
+                    payload = self.archive.get_json('twitter_account', account)
+                    if not payload:
+                        logger.warning(f"Account {account} is not in archived run {self.archive.run_id}")
+                        continue
+                else:
+                    # Get user ID from username
+                    rate_limiter.acquire(TWITTER_API_HOST, api_key=TWITTER_BEARER_TOKEN)
+                    user_response = self.client.get_user(username=account)
+                    if not user_response.data:
+                        logger.warning(f"User {account} not found")
+                        continue
+                        
+                    user_id = user_response.data.id
                     
-                user_id = user_response.data.id
-                
-                # Get tweets from user
-                response = self.client.get_users_tweets(
-                    id=user_id,
-                    max_results=max_results,
-                    tweet_fields=['created_at', 'public_metrics', 'text'],
-                    exclude=['retweets', 'replies'],
-                    start_time=datetime.utcnow() - timedelta(days=days_ago)
-                )
-                
-                if response.data:
-                    for tweet in response.data:
-                        tweet_data = {
-                            'id': tweet.id,
-                            'text': tweet.text,
-                            'created_at': tweet.created_at.isoformat(),
-                            'likes': tweet.public_metrics['like_count'],
-                            'retweets': tweet.public_metrics['retweet_count'],
-                            'replies': tweet.public_metrics['reply_count'],
-                            'source': 'twitter',
-                            'account': account,
-                            'url': f"https://twitter.com/{account}/status/{tweet.id}",
-                            'author': {
-                                'id': user_id,
-                                'username': account,
-                                'name': user_response.data.name
-                            }
-                        }
-                        tweets.append(tweet_data)
+                    # Get tweets from user
+                    rate_limiter.acquire(TWITTER_API_HOST, api_key=TWITTER_BEARER_TOKEN)
+                    response = self.client.get_users_tweets(
+                        id=user_id,
+                        max_results=max_results,
+                        tweet_fields=['created_at', 'public_metrics', 'text'],
+                        exclude=['retweets', 'replies'],
+                        start_time=datetime.utcnow() - timedelta(days=days_ago)
+                    )
+                    payload = {
+                        'user': user_response.data.data,
+                        'data': [tweet.data for tweet in response.data or []]
+                    }
+                    self._record('twitter_account', account, payload)
                 
-                # Respect rate limits
-                time.sleep(1)
+                tweets.extend(self._process_account_payload(payload, account))
             
             logger.info(f"Collected {len(tweets)} tweets from accounts")
             return tweets
@@ -8,10 +8,8 @@ Temporarily disabled: Twitter, LinkedIn (to be re-enabled later)
 import argparse
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from collectors.base_collector import DataCollector
-from src.models.storage import initialize_database, ContentStorage
 from src.utils.logger import setup_logger
 
 # Set up logger
@@ -33,13 +31,36 @@ def parse_args():
     parser.add_argument('--save-json', action='store_true', help='Save collected data to JSON file')
     parser.add_argument('--save-db', action='store_true', help='Save collected data to database')
     parser.add_argument('--output-file', type=str, help='Output JSON file path')
+    parser.add_argument('--stream', action='store_true', help='Stream entries through fetch, summarize and store stages straight into the database')
+    parser.add_argument('--archive', action='store_true', help='Record raw source payloads to the payload archive; every feed is fetched unconditionally')
+    parser.add_argument('--replay', type=str, metavar='RUN_ID', help='Collect from an archived run instead of the network, without API summarization (implies --collect; not with --save-db or --stream)')
+    parser.add_argument('--full-refresh', action='store_true', help='Ignore feed caches, high-water marks, the polling schedule and the stored-entry filter, and re-process every entry in the date window')
+    parser.add_argument('--retry-summaries', action='store_true', help='Retry summaries that failed in earlier runs and update the stored items')
+    parser.add_argument('--rebuild-daily-stats', action='store_true', help='Recompute the per-day item counts used by the date picker')
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    # Replayed runs are for offline testing and must never reach the production database
+    if args.replay and (args.save_db or args.stream):
+        parser.error('--replay cannot be combined with --save-db or --stream')
+    
+    return args
 
 def main():
     """
     Main function.
     """
+    # Imported here rather than at module level: feed parse workers re-import
+    # this script, and these modules load the configuration, create the
+    # database engine and start the summarization service
+    from collectors.base_collector import DataCollector
+    from collectors.seen_filter import SeenIdFilter
+    from src.models.storage import initialize_database, ContentStorage
+    from src.services.stream_pipeline import StreamingPipeline
+    from src.services.summarization_service import summarization_service
+    from src.services.summary_retry import retry_failed_summaries
+    from src.utils.payload_archive import PayloadArchive
+
     args = parse_args()
     
     # Initialize database if requested
@@ -48,16 +69,58 @@ def main():
         initialize_database()
         logger.info("Database initialization completed")
     
+    # Repair the daily rollup if requested
+    if args.rebuild_daily_stats:
+        logger.info("Rebuilding daily content stats...")
+        ContentStorage.rebuild_daily_stats()
+    
+    # Retry failed summaries if requested
+    if args.retry_summaries:
+        logger.info(f"Retrying {len(summarization_service.retry_queue)} queued summaries...")
+        summary = retry_failed_summaries(summarization_service)
+        logger.info(f"Summary retry summary: {json.dumps(summary)}")
+    
     # Collect data if requested
-    if args.collect:
+    if args.collect or args.replay:
         logger.info(f"Collecting data from RSS sources only (max_results={args.max_results}, days_ago={args.days_ago})...")
+
+        # Record raw payloads, or serve them from a previous run
+        archive = None
+        if args.replay:
+            archive = PayloadArchive.load(args.replay)
+            # Summaries come from the local extractive summarizer, if enabled, instead of the paid API
+            summarization_service.enabled = False
+            logger.info(f"Replaying archived run {args.replay} (no network access, API summarization disabled)")
+        elif args.archive:
+            archive = PayloadArchive()
+            logger.info(f"Archiving raw payloads as run {archive.run_id}")
         
+        # Drop entries that are already stored before they are summarized
+        seen_filter = None
+        if (args.save_db or args.stream) and not args.full_refresh:
+            since = datetime.utcnow() - timedelta(days=args.days_ago + 1)
+            seen_filter = SeenIdFilter.from_source_ids('rss', ContentStorage.get_known_source_ids('rss', since=since))
+
         # Create data collector (RSS only)
-        collector = DataCollector()
+        collector = DataCollector(seen_filter=seen_filter, full_refresh=args.full_refresh, archive=archive)
+
+        # Stream entries into the database as soon as they are summarized
+        if args.stream:
+            if args.save_json:
+                logger.warning("--save-json is ignored in --stream mode; entries are written to the database only")
+            summary = StreamingPipeline(collector.rss_collector).run(days_ago=args.days_ago)
+            if archive is not None:
+                archive.save()
+            logger.info(f"Database save summary: {json.dumps(summary)}")
+            logger.info("Data collection completed (RSS only, streaming)")
+            return
         
         # Collect data (RSS only)
         data = collector.collect_all_data(max_results=args.max_results, days_ago=args.days_ago)
         
+        if archive is not None:
+            archive.save()
+
         # Log collection summary
         logger.info(f"Collection summary - RSS: {len(data['rss'])} items, Total: {data['metadata']['total_items']} items")
         
@@ -78,8 +141,12 @@ def main():
         # Save to database if requested
         if args.save_db:
             logger.info("Saving data to database...")
-            summary = ContentStorage.save_all_data(data)
+            stored_ids = set()
+            summary = ContentStorage.save_all_data(data, rss_stored_ids=stored_ids)
             logger.info(f"Database save summary: {json.dumps(summary)}")
+
+            # Feed caches and high-water marks only move once the entries are stored
+            collector.rss_collector.commit_state(data['rss'], stored_ids)
         
         logger.info("Data collection completed (RSS only)")
 
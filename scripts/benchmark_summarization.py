@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for SummarizationService against a mock summarization API.
+
+Runs the batch API (iter_summaries) over synthetic articles once per
+concurrency setting and reports throughput and request latency percentiles.
+By default an in-process mock server (scripts/mock_llm_server.py) is
+started, so no API key is needed and nothing is billed.
+
+Usage:
+    python scripts/benchmark_summarization.py --articles 200 --concurrency 1,4,8,16
+    python scripts/benchmark_summarization.py --format generic --error-rate 0.05 --server-rpm 300
+    python scripts/benchmark_summarization.py --url http://localhost:8800/v1/chat/completions
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to import from src
+sys.path.append('.')
+
+from scripts.mock_llm_server import MockLLMServer
+from src.services.summarization_service import SummarizationService
+from src.services.summary_retry import SummaryRetryQueue
+from src.utils.rate_limiter import TokenBucket
+
+# Loggers that log every request; quieted unless --verbose
+NOISY_LOGGERS = ('summarization_service', 'summary_cache', 'summary_retry', 'extractive_summarizer', 'model_router')
+
+WORDS = (
+    'model training data compute benchmark release research open weights agent reasoning '
+    'inference chip cluster policy safety evaluation startup funding robotics vision language'
+).split()
+
+
+def build_articles(count, words=300):
+    """
+    Build synthetic articles with distinct content.
+
+    Args:
+        count (int): Number of articles.
+        words (int): Words per article.
+
+    Returns:
+        list: Article dictionaries with title and content keys.
+    """
+    articles = []
+    for i in range(count):
+        sentences = []
+        for s in range(words // 12):
+            picked = [WORDS[(i * 7 + s * 3 + k * 5) % len(WORDS)] for k in range(10)]
+            sentences.append(f"Article {i} sentence {s} covers {' '.join(picked)}.")
+        articles.append({'title': f"Benchmark article {i}", 'content': '<p>' + ' '.join(sentences) + '</p>'})
+    return articles
+
+
+def make_service(url, concurrency, args, retry_path):
+    """
+    Create a summarization service pointed at the benchmark endpoint.
+
+    The summary cache and the extractive fallback are disabled so every
+    article costs a request and failures are visible.
+
+    Args:
+        url (str): Summarization API URL.
+        concurrency (int): Parallel requests.
+        args (argparse.Namespace): Benchmark arguments.
+        retry_path (str): Path of a scratch retry queue file.
+
+    Returns:
+        SummarizationService: The configured service.
+    """
+    service = SummarizationService(cache=None, retry_queue=SummaryRetryQueue(retry_path))
+    service.cache = None
+    service.enabled = True
+    service.api_key = 'mock'
+    service.api_url = url
+    service.fallback_enabled = False
+    service.concurrency = concurrency
+    service.pack_size = args.pack_size
+    service.max_retries = args.max_retries
+    service.request_bucket = TokenBucket(args.rpm / 60, capacity=max(1, args.rpm / 6)) if args.rpm > 0 else None
+    service.token_bucket = TokenBucket(args.tpm / 60, capacity=max(1, args.tpm / 6)) if args.tpm > 0 else None
+    return service
+
+
+def run_once(url, concurrency, articles, args):
+    """
+    Summarize all articles once and measure the run.
+
+    Args:
+        url (str): Summarization API URL.
+        concurrency (int): Parallel requests.
+        articles (list): Articles to summarize.
+        args (argparse.Namespace): Benchmark arguments.
+
+    Returns:
+        dict: Throughput, success counts and request latency percentiles.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(url, concurrency, args, os.path.join(tmp, 'retry.json'))
+
+        started = time.monotonic()
+        summarized = sum(1 for _, summary in service.iter_summaries(articles) if summary)
+        elapsed = time.monotonic() - started
+
+        service.close()
+
+    routes = service.route_stats()
+    requests = sum(route['requests'] for route in routes.values())
+    route = routes.get('default', {})
+    return {
+        'concurrency': concurrency,
+        'articles': len(articles),
+        'summarized': summarized,
+        'requests': requests,
+        'seconds': round(elapsed, 2),
+        'articles_per_second': round(len(articles) / elapsed, 2) if elapsed else None,
+        'p50_latency': route.get('p50_latency'),
+        'p95_latency': route.get('p95_latency'),
+        'p99_latency': route.get('p99_latency'),
+        'breaker': service.breaker.state
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark SummarizationService against a mock summarization API')
+    parser.add_argument('--articles', type=int, default=200, help='Articles per run')
+    parser.add_argument('--concurrency', type=str, default='1,4,8,16', help='Comma-separated concurrency settings')
+    parser.add_argument('--format', choices=['chat', 'generic'], default='chat', help='API format of the mock server')
+    parser.add_argument('--url', type=str, help='Use a running server at this URL instead of an in-process mock')
+    parser.add_argument('--pack-size', type=int, default=1, help='Articles per chat-completions request')
+    parser.add_argument('--rpm', type=int, default=0, help='Client request limit per minute; 0 = unlimited')
+    parser.add_argument('--tpm', type=int, default=0, help='Client token limit per minute; 0 = unlimited')
+    parser.add_argument('--max-retries', type=int, default=3, help='Retries per request')
+    parser.add_argument('--latency', type=float, default=0.3, help='Mock server mean response time in seconds')
+    parser.add_argument('--jitter', type=float, default=0.5, help='Mock server relative latency spread')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Mock server fraction of 500 responses')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Mock server fraction of 429 responses')
+    parser.add_argument('--server-rpm', type=int, default=0, help='Mock server requests per minute before 429; 0 = unlimited')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--verbose', action='store_true', help='Keep per-request logging')
+    return parser.parse_args(argv)
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    args = parse_args()
+    if not args.verbose:
+        for name in NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+    server = None
+    url = args.url
+    if url is None:
+        server = MockLLMServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                               throttle_rate=args.throttle_rate, rpm=args.server_rpm, seed=42).start()
+        url = server.chat_url if args.format == 'chat' else server.generic_url
+
+    articles = build_articles(args.articles)
+    results = []
+    try:
+        for concurrency in [int(value) for value in args.concurrency.split(',') if value.strip()]:
+            results.append(run_once(url, concurrency, articles, args))
+            if not args.json:
+                result = results[-1]
+                print(f"concurrency={result['concurrency']:>3}  {result['articles_per_second']:>7} articles/s  "
+                      f"{result['summarized']}/{result['articles']} summarized in {result['seconds']}s "
+                      f"({result['requests']} requests)  latency p50={result['p50_latency']}s "
+                      f"p95={result['p95_latency']}s p99={result['p99_latency']}s  breaker={result['breaker']}")
+    finally:
+        if server is not None:
+            if not args.json:
+                print(f"Mock server: {json.dumps(server.stats)}")
+            server.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Check that the dashboard read paths use their indexes.
+
+Gets the estimated plan of each read query (SET SHOWPLAN_XML on SQL Server,
+EXPLAIN QUERY PLAN on SQLite) and checks that it reads the expected index
+without a sort or a full scan of content. The date query must read only the
+content_daily_stats rollup. Exits with status 1 if any check fails.
+
+Usage:
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --verbose
+"""
+import argparse
+import re
+import sys
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+# Add parent directory to path to import from src
+sys.path.append('.')
+
+from src.models.database import engine, SessionLocal
+from src.models.storage import ContentStorage, encode_cursor
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('check_query_plans')
+
+SHOWPLAN_NS = '{http://schemas.microsoft.com/sqlserver/2004/07/showplan}'
+
+# Operators that read the whole content table
+CONTENT_SCAN_OPS = ('Table Scan', 'Clustered Index Scan')
+
+
+def read_path_queries(db, sample_date):
+    """
+    Build the read queries with the index each one should use.
+
+    Args:
+        db (Session): Database session.
+        sample_date (str): Day used for the date-filtered and paged queries (YYYY-MM-DD).
+
+    Returns:
+        list: (name, statement, expected index) tuples. An expected index of
+            None means the query must not read the content table at all.
+    """
+    cursor = encode_cursor(datetime.fromisoformat(sample_date), 'ffffffff-ffff-ffff-ffff-ffffffffffff')
+    return [
+        ('recent content', ContentStorage.recent_content_query(db).limit(50).statement, 'ix_content_published_at'),
+        ('recent content for a day', ContentStorage.recent_content_query(db, date=sample_date).limit(50).statement, 'ix_content_published_at'),
+        ('recent content by source', ContentStorage.recent_content_query(db, source='rss').limit(50).statement, 'ix_content_source_published_at'),
+        ('recent content by source for a day', ContentStorage.recent_content_query(db, source='rss', date=sample_date).limit(50).statement, 'ix_content_source_published_at'),
+        ('recent content after a cursor', ContentStorage.recent_content_query(db, after=cursor).limit(50).statement, 'ix_content_published_at'),
+        ('recent content by source after a cursor', ContentStorage.recent_content_query(db, source='rss', after=cursor).limit(50).statement, 'ix_content_source_published_at'),
+        ('available dates', ContentStorage.available_dates_query(db, 30).statement, None),
+    ]
+
+
+def _compile(statement):
+    """Compile a statement for the engine's dialect with positional parameters."""
+    compiled = statement.compile(dialect=engine.dialect, compile_kwargs={'render_postcompile': True})
+    params = [compiled.params[name] for name in compiled.positiontup or []]
+    return str(compiled), params
+
+
+def mssql_plan(cursor, sql, params):
+    """
+    Get the estimated plan of a query on SQL Server.
+
+    Returns:
+        list: (operator, table, index name) for each plan operator.
+    """
+    cursor.execute('SET SHOWPLAN_XML ON')
+    try:
+        cursor.execute(sql, params)
+        plan_xml = cursor.fetchone()[0]
+    finally:
+        cursor.execute('SET SHOWPLAN_XML OFF')
+
+    operators = []
+    for rel_op in ET.fromstring(plan_xml).iter(f'{SHOWPLAN_NS}RelOp'):
+        obj = rel_op.find(f'./*/{SHOWPLAN_NS}Object')
+        table = obj.get('Table', '').strip('[]') if obj is not None else ''
+        index = obj.get('Index', '').strip('[]') if obj is not None else ''
+        operators.append((rel_op.get('PhysicalOp'), table, index))
+    return operators
+
+
+def sqlite_plan(cursor, sql, params):
+    """
+    Get the query plan of a query on SQLite.
+
+    Returns:
+        list: (operator, table, index name) for each plan step.
+    """
+    cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+    operators = []
+    for row in cursor.fetchall():
+        detail = row[-1]
+        table = re.match(r'(?:SCAN|SEARCH) (\w+)', detail)
+        table = table.group(1) if table else ''
+        index = re.search(r'USING (?:COVERING )?INDEX (\w+)', detail)
+        if 'TEMP B-TREE' in detail:
+            operators.append(('Sort', '', ''))
+        elif index:
+            operators.append(('Index Seek' if detail.startswith('SEARCH') else 'Index Scan', table, index.group(1)))
+        elif table:
+            operators.append(('Table Scan', table, ''))
+    return operators
+
+
+def check_plan(operators, expected_index):
+    """
+    Check a plan against the expected index.
+
+    Args:
+        operators (list): (operator, table, index name) tuples.
+        expected_index (str): Index the query should read, or None if the
+            query must not read the content table.
+
+    Returns:
+        tuple: (passed, access) where access is 'seek', 'ordered scan' or
+            'rollup read' for passing plans and a description of the problem
+            otherwise.
+    """
+    if expected_index is None:
+        if any(table == 'content' for op, table, index in operators):
+            return False, 'reads the content table'
+        if any(op == 'Sort' for op, table, index in operators):
+            return False, 'Sort'
+        return True, 'rollup read'
+
+    bad = [op for op, table, index in operators if op == 'Sort' or (op in CONTENT_SCAN_OPS and table == 'content')]
+    if bad:
+        return False, ', '.join(sorted(set(bad)))
+
+    accesses = [op for op, table, index in operators if index == expected_index]
+    if not accesses:
+        used = sorted({index for op, table, index in operators if index})
+        return False, f"does not use {expected_index} (uses {', '.join(used) or 'no index'})"
+
+    return True, 'seek' if 'Index Seek' in accesses else 'ordered scan'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Check that the dashboard read queries use their indexes')
+    parser.add_argument('--date', type=str, default='2025-01-01', help='Day used for the date-filtered queries')
+    parser.add_argument('--verbose', action='store_true', help='Print the plan operators of each query')
+    return parser.parse_args(argv)
+
+
+def main():
+    """Check the plan of every read query and print the results."""
+    args = parse_args()
+    dialect = engine.dialect.name
+    if dialect not in ('mssql', 'sqlite'):
+        print(f"Query plan checks are not supported for {dialect}")
+        sys.exit(1)
+
+    db = SessionLocal()
+    connection = engine.raw_connection()
+    failures = 0
+    try:
+        cursor = connection.cursor()
+        for name, statement, expected_index in read_path_queries(db, args.date):
+            try:
+                sql, params = _compile(statement)
+                operators = (mssql_plan if dialect == 'mssql' else sqlite_plan)(cursor, sql, params)
+                passed, access = check_plan(operators, expected_index)
+            except Exception as e:
+                logger.error(f"Error getting the plan of {name}: {str(e)}")
+                passed, access, operators = False, 'plan unavailable', []
+
+            failures += 0 if passed else 1
+            print(f"{'✅' if passed else '❌'} {name}: {access}")
+            if args.verbose:
+                for op, table, index in operators:
+                    print(f"      {op} {table} {index}".rstrip())
+    finally:
+        connection.close()
+        db.close()
+
+    if failures:
+        print(f"\n{failures} read path(s) do not use their index")
+        sys.exit(1)
+    print("\nAll read paths use their indexes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the summarization API, for load tests without API costs.
+
+Speaks both formats SummarizationService uses:
+
+    POST /v1/chat/completions   OpenAI chat-completions (packed prompts get a
+                                JSON object with one summary per article ID)
+    POST /summarize             generic format ({"text": ...} -> {"summary": ...})
+    GET  /stats                 request counters as JSON
+
+Latency, error rate and rate limiting are configurable. Rate limiting either
+enforces a requests-per-minute limit (429 with Retry-After once exceeded)
+or throttles a random fraction of requests.
+
+Usage:
+    python scripts/mock_llm_server.py --port 8800 --latency 0.4 --error-rate 0.02 --rpm 600
+"""
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add parent directory to path to import from src
+sys.path.append('.')
+
+from src.utils.text_utils import estimate_tokens
+
+ARTICLE_ID_RE = re.compile(r'^Article ID: (\S+)', re.MULTILINE)
+TITLE_RE = re.compile(r'^Title: (.*)$', re.MULTILINE)
+
+
+class MockLLMServer:
+    """
+    Threaded mock summarization API with configurable latency and failures.
+    """
+
+    def __init__(self, port=0, latency=0.3, jitter=0.5, error_rate=0.0, throttle_rate=0.0, rpm=0, seed=None):
+        """
+        Initialize the server. Call start() to serve in a background thread.
+
+        Args:
+            port (int): Port to listen on; 0 picks a free port.
+            latency (float): Mean response time in seconds.
+            jitter (float): Relative spread of the response time; each
+                response takes latency * uniform(1 - jitter, 1 + jitter).
+            error_rate (float): Fraction of requests answered with a 500.
+            throttle_rate (float): Fraction of requests answered with a 429.
+            rpm (int): Requests per minute accepted before answering 429 with
+                Retry-After; 0 = unlimited.
+            seed (int): Seed for the random latency and failures.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rpm = rpm
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = []
+        self.stats = {'requests': 0, 'ok': 0, 'errors': 0, 'throttled': 0}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.rstrip('/') == '/stats':
+                    with server._lock:
+                        self._send(200, dict(server.stats))
+                else:
+                    self._send(404, {'error': 'not found'})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self._send(400, {'error': 'invalid JSON'})
+                    return
+                status, payload, headers = server.handle(self.path, body)
+                self._send(status, payload, headers)
+
+            def _send(self, status, payload, headers=None):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def chat_url(self):
+        return f"http://127.0.0.1:{self.port}/v1/chat/completions"
+
+    @property
+    def generic_url(self):
+        return f"http://127.0.0.1:{self.port}/summarize"
+
+    def _admit(self):
+        """
+        Apply the rate limits to a request.
+
+        Returns:
+            float: Seconds the client should wait if the request is throttled,
+                otherwise None.
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+            if self.throttle_rate and self._random.random() < self.throttle_rate:
+                self.stats['throttled'] += 1
+                return 1.0
+
+            if self.rpm:
+                now = time.monotonic()
+                self._window = [started for started in self._window if now - started < 60]
+                if len(self._window) >= self.rpm:
+                    self.stats['throttled'] += 1
+                    return 60 - (now - self._window[0])
+                self._window.append(now)
+            return None
+
+    def handle(self, path, body):
+        """
+        Answer a summarization request.
+
+        Args:
+            path (str): Request path.
+            body (dict): Parsed JSON request body.
+
+        Returns:
+            tuple: (status, payload, headers)
+        """
+        retry_after = self._admit()
+        if retry_after is not None:
+            return 429, {'error': {'message': 'Rate limit reached'}}, {'Retry-After': str(max(1, math.ceil(retry_after)))}
+
+        with self._lock:
+            delay = self.latency * self._random.uniform(1 - self.jitter, 1 + self.jitter)
+            failed = self.error_rate and self._random.random() < self.error_rate
+        time.sleep(max(0.0, delay))
+
+        if failed:
+            with self._lock:
+                self.stats['errors'] += 1
+            return 500, {'error': {'message': 'Mock server error'}}, {}
+
+        if path.rstrip('/').endswith('/chat/completions'):
+            prompt = ''.join(message.get('content', '') for message in body.get('messages', []))
+            ids = ARTICLE_ID_RE.findall(prompt)
+            if ids:
+                text = json.dumps({article_id: f"Mock summary of article {article_id}." for article_id in ids})
+            else:
+                title = TITLE_RE.search(prompt)
+                text = f"Mock summary of {title.group(1).strip() if title else 'the article'}."
+            payload = {
+                'model': body.get('model'),
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': estimate_tokens(prompt), 'completion_tokens': estimate_tokens(text)}
+            }
+        elif path.rstrip('/').endswith('/summarize'):
+            text = body.get('text', '')
+            payload = {'summary': f"Mock summary: {' '.join(text.split()[:12])}..."}
+        else:
+            return 404, {'error': 'not found'}, {}
+
+        with self._lock:
+            self.stats['ok'] += 1
+        return 200, payload, {}
+
+    def start(self):
+        """
+        Serve requests in a background thread.
+
+        Returns:
+            MockLLMServer: The server itself.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-llm', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        """Serve requests in the current thread until interrupted."""
+        self._server.serve_forever()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Mock summarization API (chat-completions and generic formats)')
+    parser.add_argument('--port', type=int, default=8800, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.3, help='Mean response time in seconds')
+    parser.add_argument('--jitter', type=float, default=0.5, help='Relative spread of the response time (0-1)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with a 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with a 429')
+    parser.add_argument('--rpm', type=int, default=0, help='Requests per minute before answering 429; 0 = unlimited')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    return parser.parse_args(argv)
+
+
+def main():
+    """Run the mock server until interrupted."""
+    args = parse_args()
+    server = MockLLMServer(args.port, args.latency, args.jitter, args.error_rate, args.throttle_rate, args.rpm, args.seed)
+    print(f"Mock LLM server listening on {server.chat_url} and {server.generic_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 """
 Content models for the AI Dashboard.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Float, ForeignKey, Table, Index, text
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime
 import uuid
 
@@ -21,6 +21,13 @@ class Content(Base):
     Unified content model for all data sources.
     """
     __tablename__ = 'content'
+    __table_args__ = (
+        # One row per source item, enforced by the database so overlapping collection runs cannot both insert it
+        Index('ux_content_source_source_id', 'source', 'source_id', unique=True,
+              mssql_where=text('source_id IS NOT NULL'),
+              postgresql_where=text('source_id IS NOT NULL'),
+              sqlite_where=text('source_id IS NOT NULL')),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=True)
@@ -28,7 +35,9 @@ class Content(Base):
     url = Column(String(512), nullable=False)
     source = Column(String(50), nullable=False)  # twitter, linkedin, rss
     source_id = Column(String(255), nullable=True)  # Original ID from the source
+    canonical_source_id = Column(String(255), nullable=True)  # Set on near duplicates: source_id of the canonical item
     published_at = Column(DateTime, nullable=False, default=datetime.now)
+    published_date = Column(Date, nullable=True)  # Day of published_at, kept in sync by set_published_date
     collected_at = Column(DateTime, nullable=False, default=datetime.now)
 
     # Engagement metrics
@@ -51,6 +60,12 @@ class Content(Base):
     def __repr__(self):
         return f"<Content(id='{self.id}', source='{self.source}', title='{self.title}')>"
 
+    @validates('published_at')
+    def set_published_date(self, key, published_at):
+        """Keep published_date in step with published_at."""
+        self.published_date = published_at.date() if published_at else None
+        return published_at
+
     @classmethod
     def from_twitter(cls, tweet_data):
         """
@@ -131,12 +146,37 @@ class Content(Base):
             url=rss_data.get('link'),
             published_at=datetime.fromisoformat(rss_data.get('published')),
             author_name=rss_data.get('author'),
-            summary=rss_data.get('summary')  # Add summary field
+            summary=rss_data.get('summary'),  # Add summary field
+            canonical_source_id=rss_data.get('canonical_source_id')
         )
 
         return content
 
 
+# Read-path indexes: recent content overall and per source in (published_at, id) page order, and content per day
+Index('ix_content_published_at', Content.published_at.desc(), Content.id.desc())
+Index('ix_content_source_published_at', Content.source, Content.published_at.desc(), Content.id.desc())
+Index('ix_content_published_date', Content.published_date, Content.canonical_source_id)
+
+
+class ContentDailyStats(Base):
+    """
+    Per-day item counts, maintained by ContentStorage as items are stored.
+
+    Only canonical items are counted (near duplicates are not), matching what
+    the dashboard lists. ContentStorage.rebuild_daily_stats recomputes the
+    table from content.
+    """
+    __tablename__ = 'content_daily_stats'
+
+    day = Column(Date, primary_key=True)
+    source = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ContentDailyStats(day='{self.day}', source='{self.source}', count={self.count})>"
+
+
 class Category(Base):
     """
     Content category model.
@@ -1,11 +1,11 @@
 """
 Database connection module for the AI Dashboard.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from src.utils.config import ACTIVE_DATABASE_URL
+from src.utils.config import ACTIVE_DATABASE_URL, DB_FAST_EXECUTEMANY
 from src.utils.logger import setup_logger
 
 # Set up logger
@@ -21,6 +21,9 @@ try:
             'pool_recycle': 300,
             'echo': False
         })
+        if 'pyodbc' in ACTIVE_DATABASE_URL:
+            # Send executemany batches as parameter arrays instead of one round trip per row
+            engine_kwargs['fast_executemany'] = DB_FAST_EXECUTEMANY
     
     engine = create_engine(ACTIVE_DATABASE_URL, **engine_kwargs)
     logger.info(f"Database engine created successfully for: {ACTIVE_DATABASE_URL.split('@')[0]}@***")
@@ -47,12 +50,115 @@ def get_db():
     finally:
         db.close()
 
+def migrate_schema():
+    """
+    Add columns and indexes defined on the models but missing from existing tables.
+    
+    create_all only creates missing tables, so columns added to a model later
+    are added here with ALTER TABLE. Only nullable columns can be added this way.
+    Each missing index is created in its own transaction. Duplicate content
+    rows left by earlier overlapping runs are removed before the unique
+    (source, source_id) index is built; any other index that fails is logged
+    and skipped.
+    """
+    inspector = inspect(engine)
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                
+                if not column.nullable:
+                    logger.warning(f"Cannot add non-nullable column {table.name}.{column.name}; migrate it manually")
+                    continue
+                
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD {column.name} {column_type} NULL"))
+                logger.info(f"Added column {table.name}.{column.name}")
+    
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            
+            try:
+                with engine.begin() as conn:
+                    if index.name == 'ux_content_source_source_id':
+                        remove_duplicate_content(conn)
+                    index.create(conn)
+                logger.info(f"Created index {index.name} on {table.name}")
+            except Exception as e:
+                logger.error(f"Could not create index {index.name} on {table.name}"
+                             f"{' (remove duplicate rows first)' if index.unique else ''}: {str(e)}")
+
+def remove_duplicate_content(conn):
+    """
+    Delete all but one content row per (source, source_id), keeping the lowest id.
+    
+    Category links of the deleted rows are removed with them, and the daily
+    rollup is cleared so initialize_database rebuilds it from the remaining rows.
+    
+    Args:
+        conn (Connection): Connection inside the caller's transaction.
+    
+    Returns:
+        int: Number of content rows deleted.
+    """
+    duplicate = (
+        "source_id IS NOT NULL AND id <> ("
+        "SELECT MIN(keep.id) FROM content keep "
+        "WHERE keep.source = content.source AND keep.source_id = content.source_id)"
+    )
+    
+    conn.execute(text(f"DELETE FROM content_category WHERE content_id IN (SELECT id FROM content WHERE {duplicate})"))
+    deleted = conn.execute(text(f"DELETE FROM content WHERE {duplicate}")).rowcount
+    if deleted:
+        conn.execute(text("DELETE FROM content_daily_stats"))
+        logger.warning(f"Removed {deleted} duplicate content rows before creating the unique (source, source_id) index")
+    return deleted
+
+def backfill_published_date(conn=None):
+    """
+    Fill content.published_date where it is NULL.
+    
+    Covers rows stored before the column existed and rows inserted by writers
+    that do not set it.
+    
+    Args:
+        conn (Connection): Optional connection inside the caller's transaction;
+            by default the update runs in its own transaction.
+    
+    Returns:
+        int: Number of rows updated.
+    """
+    if conn is None:
+        with engine.begin() as conn:
+            return backfill_published_date(conn)
+    
+    day = 'date(published_at)' if conn.dialect.name == 'sqlite' else 'CAST(published_at AS DATE)'
+    result = conn.execute(text(f"UPDATE content SET published_date = {day} WHERE published_date IS NULL"))
+    if result.rowcount:
+        logger.info(f"Backfilled published_date for {result.rowcount} content rows")
+    return result.rowcount
+
 def init_db():
     """
-    Initialize the database by creating all tables.
+    Initialize the database by creating all tables, adding missing columns and
+    indexes, and backfilling derived columns.
     """
     try:
         Base.metadata.create_all(bind=engine)
+        migrate_schema()
+        backfill_published_date()
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
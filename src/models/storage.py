@@ -1,26 +1,326 @@
 """
 Storage module for the AI Dashboard.
 """
+import base64
 import json
+import uuid
+from collections import Counter
 from datetime import datetime
+from sqlalchemy import Date, and_, bindparam, cast, func, or_, text
 from sqlalchemy.orm import Session
 
-from src.models.database import get_db, init_db
-from src.models.content import Content, Category
+from src.models.database import backfill_published_date, get_db, init_db
+from src.models.content import Content, ContentDailyStats, Category
+from src.utils.config import DB_BULK_BATCH_SIZE
 from src.utils.logger import setup_logger
 
 # Set up logger
 logger = setup_logger('storage')
 
+# Keys per IN (...) query, well under SQL Server's 2100 parameter limit
+IN_CHUNK_SIZE = 500
+
+# Columns refreshed when a stored item is collected again
+UPSERT_COLUMNS = ('likes', 'shares', 'comments', 'summary')
+
+def encode_cursor(published_at, item_id):
+    """
+    Encode the position of a content item as an opaque pagination cursor.
+
+    Args:
+        published_at (datetime): The item's published_at.
+        item_id (str): The item's id.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    position = json.dumps([published_at.isoformat(), item_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Cursor string.
+
+    Returns:
+        tuple: (published_at, item_id)
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        published_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(published_at), str(item_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
 class ContentStorage:
     """
     Storage class for content data.
     """
 
+    @staticmethod
+    def get_existing_source_ids(db: Session, source, source_ids):
+        """
+        Get which of the given source IDs are already stored, with one IN query per chunk.
+
+        Args:
+            db (Session): Database session.
+            source (str): Source name (twitter, linkedin, rss).
+            source_ids (list): Source IDs to look up.
+
+        Returns:
+            set: The source IDs that exist in the database.
+        """
+        source_ids = list(dict.fromkeys(str(source_id) for source_id in source_ids))
+        existing = set()
+        for start in range(0, len(source_ids), IN_CHUNK_SIZE):
+            query = db.query(Content.source_id).filter(
+                Content.source == source,
+                Content.source_id.in_(source_ids[start:start + IN_CHUNK_SIZE])
+            )
+            existing.update(row.source_id for row in query)
+        return existing
+
+    @staticmethod
+    def _content_row(content):
+        """
+        Convert an unsaved Content instance to a row for a Core INSERT, filling
+        the column defaults the ORM would otherwise apply on flush.
+        """
+        row = {column.name: getattr(content, column.name) for column in Content.__table__.columns}
+        now = datetime.now()
+        row['id'] = row['id'] or str(uuid.uuid4())
+        row['published_at'] = row['published_at'] or now
+        row['collected_at'] = row['collected_at'] or now
+        row['published_date'] = row['published_date'] or row['published_at'].date()
+        return row
+
+    @staticmethod
+    def _upsert_statement(dialect_name):
+        """
+        Build the upsert statement for a database dialect.
+
+        Rows that already exist (same source and source_id) get their
+        UPSERT_COLUMNS updated in place; new values of None keep the stored
+        value. SQL Server uses MERGE with HOLDLOCK so concurrent runs cannot
+        both insert, SQLite and PostgreSQL use INSERT ... ON CONFLICT. Other
+        dialects fall back to a plain INSERT, and the unique index rejects
+        duplicates.
+
+        The statement reports the id of every row it touches: SQLite and
+        PostgreSQL through RETURNING, SQL Server by writing it to the
+        #content_upserted temp table. An updated row keeps its stored id, so
+        only ids of inserted rows match the ids that were sent.
+
+        Args:
+            dialect_name (str): SQLAlchemy dialect name of the session's bind.
+
+        Returns:
+            Executable: Statement to execute with a list of row dictionaries.
+        """
+        table = Content.__table__
+
+        if dialect_name == 'mssql':
+            columns = [column.name for column in table.columns]
+            updates = ', '.join(f"{name} = COALESCE(incoming.{name}, target.{name})" for name in UPSERT_COLUMNS)
+            return text(f"""
+                MERGE content WITH (HOLDLOCK) AS target
+                USING (SELECT {', '.join(f':{name} AS {name}' for name in columns)}) AS incoming
+                ON target.source = incoming.source AND target.source_id = incoming.source_id
+                WHEN MATCHED THEN
+                    UPDATE SET {updates}
+                WHEN NOT MATCHED THEN
+                    INSERT ({', '.join(columns)})
+                    VALUES ({', '.join(f'incoming.{name}' for name in columns)})
+                OUTPUT inserted.id INTO #content_upserted (id);
+            """).bindparams(*[bindparam(column.name, type_=column.type) for column in table.columns])
+
+        if dialect_name in ('sqlite', 'postgresql'):
+            if dialect_name == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+
+            statement = insert(table)
+            return statement.on_conflict_do_update(
+                index_elements=['source', 'source_id'],
+                index_where=table.c.source_id.isnot(None),
+                set_={name: func.coalesce(statement.excluded[name], table.c[name]) for name in UPSERT_COLUMNS}
+            ).returning(table.c.id)
+
+        return table.insert()
+
+    @staticmethod
+    def _daily_stats_statement(dialect_name):
+        """
+        Build the statement that adds item counts to content_daily_stats.
+
+        Args:
+            dialect_name (str): SQLAlchemy dialect name of the session's bind.
+
+        Returns:
+            Executable: Statement to execute with day, source and count
+                parameters, or None if the dialect has no upsert.
+        """
+        table = ContentDailyStats.__table__
+
+        if dialect_name == 'mssql':
+            return text("""
+                MERGE content_daily_stats WITH (HOLDLOCK) AS target
+                USING (SELECT :day AS [day], :source AS [source], :count AS [count]) AS incoming
+                ON target.[day] = incoming.[day] AND target.[source] = incoming.[source]
+                WHEN MATCHED THEN
+                    UPDATE SET [count] = target.[count] + incoming.[count]
+                WHEN NOT MATCHED THEN
+                    INSERT ([day], [source], [count]) VALUES (incoming.[day], incoming.[source], incoming.[count]);
+            """).bindparams(*[bindparam(column.name, type_=column.type) for column in table.columns])
+
+        if dialect_name in ('sqlite', 'postgresql'):
+            if dialect_name == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+
+            statement = insert(table)
+            return statement.on_conflict_do_update(
+                index_elements=['day', 'source'],
+                set_={'count': table.c.count + statement.excluded['count']}
+            )
+
+        return None
+
+    @staticmethod
+    def _increment_daily_stats(db: Session, rows):
+        """
+        Count newly stored items in content_daily_stats, in the caller's transaction.
+
+        Args:
+            db (Session): Database session. The caller commits.
+            rows (list): Row dictionaries of the items the upsert inserted.
+        """
+        counts = Counter((row['published_date'], row['source']) for row in rows if not row['canonical_source_id'])
+        if not counts:
+            return
+
+        params = [{'day': day, 'source': source, 'count': count} for (day, source), count in counts.items()]
+        statement = ContentStorage._daily_stats_statement(db.get_bind().dialect.name)
+        if statement is not None:
+            db.execute(statement, params)
+            return
+
+        for param in params:
+            updated = db.query(ContentDailyStats).filter(
+                ContentDailyStats.day == param['day'],
+                ContentDailyStats.source == param['source']
+            ).update({ContentDailyStats.count: ContentDailyStats.count + param['count']}, synchronize_session=False)
+            if not updated:
+                db.execute(ContentDailyStats.__table__.insert(), [param])
+
+    @staticmethod
+    def _bulk_upsert(db: Session, source, items, to_content, label, prepare=None, stored_ids=None):
+        """
+        Insert new items of a source and update the ones already stored.
+
+        Existing keys are fetched with chunked IN queries to find the new
+        items passed to prepare. Rows are upserted DB_BULK_BATCH_SIZE at a
+        time with a single executemany, each batch inside a savepoint; if a
+        batch fails it is retried row by row so a bad row only loses itself.
+        The rows the statements actually inserted, which excludes rows another
+        run inserted first, are added to content_daily_stats in the same
+        transaction.
+
+        Args:
+            db (Session): Database session. The caller commits.
+            source (str): Source name (twitter, linkedin, rss).
+            items (list): Collected item dictionaries with an 'id' key.
+            to_content (callable): Converts an item to a Content instance.
+            label (str): Item name used in log messages.
+            prepare (callable): Optional function called with the list of new
+                Content instances before they are stored.
+            stored_ids (set): Optional set that receives the source IDs
+                inserted or updated. Valid once the caller has committed.
+
+        Returns:
+            int: Number of new items stored.
+        """
+        existing = ContentStorage.get_existing_source_ids(db, source, [item.get('id') for item in items])
+
+        contents = []
+        seen = set()
+        for item in items:
+            source_id = str(item.get('id'))
+            if source_id in seen:
+                continue
+            try:
+                contents.append(to_content(item))
+                seen.add(source_id)
+            except Exception as e:
+                logger.error(f"Error saving {label} {item.get('id')}: {str(e)}")
+
+        if prepare is not None:
+            new_contents = [content for content in contents if content.source_id not in existing]
+            if new_contents:
+                prepare(new_contents)
+
+        dialect_name = db.get_bind().dialect.name
+        statement = ContentStorage._upsert_statement(dialect_name)
+        if dialect_name == 'mssql':
+            db.execute(text("IF OBJECT_ID('tempdb..#content_upserted') IS NOT NULL DROP TABLE #content_upserted"))
+            db.execute(text("CREATE TABLE #content_upserted (id VARCHAR(36) NOT NULL)"))
+
+        rows = [ContentStorage._content_row(content) for content in contents]
+        stored = set()
+        returned_ids = set()
+
+        def upsert(batch):
+            with db.begin_nested():
+                result = db.execute(statement, batch)
+                if result.returns_rows:
+                    returned_ids.update(row.id for row in result)
+
+        for start in range(0, len(rows), DB_BULK_BATCH_SIZE):
+            batch = rows[start:start + DB_BULK_BATCH_SIZE]
+            try:
+                upsert(batch)
+                stored.update(row['source_id'] for row in batch)
+                continue
+            except Exception as e:
+                logger.warning(f"Batch upsert of {len(batch)} {source} items failed, retrying row by row: {str(e)}")
+
+            for row in batch:
+                try:
+                    upsert([row])
+                    stored.add(row['source_id'])
+                except Exception as e:
+                    logger.error(f"Error saving {label} {row['source_id']}: {str(e)}")
+
+        if dialect_name == 'mssql':
+            returned_ids.update(row.id for row in db.execute(text("SELECT id FROM #content_upserted")))
+            db.execute(text("DROP TABLE #content_upserted"))
+        elif dialect_name not in ('sqlite', 'postgresql'):
+            # A plain INSERT only succeeds for new rows
+            returned_ids.update(row['id'] for row in rows if row['source_id'] in stored)
+
+        if stored_ids is not None:
+            stored_ids.update(stored)
+
+        inserted = [row for row in rows if row['id'] in returned_ids]
+        ContentStorage._increment_daily_stats(db, inserted)
+
+        updated = len(stored) - len(inserted)
+        if updated:
+            logger.debug(f"Updated {updated} {source} items already in database")
+        return len(inserted)
+
     @staticmethod
     def save_twitter_data(db: Session, tweets):
         """
-        Save Twitter data to the database.
+        Save Twitter data to the database, updating the engagement counts of
+        tweets already stored.
 
         Args:
             db (Session): Database session.
@@ -29,25 +329,7 @@ class ContentStorage:
         Returns:
             int: Number of tweets saved.
         """
-        count = 0
-        for tweet in tweets:
-            try:
-                # Check if tweet already exists
-                existing = db.query(Content).filter(
-                    Content.source == 'twitter',
-                    Content.source_id == str(tweet.get('id'))
-                ).first()
-
-                if existing:
-                    logger.debug(f"Tweet {tweet.get('id')} already exists in database")
-                    continue
-
-                # Create new content item
-                content = Content.from_twitter(tweet)
-                db.add(content)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error saving tweet {tweet.get('id')}: {str(e)}")
+        count = ContentStorage._bulk_upsert(db, 'twitter', tweets, Content.from_twitter, 'tweet')
 
         db.commit()
         logger.info(f"Saved {count} new tweets to database")
@@ -56,7 +338,8 @@ class ContentStorage:
     @staticmethod
     def save_linkedin_data(db: Session, posts):
         """
-        Save LinkedIn data to the database.
+        Save LinkedIn data to the database, updating the engagement counts of
+        posts already stored.
 
         Args:
             db (Session): Database session.
@@ -65,73 +348,173 @@ class ContentStorage:
         Returns:
             int: Number of posts saved.
         """
-        count = 0
-        for post in posts:
-            try:
-                # Check if post already exists
-                existing = db.query(Content).filter(
-                    Content.source == 'linkedin',
-                    Content.source_id == str(post.get('id'))
-                ).first()
-
-                if existing:
-                    logger.debug(f"LinkedIn post {post.get('id')} already exists in database")
-                    continue
-
-                # Create new content item
-                content = Content.from_linkedin(post)
-                db.add(content)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error saving LinkedIn post {post.get('id')}: {str(e)}")
+        count = ContentStorage._bulk_upsert(db, 'linkedin', posts, Content.from_linkedin, 'LinkedIn post')
 
         db.commit()
         logger.info(f"Saved {count} new LinkedIn posts to database")
         return count
 
     @staticmethod
-    def save_rss_data(db: Session, entries):
+    def save_rss_data(db: Session, entries, stored_ids=None):
         """
-        Save RSS data to the database.
+        Save RSS data to the database, updating the summary of entries already
+        stored.
 
         Args:
             db (Session): Database session.
             entries (list): List of RSS entry data.
+            stored_ids (set): Optional set that receives the IDs of the
+                entries written.
 
         Returns:
             int: Number of entries saved.
         """
-        count = 0
-        for entry in entries:
-            try:
-                # Check if entry already exists
-                existing = db.query(Content).filter(
+        batch_summaries = {str(entry.get('id')): entry.get('summary') for entry in entries}
+
+        def link_duplicates(contents):
+            # A near duplicate is hidden behind its canonical item, so that item must be stored
+            duplicates = [content for content in contents if content.canonical_source_id]
+            canonical_ids = list(dict.fromkeys(
+                content.canonical_source_id for content in duplicates if content.canonical_source_id not in batch_summaries
+            ))
+            stored = {}
+            for start in range(0, len(canonical_ids), IN_CHUNK_SIZE):
+                query = db.query(Content.source_id, Content.summary).filter(
                     Content.source == 'rss',
-                    Content.source_id == str(entry.get('id'))
-                ).first()
-
-                if existing:
-                    logger.debug(f"RSS entry {entry.get('id')} already exists in database")
-                    continue
-
-                # Create new content item
-                content = Content.from_rss(entry)
-                db.add(content)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error saving RSS entry {entry.get('id')}: {str(e)}")
+                    Content.source_id.in_(canonical_ids[start:start + IN_CHUNK_SIZE])
+                )
+                stored.update((row.source_id, row.summary) for row in query)
+
+            for content in duplicates:
+                canonical_id = content.canonical_source_id
+                if canonical_id not in batch_summaries and canonical_id not in stored:
+                    logger.warning(f"Canonical item {canonical_id} of RSS entry {content.source_id} is not stored; "
+                                   f"storing the entry as canonical")
+                    content.canonical_source_id = None
+                elif not content.summary:
+                    # The canonical item may have been summarized concurrently
+                    content.summary = batch_summaries.get(canonical_id) or stored.get(canonical_id)
+
+        count = ContentStorage._bulk_upsert(db, 'rss', entries, Content.from_rss, 'RSS entry',
+                                            prepare=link_duplicates, stored_ids=stored_ids)
 
         db.commit()
         logger.info(f"Saved {count} new RSS entries to database")
         return count
 
     @staticmethod
-    def save_all_data(data):
+    def get_known_source_ids(source, since=None):
+        """
+        Get the source IDs already stored for a source.
+
+        Args:
+            source (str): Source name (twitter, linkedin, rss).
+            since (datetime): Optional lower bound on published_at, used to
+                limit the result to the collection window.
+
+        Returns:
+            list: List of source IDs.
+        """
+        db = next(get_db())
+
+        try:
+            query = db.query(Content.source_id).filter(
+                Content.source == source,
+                Content.source_id.isnot(None)
+            )
+
+            if since:
+                query = query.filter(Content.published_at >= since)
+
+            source_ids = [row.source_id for row in query]
+            logger.info(f"Loaded {len(source_ids)} known {source} source IDs")
+            return source_ids
+
+        except Exception as e:
+            logger.error(f"Error retrieving known source IDs: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def get_content_by_source_ids(source, source_ids):
+        """
+        Get the title and content of stored items by their source IDs.
+
+        Args:
+            source (str): Source name (twitter, linkedin, rss).
+            source_ids (list): Source IDs to look up.
+
+        Returns:
+            dict: Mapping of source ID to a dictionary with title, content and summary.
+        """
+        db = next(get_db())
+
+        try:
+            items = {}
+            source_ids = [str(source_id) for source_id in source_ids]
+            # Chunk the IN list to stay under SQL Server's parameter limit
+            for start in range(0, len(source_ids), IN_CHUNK_SIZE):
+                query = db.query(Content.source_id, Content.title, Content.content, Content.summary).filter(
+                    Content.source == source,
+                    Content.source_id.in_(source_ids[start:start + IN_CHUNK_SIZE])
+                )
+                for row in query:
+                    items[row.source_id] = {
+                        'title': row.title,
+                        'content': row.content,
+                        'summary': row.summary
+                    }
+            return items
+
+        except Exception as e:
+            logger.error(f"Error retrieving content by source IDs: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def update_summaries(source, summaries):
+        """
+        Set the summary of stored items.
+
+        Args:
+            source (str): Source name (twitter, linkedin, rss).
+            summaries (dict): Mapping of source ID to summary.
+
+        Returns:
+            int: Number of items updated.
+        """
+        db = next(get_db())
+
+        try:
+            count = 0
+            for source_id, summary in summaries.items():
+                count += db.query(Content).filter(
+                    Content.source == source,
+                    Content.source_id == str(source_id)
+                ).update({Content.summary: summary}, synchronize_session=False)
+
+            db.commit()
+            logger.info(f"Updated summaries for {count} {source} items")
+            return count
+
+        except Exception as e:
+            logger.error(f"Error updating summaries: {str(e)}")
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def save_all_data(data, rss_stored_ids=None):
         """
         Save all collected data to the database.
 
         Args:
             data (dict): Dictionary containing data from all sources.
+            rss_stored_ids (set): Optional set that receives the IDs of the
+                RSS entries written.
 
         Returns:
             dict: Summary of saved items.
@@ -146,7 +529,7 @@ class ContentStorage:
             linkedin_count = ContentStorage.save_linkedin_data(db, data.get('linkedin', []))
 
             # Save RSS data
-            rss_count = ContentStorage.save_rss_data(db, data.get('rss', []))
+            rss_count = ContentStorage.save_rss_data(db, data.get('rss', []), stored_ids=rss_stored_ids)
 
             summary = {
                 'twitter': twitter_count,
@@ -167,7 +550,123 @@ class ContentStorage:
             db.close()
 
     @staticmethod
-    def get_recent_content(limit=50, source=None, date=None):
+    def recent_content_query(db: Session, source=None, date=None, after=None):
+        """
+        Build the query behind get_recent_content, newest first.
+
+        Items are ordered by (published_at, id) descending. With a cursor the
+        query continues after that position (keyset pagination), so every page
+        is an index seek however deep it is. The filters match the
+        ix_content_published_at and ix_content_source_published_at indexes
+        (see scripts/check_query_plans.py).
+
+        Args:
+            db (Session): Database session.
+            source (str): Optional source filter.
+            date (str): Optional date filter in ISO format (YYYY-MM-DD).
+            after (str): Optional cursor of the last item of the previous page.
+
+        Returns:
+            Query: Query for Content items, without a limit.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        # Near duplicates are represented by their canonical item
+        query = db.query(Content).filter(Content.canonical_source_id.is_(None)).order_by(
+            Content.published_at.desc(), Content.id.desc()
+        )
+
+        if after:
+            published_at, item_id = decode_cursor(after)
+            # The plain upper bound lets the database seek; the OR breaks published_at ties by id
+            query = query.filter(Content.published_at <= published_at, or_(
+                Content.published_at < published_at,
+                and_(Content.published_at == published_at, Content.id < item_id)
+            ))
+
+        if source:
+            query = query.filter(Content.source == source)
+
+        if date:
+            # Convert date string to datetime objects for start and end of day
+            from datetime import datetime, timedelta
+            try:
+                date_obj = datetime.fromisoformat(date)
+                start_of_day = date_obj.replace(hour=0, minute=0, second=0, microsecond=0)
+                end_of_day = start_of_day + timedelta(days=1)
+
+                # Filter content published on the specified date; a range on published_at keeps the index usable
+                query = query.filter(Content.published_at >= start_of_day,
+                                     Content.published_at < end_of_day)
+            except ValueError:
+                logger.error(f"Invalid date format: {date}")
+
+        return query
+
+    @staticmethod
+    def available_dates_query(db: Session, limit=30):
+        """
+        Build the query behind get_available_dates.
+
+        Reads the content_daily_stats rollup, so the cost grows with the number
+        of days rather than the number of items.
+
+        Args:
+            db (Session): Database session.
+            limit (int): Maximum number of dates to retrieve.
+
+        Returns:
+            Query: Query for (day, count) rows, newest day first.
+        """
+        total = func.sum(ContentDailyStats.count)
+        return db.query(ContentDailyStats.day, total).group_by(ContentDailyStats.day).having(
+            total > 0
+        ).order_by(ContentDailyStats.day.desc()).limit(limit)
+
+    @staticmethod
+    def rebuild_daily_stats():
+        """
+        Recompute content_daily_stats from the content table.
+
+        Repairs the rollup after items were deleted or changed outside
+        ContentStorage. NULL published_date values, e.g. from the Node
+        backend's writer, are backfilled first so those items are counted.
+
+        Returns:
+            int: Number of (day, source) rows written.
+        """
+        db = next(get_db())
+
+        try:
+            backfill_published_date(db.connection())
+            # Group by published_at itself so the rollup never depends on the derived column
+            if db.get_bind().dialect.name == 'sqlite':
+                day = func.date(Content.published_at)
+            else:
+                day = cast(Content.published_at, Date)
+            counts = db.query(day, Content.source, func.count()).filter(
+                Content.canonical_source_id.is_(None),
+                Content.published_at.isnot(None)
+            ).group_by(day, Content.source)
+
+            db.query(ContentDailyStats).delete(synchronize_session=False)
+            db.execute(ContentDailyStats.__table__.insert().from_select(['day', 'source', 'count'], counts.statement))
+            db.commit()
+
+            rows = db.query(ContentDailyStats).count()
+            logger.info(f"Rebuilt content_daily_stats: {rows} day/source rows")
+            return rows
+
+        except Exception as e:
+            logger.error(f"Error rebuilding daily stats: {str(e)}")
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def get_recent_content(limit=50, source=None, date=None, after=None):
         """
         Get recent content from the database.
 
@@ -175,33 +674,41 @@ class ContentStorage:
             limit (int): Maximum number of items to retrieve.
             source (str): Optional source filter.
             date (str): Optional date filter in ISO format (YYYY-MM-DD).
+            after (str): Optional cursor; only items after it are returned.
 
         Returns:
             list: List of content items.
         """
-        db = next(get_db())
+        return ContentStorage.get_content_page(limit, source, date, after)['items']
 
-        try:
-            query = db.query(Content).order_by(Content.published_at.desc())
+    @staticmethod
+    def get_content_page(limit=50, source=None, date=None, after=None):
+        """
+        Get a page of recent content and the cursor of the next page.
 
-            if source:
-                query = query.filter(Content.source == source)
+        Args:
+            limit (int): Maximum number of items in the page.
+            source (str): Optional source filter.
+            date (str): Optional date filter in ISO format (YYYY-MM-DD).
+            after (str): Cursor returned with the previous page, or None for
+                the first page.
 
-            if date:
-                # Convert date string to datetime objects for start and end of day
-                from datetime import datetime, timedelta
-                try:
-                    date_obj = datetime.fromisoformat(date)
-                    start_of_day = date_obj.replace(hour=0, minute=0, second=0, microsecond=0)
-                    end_of_day = start_of_day + timedelta(days=1)
+        Returns:
+            dict: 'items' (list of content items) and 'next_cursor' (str, or
+                None on the last page).
 
-                    # Filter content published on the specified date
-                    query = query.filter(Content.published_at >= start_of_day,
-                                         Content.published_at < end_of_day)
-                except ValueError:
-                    logger.error(f"Invalid date format: {date}")
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        db = next(get_db())
 
-            items = query.limit(limit).all()
+        try:
+            # One extra row tells whether there is a next page
+            items = ContentStorage.recent_content_query(db, source, date, after).limit(limit + 1).all()
+            next_cursor = None
+            if len(items) > limit:
+                items = items[:limit]
+                next_cursor = encode_cursor(items[-1].published_at, items[-1].id) if items else None
 
             # Convert to dictionaries
             result = []
@@ -221,8 +728,10 @@ class ContentStorage:
                 }
                 result.append(item_dict)
 
-            return result
+            return {'items': result, 'next_cursor': next_cursor}
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving content from database: {str(e)}")
             raise
@@ -243,28 +752,14 @@ class ContentStorage:
         db = next(get_db())
 
         try:
-            # Use raw SQL that's compatible with SQL Server
-            from sqlalchemy.sql import text
-
-            # SQL Server compatible query - use string formatting for TOP clause
-            sql_query = text(f"""
-                SELECT TOP {limit}
-                    CONVERT(DATE, published_at) as date,
-                    COUNT(id) as count
-                FROM content 
-                GROUP BY CONVERT(DATE, published_at)
-                ORDER BY CONVERT(DATE, published_at) DESC
-            """)
-
-            results = db.execute(sql_query).fetchall()
+            results = ContentStorage.available_dates_query(db, limit).all()
 
             # Convert to list of dictionaries
             dates = []
-            for row in results:
-                date_str = row.date.isoformat() if hasattr(row.date, 'isoformat') else str(row.date)
+            for day, count in results:
                 dates.append({
-                    'date': date_str,
-                    'count': row.count
+                    'date': day.isoformat(),
+                    'count': int(count)
                 })
 
             return dates
@@ -288,6 +783,10 @@ def initialize_database():
         # Create default categories
         db = next(get_db())
 
+        # Fill the daily rollup for content stored before it existed
+        if db.query(ContentDailyStats).first() is None and db.query(Content.id).first() is not None:
+            ContentStorage.rebuild_daily_stats()
+
         # Check if categories already exist
         if db.query(Category).count() == 0:
             categories = [
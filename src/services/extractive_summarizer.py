@@ -0,0 +1,169 @@
+"""
+Local extractive summarizer for the AI Dashboard.
+
+Sentences are ranked with TextRank over TF-IDF sentence vectors and the best
+ones are returned in their original order. It needs no network access and
+runs in a few milliseconds, so it is used when the summarization API is
+disabled or failing, and for content too short to be worth an API call.
+"""
+import re
+
+import numpy as np
+
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('extractive_summarizer')
+
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])["\')\]]?\s+(?=["\'(\[]?[A-Z0-9])')
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her here
+hers herself him himself his how i if in into is it its itself just me more most my myself no nor not now of
+off on once only or other our ours ourselves out over own same she should so some such than that the their
+theirs them themselves then there these they this those through to too under until up very was we were what
+when where which while who whom why will with would you your yours yourself yourselves said says new one two
+""".split())
+
+# TextRank parameters
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+
+# Sentences shorter than this many words are never selected
+MIN_SENTENCE_WORDS = 4
+
+
+def split_sentences(text):
+    """
+    Split text into sentences.
+
+    Args:
+        text (str): Plain text.
+
+    Returns:
+        list: Non-empty sentences.
+    """
+    return [sentence.strip() for sentence in SENTENCE_SPLIT_RE.split(text) if sentence.strip()]
+
+
+def _tokenize(text):
+    return [word for word in WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+class ExtractiveSummarizer:
+    """
+    TextRank summarizer over TF-IDF sentence vectors.
+    """
+
+    def __init__(self, max_sentences=3, max_chars=600):
+        """
+        Initialize the summarizer.
+
+        Args:
+            max_sentences (int): Maximum number of sentences in a summary.
+            max_chars (int): Sentences are added while the summary stays
+                within this length (the first one is always kept).
+        """
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+
+    def _rank(self, sentences, title):
+        """
+        Score sentences with TextRank, biased towards the title and the lead.
+
+        Args:
+            sentences (list): Candidate sentences.
+            title (str): Article title.
+
+        Returns:
+            numpy.ndarray: One score per sentence.
+        """
+        documents = [_tokenize(sentence) for sentence in sentences]
+        vocabulary = {}
+        for words in documents:
+            for word in words:
+                vocabulary.setdefault(word, len(vocabulary))
+
+        count = len(sentences)
+        if not vocabulary:
+            return np.zeros(count)
+
+        # Term frequencies, then TF-IDF with smoothed IDF and unit-length rows
+        tf = np.zeros((count, len(vocabulary)))
+        for row, words in enumerate(documents):
+            for word in words:
+                tf[row, vocabulary[word]] += 1
+
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log((1 + count) / (1 + df)) + 1
+        vectors = tf * idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+        # Sentence graph weighted by cosine similarity
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+        row_sums = similarity.sum(axis=1, keepdims=True)
+        transition = np.divide(similarity, row_sums, out=np.full_like(similarity, 1.0 / count), where=row_sums > 0)
+
+        scores = np.full(count, 1.0 / count)
+        for _ in range(MAX_ITERATIONS):
+            updated = (1 - DAMPING) / count + DAMPING * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < TOLERANCE:
+                scores = updated
+                break
+            scores = updated
+
+        # Sentences close to the title, and early sentences, are favoured
+        title_words = [word for word in _tokenize(title) if word in vocabulary]
+        if title_words:
+            title_vector = np.zeros(len(vocabulary))
+            for word in title_words:
+                title_vector[vocabulary[word]] += idf[vocabulary[word]]
+            title_vector /= np.linalg.norm(title_vector)
+            scores = scores * (1 + vectors @ title_vector)
+
+        lead_bonus = 1 + 0.5 / np.arange(1, count + 1)
+        return scores * lead_bonus
+
+    def summarize(self, text, title=""):
+        """
+        Summarize text by selecting its highest ranked sentences.
+
+        Args:
+            text (str): Cleaned plain text.
+            title (str): Article title, used to favour on-topic sentences.
+
+        Returns:
+            str: Summary, or None if the text has no usable sentences.
+        """
+        sentences = [s for s in split_sentences(text) if len(s.split()) >= MIN_SENTENCE_WORDS and not s.endswith('...')]
+        if not sentences:
+            return None
+
+        if len(sentences) > self.max_sentences:
+            scores = self._rank(sentences, title)
+            ranked = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)
+        else:
+            ranked = list(range(len(sentences)))
+
+        chosen = []
+        length = 0
+        for i in ranked:
+            if len(chosen) == self.max_sentences:
+                break
+            if chosen and length + len(sentences[i]) + 1 > self.max_chars:
+                continue
+            chosen.append(i)
+            length += len(sentences[i]) + 1
+
+        summary = ' '.join(sentences[i] for i in sorted(chosen))
+        logger.debug(f"Extractive summary: {summary[:100]}...")
+        return summary
+
+
+# Shared instance
+extractive_summarizer = ExtractiveSummarizer()
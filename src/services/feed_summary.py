@@ -0,0 +1,123 @@
+"""
+Selection between a feed's own summary and a generated one.
+
+Many feeds ship a short editorial summary/description next to the full
+content. When that summary is adequate it is stored as the entry's summary
+and no summarization request is made. A feed summary is scored on three
+factors, multiplied together:
+
+    length       - between FEED_SUMMARY_MIN_WORDS and FEED_SUMMARY_MAX_WORDS;
+                   anything over OVERLONG_FACTOR times the maximum is
+                   article text rather than a summary and scores 0
+    boilerplate  - share of the text left after removing "Read more",
+                   "The post ... appeared first on ..." and similar phrases
+    truncation   - excerpts cut mid-sentence ("... […]") are trimmed to their
+                   last complete sentence and penalized
+
+Summaries scoring at least FEED_SUMMARY_MIN_SCORE are accepted.
+"""
+import re
+
+from src.utils.config import FEED_SUMMARY_MIN_WORDS, FEED_SUMMARY_MAX_WORDS, FEED_SUMMARY_MIN_SCORE
+from src.utils.text_utils import extract_text
+
+# Token budget when extracting the summary text; longer summaries fail the length check anyway
+SUMMARY_TOKEN_BUDGET = 400
+
+# Phrases feeds append to (or use instead of) an editorial summary
+BOILERPLATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'The post .{1,300}? appeared first on .{1,200}?(?:\.|$)',
+        r'(?:This (?:article|post|story) )?(?:was )?originally (?:appeared|published) (?:on|in|at) .{1,200}?(?:\.|$)',
+        r'(?:Continue|Keep) reading.{0,200}$',
+        r'Read (?:more|the (?:full|rest of the|original) (?:story|article|post)).{0,200}$',
+        r'Click here.{0,200}$',
+        r'(?:Subscribe|Sign up)(?: now)? (?:to|for) .{1,200}?(?:\.|$)',
+        r'\d+ comments?\b\.?',
+    )
+]
+
+# Trailing markers of a cut-off excerpt
+TRUNCATION_RE = re.compile(r'\s*(?:\[\s*(?:…|\.\.\.|&hellip;)\s*\]|…|\.\.\.)\s*$')
+SENTENCE_END_RE = re.compile(r'[.!?]["\')\]]?(?=\s|$)')
+
+# Summaries this many times longer than FEED_SUMMARY_MAX_WORDS are always rejected
+OVERLONG_FACTOR = 1.5
+
+# Scores for summaries that end without punctuation or had to be trimmed
+UNTERMINATED_SCORE = 0.6
+TRIMMED_SCORE = 0.8
+
+
+def _length_score(words):
+    if words < FEED_SUMMARY_MIN_WORDS:
+        return words / FEED_SUMMARY_MIN_WORDS
+    if words > FEED_SUMMARY_MAX_WORDS * OVERLONG_FACTOR:
+        return 0.0
+    if words > FEED_SUMMARY_MAX_WORDS:
+        return FEED_SUMMARY_MAX_WORDS / words
+    return 1.0
+
+
+def select_feed_summary(feed_summary, title=''):
+    """
+    Decide whether a feed-provided summary can be stored instead of generating one.
+
+    Args:
+        feed_summary (str): The entry's summary/description field (HTML allowed).
+        title (str): Entry title; a summary that only repeats it is rejected.
+
+    Returns:
+        dict: Decision with 'accepted' (bool), 'score' (float), 'reason'
+            ('accepted', 'missing', 'too_short', 'too_long', 'boilerplate',
+            'truncated' or 'title_only') and 'summary' (the cleaned summary
+            text if accepted, otherwise None).
+    """
+    decision = {'accepted': False, 'score': 0.0, 'reason': 'missing', 'summary': None}
+
+    text = extract_text(feed_summary, SUMMARY_TOKEN_BUDGET) if feed_summary else ''
+    if not text:
+        return decision
+
+    if title and text.rstrip('.').strip().lower() == title.strip().lower():
+        decision['reason'] = 'title_only'
+        return decision
+
+    # Boilerplate
+    cleaned = text
+    for pattern in BOILERPLATE_PATTERNS:
+        cleaned = pattern.sub(' ', cleaned)
+    cleaned = ' '.join(cleaned.split())
+    boilerplate_score = len(cleaned) / len(text)
+
+    # Truncation
+    truncation_score = 1.0
+    if TRUNCATION_RE.search(cleaned):
+        cleaned = TRUNCATION_RE.sub('', cleaned)
+        sentence_ends = [match.end() for match in SENTENCE_END_RE.finditer(cleaned)]
+        if sentence_ends:
+            cleaned = cleaned[:sentence_ends[-1]]
+            truncation_score = TRIMMED_SCORE
+        else:
+            truncation_score = 0.0
+    elif not SENTENCE_END_RE.search(cleaned[-3:]):
+        truncation_score = UNTERMINATED_SCORE
+
+    words = len(cleaned.split())
+    length_score = _length_score(words)
+
+    factors = {'length': length_score, 'boilerplate': boilerplate_score, 'truncated': truncation_score}
+    score = length_score * boilerplate_score * truncation_score
+    decision['score'] = round(score, 3)
+
+    if score >= FEED_SUMMARY_MIN_SCORE:
+        decision.update(accepted=True, reason='accepted', summary=cleaned)
+        return decision
+
+    # Report the factor that hurt the score most
+    worst = min(factors, key=factors.get)
+    if worst == 'length':
+        decision['reason'] = 'too_short' if words < FEED_SUMMARY_MIN_WORDS else 'too_long'
+    else:
+        decision['reason'] = worst
+    return decision
@@ -0,0 +1,173 @@
+"""
+Model routing for summarization requests.
+
+A route bundles the model, prompt, input budget and max_tokens used for a
+request. The router picks a route from the article's size and priority:
+long articles get a route with a larger input budget, high-priority items
+the main model, and everything else the cheaper "small" route. Latency,
+token usage and estimated cost are accounted per route so the split can be
+checked against the bill.
+"""
+import threading
+from collections import deque
+
+from src.utils.config import SUMMARIZATION_MODEL_COSTS
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('model_router')
+
+# Latencies kept per route for the percentiles in the report
+LATENCY_WINDOW = 1000
+
+
+class SummaryRoute:
+    """
+    Settings used for the summarization requests of one route.
+    """
+
+    def __init__(self, name, model, prompt, max_tokens, input_tokens, prompt_version, packable=True):
+        """
+        Initialize the route.
+
+        Args:
+            name (str): Route name used in logs and reports.
+            model (str): Model requested from the API ('local' for the
+                extractive summarizer).
+            prompt (str): Prompt template with {title} and {content} fields.
+            max_tokens (int): Maximum tokens of a generated summary.
+            input_tokens (int): Token budget for the article text sent.
+            prompt_version (str): Part of the summary cache key; distinct per
+                prompt so routes never share cached summaries.
+            packable (bool): Whether articles of this route may be packed
+                into a multi-article request.
+        """
+        self.name = name
+        self.model = model
+        self.prompt = prompt
+        self.max_tokens = max_tokens
+        self.input_tokens = input_tokens
+        self.prompt_version = prompt_version
+        self.packable = packable
+
+    def __repr__(self):
+        return f"SummaryRoute({self.name!r}, model={self.model!r}, max_tokens={self.max_tokens})"
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty sorted list."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class ModelRouter:
+    """
+    Picks a summarization route per article and accounts usage per route.
+    """
+
+    def __init__(self, routes, long_content_chars=0, high_priority=None):
+        """
+        Initialize the router.
+
+        Args:
+            routes (dict): SummaryRoute objects by name. 'default' is
+                required; 'small', 'large' and 'long' are optional. A
+                'local' route is never selected but accounts for summaries
+                made by the extractive summarizer.
+            long_content_chars (int): Raw content length (HTML included) from
+                which the 'long' route is used; 0 disables it.
+            high_priority (float): Priority score from which the 'large'
+                route is used instead of 'small'. None disables it.
+        """
+        self.routes = routes
+        self.long_content_chars = long_content_chars
+        self.high_priority = high_priority
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @property
+    def default(self):
+        return self.routes['default']
+
+    def select(self, content, priority=None):
+        """
+        Pick the route for an article.
+
+        Args:
+            content (str): Raw article content.
+            priority (float): Optional priority score of the article (see
+                summary_priority).
+
+        Returns:
+            SummaryRoute: The route to use.
+        """
+        if 'long' in self.routes and self.long_content_chars and len(content or '') >= self.long_content_chars:
+            return self.routes['long']
+        if 'small' in self.routes:
+            if 'large' in self.routes and self.high_priority is not None and priority is not None and priority >= self.high_priority:
+                return self.routes['large']
+            return self.routes['small']
+        return self.default
+
+    def record(self, route, latency, prompt_tokens=0, completion_tokens=0, articles=1, success=True):
+        """
+        Account a request (or a local summary) to a route.
+
+        Args:
+            route (SummaryRoute): Route the request used.
+            latency (float): Seconds the request took, retries included.
+            prompt_tokens (int): Prompt tokens used (reported or estimated).
+            completion_tokens (int): Completion tokens used.
+            articles (int): Articles covered by the request.
+            success (bool): Whether a summary was returned.
+        """
+        input_cost, output_cost = SUMMARIZATION_MODEL_COSTS.get(route.model, (0.0, 0.0))
+        cost = (prompt_tokens * input_cost + completion_tokens * output_cost) / 1000
+
+        with self._lock:
+            stats = self._stats.setdefault(route.name, {
+                'model': route.model,
+                'requests': 0,
+                'articles': 0,
+                'failures': 0,
+                'prompt_tokens': 0,
+                'completion_tokens': 0,
+                'cost': 0.0,
+                'total_latency': 0.0,
+                'latencies': deque(maxlen=LATENCY_WINDOW)
+            })
+            stats['requests'] += 1
+            stats['articles'] += articles
+            stats['failures'] += 0 if success else 1
+            stats['prompt_tokens'] += prompt_tokens
+            stats['completion_tokens'] += completion_tokens
+            stats['cost'] += cost
+            stats['total_latency'] += latency
+            stats['latencies'].append(latency)
+
+    def report(self):
+        """
+        Get usage per route.
+
+        Returns:
+            dict: For each route used: model, requests, articles, failures,
+                prompt and completion tokens, estimated cost in USD, and mean,
+                p50, p95 and p99 latency in seconds.
+        """
+        with self._lock:
+            report = {}
+            for name, stats in self._stats.items():
+                latencies = sorted(stats['latencies'])
+                report[name] = {
+                    'model': stats['model'],
+                    'requests': stats['requests'],
+                    'articles': stats['articles'],
+                    'failures': stats['failures'],
+                    'prompt_tokens': stats['prompt_tokens'],
+                    'completion_tokens': stats['completion_tokens'],
+                    'cost': round(stats['cost'], 4),
+                    'mean_latency': round(stats['total_latency'] / stats['requests'], 3),
+                    'p50_latency': round(_percentile(latencies, 0.5), 3),
+                    'p95_latency': round(_percentile(latencies, 0.95), 3),
+                    'p99_latency': round(_percentile(latencies, 0.99), 3)
+                }
+            return report
@@ -0,0 +1,239 @@
+"""
+Streaming collection pipeline for the AI Dashboard.
+
+Entries flow through bounded stages instead of being collected into one
+large dictionary first:
+
+    fetch/parse/dedupe  ->  summarize  ->  store
+
+Each stage runs in its own threads and hands work to the next stage through
+a bounded queue, so a slow stage applies backpressure to the ones before it
+and entries reach the database as soon as they are summarized. Parsed
+entries wait in a priority queue, so the summarize stage always takes the
+most important buffered entry, and entries that reach it after the
+collector's time budget has run out are deferred to the backfill queue.
+The feed state is saved once every entry has been through the store stage.
+"""
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from src.models.database import get_db
+from src.models.storage import ContentStorage
+from src.utils.config import PIPELINE_QUEUE_SIZE, PIPELINE_SUMMARY_WORKERS, PIPELINE_BATCH_SIZE
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('stream_pipeline')
+
+# Marks the end of a queue
+_DONE = object()
+
+# Priority of _DONE in the parsed-entry queue; sorts after every entry
+_DONE_PRIORITY = float('inf')
+
+class StreamingPipeline:
+    """
+    Runs RSS collection, summarization and storage as overlapping stages.
+    """
+
+    def __init__(self, rss_collector, queue_size=None, summary_workers=None, batch_size=None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            rss_collector (RSSCollector): Collector used to fetch and parse feeds.
+            queue_size (int): Maximum number of entries waiting between stages.
+            summary_workers (int): Number of concurrent summarization workers.
+            batch_size (int): Number of entries written per database commit.
+        """
+        self.rss_collector = rss_collector
+        self.queue_size = queue_size or PIPELINE_QUEUE_SIZE
+        self.summary_workers = summary_workers or PIPELINE_SUMMARY_WORKERS
+        self.batch_size = batch_size or PIPELINE_BATCH_SIZE
+
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        # Entries that reached the store stage, and the IDs actually written
+        self._processed = []
+        self._stored_ids = set()
+        # Tie-breaker so entries with equal priority are never compared
+        self._sequence = itertools.count()
+
+    def _count(self, key, amount=1):
+        """Increment a run statistic."""
+        with self._stats_lock:
+            self._stats[key] = self._stats.get(key, 0) + amount
+
+    def _fetch_stage(self, days_ago, parsed_queue):
+        """
+        Fetch and parse all feeds concurrently, emitting entries as they appear.
+
+        Args:
+            days_ago (int): How many days back to include entries.
+            parsed_queue (queue.PriorityQueue): Output queue of
+                (-priority, sequence, entry) tuples.
+        """
+        collector = self.rss_collector
+        feeds = collector.due_feeds()
+
+        def fetch_one(feed_name, feed_url):
+            entries = collector.extract_entries(feed_url, feed_name, days_ago)
+            for entry in entries:
+                # Blocks while the summarize stage is behind
+                entry['priority'] = collector.scheduler.priority(entry)
+                parsed_queue.put((-entry['priority'], next(self._sequence), entry))
+            self._count('collected', len(entries))
+
+        try:
+            with ThreadPoolExecutor(max_workers=collector.max_workers, thread_name_prefix='stream-fetch') as executor:
+                futures = [
+                    executor.submit(fetch_one, feed_name, feed_url)
+                    for feed_name, feed_url in feeds.items()
+                ]
+                for (feed_name, _), future in zip(feeds.items(), futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Error streaming feed {feed_name}: {str(e)}")
+        finally:
+            collector.close()
+            for _ in range(self.summary_workers):
+                parsed_queue.put((_DONE_PRIORITY, next(self._sequence), _DONE))
+
+    def _summarize_stage(self, parsed_queue, store_queue):
+        """
+        Summarize entries from the parse stage and pass them to the store stage.
+
+        An entry that fails to summarize is still stored, without a summary.
+        The end marker is always forwarded, so the store stage never waits on
+        a worker that died.
+
+        Args:
+            parsed_queue (queue.PriorityQueue): Input queue of parsed entries.
+            store_queue (queue.Queue): Output queue of summarized entries.
+        """
+        try:
+            while True:
+                _, _, entry = parsed_queue.get()
+                if entry is _DONE:
+                    return
+
+                try:
+                    if (self.rss_collector.scheduler.expired() and not entry.get('canonical_source_id')
+                            and entry.get('summary_source') != 'feed'):
+                        self._count('deferred')
+
+                    self.rss_collector.summarize_entry(entry)
+                    if entry.get('summary'):
+                        self._count('summarized')
+                except Exception as e:
+                    logger.error(f"Error summarizing entry {entry.get('link')}: {str(e)}")
+                store_queue.put(entry)
+        finally:
+            store_queue.put(_DONE)
+
+    def _store_stage(self, store_queue):
+        """
+        Write summarized entries to the database in small batches.
+
+        Args:
+            store_queue (queue.Queue): Input queue of summarized entries.
+        """
+        remaining_producers = self.summary_workers
+        batch = []
+
+        # Keep draining the queue even if the database is unavailable, otherwise
+        # the upstream stages would block forever on a full queue
+        try:
+            db = next(get_db())
+        except Exception as e:
+            logger.error(f"Error opening database session for streaming pipeline: {str(e)}")
+            db = None
+
+        def flush():
+            if not batch:
+                return
+            self._processed.extend(batch)
+            try:
+                if db is None:
+                    raise RuntimeError("no database session")
+                stored_ids = set()
+                self._count('saved', ContentStorage.save_rss_data(db, batch, stored_ids=stored_ids))
+                self._stored_ids.update(stored_ids)
+            except Exception as e:
+                logger.error(f"Error storing batch of {len(batch)} entries: {str(e)}")
+                if db is not None:
+                    db.rollback()
+                self._count('failed', len(batch))
+            batch.clear()
+
+        try:
+            while remaining_producers:
+                entry = store_queue.get()
+                if entry is _DONE:
+                    remaining_producers -= 1
+                    continue
+
+                batch.append(entry)
+                if len(batch) >= self.batch_size:
+                    flush()
+
+            flush()
+        finally:
+            if db is not None:
+                db.close()
+
+    def run(self, days_ago=7):
+        """
+        Run the pipeline to completion.
+
+        Args:
+            days_ago (int): How many days back to include entries.
+
+        Returns:
+            dict: Summary of collected and saved items, in the same shape as
+                ContentStorage.save_all_data.
+        """
+        logger.info(f"Starting streaming pipeline (days_ago={days_ago}, queue_size={self.queue_size}, "
+                    f"summary_workers={self.summary_workers}, batch_size={self.batch_size})")
+
+        self._stats = {}
+        self._processed = []
+        self._stored_ids = set()
+        self.rss_collector.scheduler.start()
+        parsed_queue = queue.PriorityQueue(maxsize=self.queue_size)
+        store_queue = queue.Queue(maxsize=self.queue_size)
+
+        threads = [threading.Thread(target=self._fetch_stage, args=(days_ago, parsed_queue), name='stream-fetch')]
+        threads += [
+            threading.Thread(target=self._summarize_stage, args=(parsed_queue, store_queue), name=f"stream-summarize-{i}")
+            for i in range(self.summary_workers)
+        ]
+        threads.append(threading.Thread(target=self._store_stage, args=(store_queue,), name='stream-store'))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Feeds whose entries were not all stored are fetched again next run
+        self.rss_collector.commit_state(self._processed, self._stored_ids)
+
+        rss_count = self._stats.get('saved', 0)
+        summary = {
+            'twitter': 0,
+            'linkedin': 0,
+            'rss': rss_count,
+            'total': rss_count,
+            'collected': self._stats.get('collected', 0),
+            'summarized': self._stats.get('summarized', 0),
+            'deferred': self._stats.get('deferred', 0),
+            'failed': self._stats.get('failed', 0),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+        logger.info(f"Streaming pipeline completed: {summary}")
+        return summary
@@ -5,46 +5,186 @@ import requests
 import json
 import time
 from typing import Optional, Dict, Any
-import re
-from html import unescape
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from threading import Lock, local
 
 from src.utils.config import (
     SUMMARIZATION_API_KEY, 
     SUMMARIZATION_API_URL, 
     SUMMARIZATION_MODEL,
     SUMMARIZATION_MAX_TOKENS,
-    SUMMARIZATION_ENABLED
+    SUMMARIZATION_ENABLED,
+    SUMMARIZATION_INPUT_TOKENS,
+    SUMMARIZATION_FALLBACK,
+    SUMMARIZATION_LOCAL_MAX_CHARS,
+    SUMMARIZATION_CONCURRENCY,
+    SUMMARIZATION_RPM,
+    SUMMARIZATION_TPM,
+    SUMMARIZATION_PACK_SIZE,
+    SUMMARIZATION_TIMEOUT,
+    SUMMARIZATION_MAX_RETRIES,
+    SUMMARIZATION_BACKOFF_BASE,
+    SUMMARIZATION_BACKOFF_MAX,
+    SUMMARIZATION_BREAKER_THRESHOLD,
+    SUMMARIZATION_BREAKER_RESET,
+    SUMMARIZATION_ROUTING_ENABLED,
+    SUMMARIZATION_SMALL_MODEL,
+    SUMMARIZATION_SMALL_MAX_TOKENS,
+    SUMMARIZATION_HIGH_PRIORITY,
+    SUMMARIZATION_LONG_CONTENT_CHARS,
+    SUMMARIZATION_LONG_INPUT_TOKENS,
+    SUMMARIZATION_LONG_MAX_TOKENS,
+    SUMMARY_CACHE_ENABLED
 )
+from src.services.extractive_summarizer import extractive_summarizer
+from src.services.model_router import ModelRouter, SummaryRoute
+from src.services.summary_retry import SummaryRetryQueue
 from src.utils.logger import setup_logger
+from src.utils.rate_limiter import TokenBucket
+from src.utils.retry import CircuitBreaker, backoff_delay, parse_retry_after
+from src.utils.summary_cache import SummaryCache
+from src.utils.text_utils import estimate_tokens, extract_text
 
 # Set up logger
 logger = setup_logger('summarization_service')
 
+# Bump PROMPT_VERSION whenever SUMMARY_PROMPT or PACKED_PROMPT changes so
+# cached summaries produced by the old prompts are not reused
+PROMPT_VERSION = '1'
+SUMMARY_PROMPT = """Please provide a concise summary of the following AI-related article in 2-3 sentences. Focus on the key insights, developments, or findings.
+
+Title: {title}
+
+Content: {content}
+
+Summary:"""
+
+# Prompt for the long route: more input and a slightly longer summary
+LONG_SUMMARY_PROMPT = """Please provide a concise summary of the following long AI-related article in 3-4 sentences. Cover its main argument and the key insights, developments, or findings; the content may be cut off after its opening sections.
+
+Title: {title}
+
+Content: {content}
+
+Summary:"""
+
+# Prompt for packed requests summarizing several articles at once. Articles
+# are numbered within the pack rather than sent with their (long) source IDs.
+PACKED_PROMPT = """Please provide a concise summary of each of the following AI-related articles in 2-3 sentences. Focus on the key insights, developments, or findings.
+
+Respond with only a JSON object mapping each article ID to its summary, for example {{"1": "Summary of the first article.", "2": "Summary of the second article."}}.
+
+{articles}"""
+PACKED_ARTICLE = """Article ID: {id}
+Title: {title}
+Content: {content}
+"""
+
+
+PACKED_PROMPT_TOKENS = estimate_tokens(PACKED_PROMPT)
+
 class SummarizationService:
     """
     Service for generating article summaries using external APIs.
     """
     
-    def __init__(self):
-        """Initialize the summarization service."""
+    def __init__(self, cache=None, retry_queue=None):
+        """
+        Initialize the summarization service.
+
+        Args:
+            cache (SummaryCache): Summary cache to use. A cache at
+                SUMMARY_CACHE_PATH is used by default when SUMMARY_CACHE_ENABLED.
+            retry_queue (SummaryRetryQueue): Queue for articles whose summary
+                failed. Defaults to a queue at SUMMARY_RETRY_FILE.
+        """
         self.api_key = SUMMARIZATION_API_KEY
         self.api_url = SUMMARIZATION_API_URL
         self.model = SUMMARIZATION_MODEL
         self.max_tokens = SUMMARIZATION_MAX_TOKENS
+        self.input_tokens = SUMMARIZATION_INPUT_TOKENS
+        self.fallback_enabled = SUMMARIZATION_FALLBACK == 'extractive'
+        self.local_max_chars = SUMMARIZATION_LOCAL_MAX_CHARS
         self.enabled = SUMMARIZATION_ENABLED
         
         if not self.api_key and self.enabled:
             logger.warning("Summarization API key not provided. Summarization will be disabled.")
             self.enabled = False
         
+        if cache is None and SUMMARY_CACHE_ENABLED:
+            cache = SummaryCache()
+        self.cache = cache
+        
+        # Shared limits for every API request made through this service. The
+        # buckets hold about ten seconds worth of budget as burst capacity.
+        self.concurrency = max(1, SUMMARIZATION_CONCURRENCY)
+        self.request_bucket = TokenBucket(SUMMARIZATION_RPM / 60, capacity=max(1, SUMMARIZATION_RPM / 6)) if SUMMARIZATION_RPM > 0 else None
+        self.token_bucket = TokenBucket(SUMMARIZATION_TPM / 60, capacity=max(1, SUMMARIZATION_TPM / 6)) if SUMMARIZATION_TPM > 0 else None
+        self.pack_size = max(1, SUMMARIZATION_PACK_SIZE)
+        self._executor = None
+        self._executor_lock = Lock()
+        # Deadline of the iter_summaries call a worker thread is serving
+        self._local = local()
+        
+        # Failure handling: retries with backoff, fail fast while the
+        # endpoint is unhealthy, and queue failed articles for a later pass
+        self.timeout = SUMMARIZATION_TIMEOUT
+        self.max_retries = max(0, SUMMARIZATION_MAX_RETRIES)
+        self.breaker = CircuitBreaker('summarization', SUMMARIZATION_BREAKER_THRESHOLD, SUMMARIZATION_BREAKER_RESET)
+        self.retry_queue = retry_queue if retry_queue is not None else SummaryRetryQueue()
+        
+        self.router = self._build_router()
+        
         logger.info(f"Summarization service initialized. Enabled: {self.enabled}")
     
-    def clean_content(self, content: str) -> str:
+    def _build_router(self) -> ModelRouter:
+        """
+        Build the model router from the routing configuration.
+        
+        Without routing every article uses the 'default' route, which matches
+        SUMMARIZATION_MODEL and SUMMARIZATION_MAX_TOKENS. With routing,
+        articles go to the 'small' route unless they are high priority
+        ('large') or long ('long').
+        
+        Returns:
+            ModelRouter: The router.
+        """
+        routes = {
+            'default': SummaryRoute('default', self.model, SUMMARY_PROMPT, self.max_tokens, self.input_tokens, PROMPT_VERSION),
+            'local': SummaryRoute('local', 'local', None, 0, self.input_tokens, None, packable=False)
+        }
+        if not SUMMARIZATION_ROUTING_ENABLED:
+            return ModelRouter(routes)
+        
+        routes['small'] = SummaryRoute('small', SUMMARIZATION_SMALL_MODEL, SUMMARY_PROMPT,
+                                       SUMMARIZATION_SMALL_MAX_TOKENS, self.input_tokens, PROMPT_VERSION)
+        routes['large'] = SummaryRoute('large', self.model, SUMMARY_PROMPT, self.max_tokens, self.input_tokens, PROMPT_VERSION)
+        routes['long'] = SummaryRoute('long', self.model, LONG_SUMMARY_PROMPT, SUMMARIZATION_LONG_MAX_TOKENS,
+                                      SUMMARIZATION_LONG_INPUT_TOKENS, f"{PROMPT_VERSION}-long", packable=False)
+        logger.info(f"Model routing enabled: {routes['small'].model} for most items, {self.model} "
+                    f"from priority {SUMMARIZATION_HIGH_PRIORITY}, long route from {SUMMARIZATION_LONG_CONTENT_CHARS} characters")
+        return ModelRouter(routes, SUMMARIZATION_LONG_CONTENT_CHARS, SUMMARIZATION_HIGH_PRIORITY)
+    
+    def route_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get latency, token and cost accounting per route.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Usage per route (see ModelRouter.report)
+        """
+        return self.router.report()
+    
+    def clean_content(self, content: str, input_tokens: Optional[int] = None) -> str:
         """
         Clean and prepare content for summarization.
         
+        HTML is converted to plain text and cut to the SUMMARIZATION_INPUT_TOKENS
+        budget, keeping the lead paragraphs. Parsing stops once the budget is
+        filled, so the size of the raw content barely matters.
+        
         Args:
             content (str): Raw content from RSS feed
+            input_tokens (int): Token budget; defaults to SUMMARIZATION_INPUT_TOKENS
             
         Returns:
             str: Cleaned content
@@ -52,83 +192,147 @@ class SummarizationService:
         if not content:
             return ""
         
-        # Unescape HTML entities
-        content = unescape(content)
+        return extract_text(content, input_tokens or self.input_tokens)
+    
+    def _post(self, headers: dict, data: dict, api_name: str, tokens: int = 0) -> Optional[requests.Response]:
+        """
+        POST to the summarization API with retries and circuit breaking.
         
-        # Remove HTML tags
-        content = re.sub(r'<[^>]+>', '', content)
+        429, 5xx and network errors are retried with jittered exponential
+        backoff, honoring Retry-After when the API sends it. 5xx and network
+        errors count towards the circuit breaker; while it is open requests
+        fail immediately instead of waiting for the timeout.
         
-        # Remove extra whitespace and newlines
-        content = re.sub(r'\s+', ' ', content).strip()
+        Under an iter_summaries deadline the timeout is cut to the time left
+        and no retry is started past it, so no request outlives the deadline.
         
-        # Limit content length to avoid API limits (keep first 2000 characters)
-        if len(content) > 2000:
-            content = content[:2000] + "..."
+        Each attempt, retries included, is charged against the request and
+        token rate limits, so retries cannot push either rate over its limit.
+        
+        Args:
+            headers (dict): Request headers
+            data (dict): JSON request body
+            api_name (str): API name for log messages
+            tokens (int): Estimated prompt plus completion tokens charged per attempt
+            
+        Returns:
+            Optional[requests.Response]: The successful response, or None if failed
+        """
+        error = None
+        for attempt in range(self.max_retries + 1):
+            self._acquire_budget(tokens)
+            
+            time_left = self._time_left()
+            if time_left is not None and time_left <= 0:
+                logger.warning(f"{api_name} API request skipped: summarization deadline reached")
+                return None
+            
+            if not self.breaker.allow():
+                logger.warning(f"{api_name} API circuit is open; skipping request")
+                return None
+            
+            response = None
+            try:
+                response = requests.post(
+                    self.api_url,
+                    headers=headers,
+                    json=data,
+                    timeout=self.timeout if time_left is None else min(self.timeout, time_left)
+                )
+            except requests.exceptions.RequestException as e:
+                self.breaker.record_failure()
+                error = f"Request error: {str(e)}"
+            else:
+                if response.status_code == 200:
+                    self.breaker.record_success()
+                    return response
+                
+                error = f"{response.status_code} - {response.text[:200]}"
+                if response.status_code >= 500:
+                    self.breaker.record_failure()
+                else:
+                    # The endpoint is up; 429 is retried, other client errors are not
+                    self.breaker.record_success()
+                    if response.status_code != 429:
+                        break
+            
+            if attempt == self.max_retries:
+                break
+            
+            delay = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+            if delay is None:
+                delay = backoff_delay(attempt, SUMMARIZATION_BACKOFF_BASE, SUMMARIZATION_BACKOFF_MAX)
+            elif delay > SUMMARIZATION_BACKOFF_MAX:
+                logger.warning(f"{api_name} API asked to retry after {delay:.0f}s; giving up on this request")
+                break
+            
+            time_left = self._time_left()
+            if time_left is not None and delay >= time_left:
+                logger.warning(f"{api_name} API error: {error}. Not retrying past the summarization deadline")
+                return None
+            
+            logger.warning(f"{api_name} API error: {error}. Retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
         
-        return content
+        logger.error(f"{api_name} API error: {error}")
+        return None
     
-    def generate_summary_openai(self, content: str, title: str = "") -> Optional[str]:
+    def generate_summary_openai(self, content: str, title: str = "", route: Optional[SummaryRoute] = None) -> Optional[str]:
         """
         Generate summary using OpenAI API.
         
         Args:
             content (str): Article content to summarize
             title (str): Article title for context
+            route (SummaryRoute): Model, prompt and max_tokens to use;
+                defaults to the 'default' route
             
         Returns:
             Optional[str]: Generated summary or None if failed
         """
+        route = route or self.router.default
+        prompt = route.prompt.format(title=title, content=content)
+        started = time.monotonic()
+        usage = {}
+        summary = None
         try:
             headers = {
                 'Authorization': f'Bearer {self.api_key}',
                 'Content-Type': 'application/json'
             }
             
-            # Create prompt
-            prompt = f"""Please provide a concise summary of the following AI-related article in 2-3 sentences. Focus on the key insights, developments, or findings.
-
-Title: {title}
-
-Content: {content}
-
-Summary:"""
-            
             data = {
-                'model': self.model,
+                'model': route.model,
                 'messages': [
                     {
                         'role': 'user',
                         'content': prompt
                     }
                 ],
-                'max_tokens': self.max_tokens,
+                'max_tokens': route.max_tokens,
                 'temperature': 0.3
             }
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                summary = result['choices'][0]['message']['content'].strip()
-                logger.debug(f"Generated summary: {summary[:100]}...")
-                return summary
-            else:
-                logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
+            response = self._post(headers, data, 'OpenAI', estimate_tokens(prompt) + route.max_tokens)
+            if response is None:
                 return None
+            
+            result = response.json()
+            usage = result.get('usage') or {}
+            summary = result['choices'][0]['message']['content'].strip()
+            logger.debug(f"Generated summary: {summary[:100]}...")
+            return summary
                 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error when calling OpenAI API: {str(e)}")
-            return None
         except Exception as e:
             logger.error(f"Unexpected error in OpenAI summarization: {str(e)}")
             return None
+        finally:
+            self.router.record(route, time.monotonic() - started,
+                               usage.get('prompt_tokens', estimate_tokens(prompt)),
+                               usage.get('completion_tokens', estimate_tokens(summary) if summary else 0),
+                               success=bool(summary))
     
-    def generate_summary_generic(self, content: str, title: str = "") -> Optional[str]:
+    def generate_summary_generic(self, content: str, title: str = "", route: Optional[SummaryRoute] = None) -> Optional[str]:
         """
         Generate summary using a generic API endpoint.
         This method can be adapted for other summarization APIs.
@@ -136,10 +340,15 @@ Summary:"""
         Args:
             content (str): Article content to summarize
             title (str): Article title for context
+            route (SummaryRoute): Route whose max_tokens is used (generic APIs
+                take no model or prompt); defaults to the 'default' route
             
         Returns:
             Optional[str]: Generated summary or None if failed
         """
+        route = route or self.router.default
+        started = time.monotonic()
+        summary = None
         try:
             headers = {
                 'Authorization': f'Bearer {self.api_key}',
@@ -148,78 +357,419 @@ Summary:"""
             
             data = {
                 'text': content,
-                'max_length': self.max_tokens,
+                'max_length': route.max_tokens,
                 'min_length': 50
             }
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                # Adapt this based on your API's response format
-                summary = result.get('summary', result.get('text', ''))
-                logger.debug(f"Generated summary: {summary[:100]}...")
-                return summary
-            else:
-                logger.error(f"Summarization API error: {response.status_code} - {response.text}")
+            response = self._post(headers, data, 'Summarization', estimate_tokens(content) + route.max_tokens)
+            if response is None:
                 return None
+            
+            result = response.json()
+            # Adapt this based on your API's response format
+            summary = result.get('summary', result.get('text', ''))
+            logger.debug(f"Generated summary: {summary[:100]}...")
+            return summary
                 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error when calling summarization API: {str(e)}")
-            return None
         except Exception as e:
             logger.error(f"Unexpected error in generic summarization: {str(e)}")
             return None
+        finally:
+            self.router.record(route, time.monotonic() - started, estimate_tokens(content),
+                               estimate_tokens(summary) if summary else 0, success=bool(summary))
+    
+    def _uses_chat_api(self) -> bool:
+        """Check whether the configured endpoint speaks the OpenAI chat-completions format."""
+        return 'openai.com' in self.api_url or self.api_url.rstrip('/').endswith('/chat/completions')
     
-    def generate_summary(self, content: str, title: str = "") -> Optional[str]:
+    def _acquire_budget(self, tokens: int):
         """
-        Generate a summary for the given content.
+        Wait until the request and token rate limits allow another API request.
         
         Args:
-            content (str): Article content to summarize
+            tokens (int): Estimated prompt plus completion tokens of the request
+        """
+        if self.request_bucket is not None:
+            self.request_bucket.acquire()
+        if self.token_bucket is not None:
+            self.token_bucket.acquire(tokens)
+    
+    def _request_packed(self, items: list, route: Optional[SummaryRoute] = None) -> Dict[str, str]:
+        """
+        Summarize several cleaned articles with a single chat-completions request.
+        
+        Args:
+            items (list): List of (pack_id, content, title) tuples
+            route (SummaryRoute): Route whose model and per-article max_tokens
+                are used; defaults to the 'default' route
+            
+        Returns:
+            Dict[str, str]: Summaries keyed by pack ID. Articles missing from
+                the response, or all of them if it cannot be parsed, are absent.
+        """
+        route = route or self.router.default
+        blocks = [PACKED_ARTICLE.format(id=pack_id, title=title, content=content) for pack_id, content, title in items]
+        max_tokens = route.max_tokens * len(items)
+        prompt_tokens = PACKED_PROMPT_TOKENS + sum(estimate_tokens(block) for block in blocks)
+        
+        logger.info(f"Generating packed summaries for {len(items)} articles...")
+        
+        started = time.monotonic()
+        usage = {}
+        summaries = {}
+        try:
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json'
+            }
+            
+            data = {
+                'model': route.model,
+                'messages': [
+                    {
+                        'role': 'user',
+                        'content': PACKED_PROMPT.format(articles='\n'.join(blocks))
+                    }
+                ],
+                'max_tokens': max_tokens,
+                'temperature': 0.3
+            }
+            
+            response = self._post(headers, data, 'OpenAI', prompt_tokens + max_tokens)
+            if response is None:
+                return {}
+            
+            result = response.json()
+            usage = result.get('usage') or {}
+            text = result['choices'][0]['message']['content']
+            # Tolerate code fences or text around the JSON object
+            parsed = json.loads(text[text.index('{'):text.rindex('}') + 1])
+            summaries = {
+                str(pack_id): summary.strip()
+                for pack_id, summary in parsed.items()
+                if isinstance(summary, str) and summary.strip()
+            }
+            return summaries
+            
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not parse packed summary response, falling back to single requests: {str(e)}")
+            return {}
+        except Exception as e:
+            logger.error(f"Unexpected error in packed summarization: {str(e)}")
+            return {}
+        finally:
+            self.router.record(route, time.monotonic() - started,
+                               usage.get('prompt_tokens', prompt_tokens),
+                               usage.get('completion_tokens', sum(estimate_tokens(summary) for summary in summaries.values())),
+                               articles=len(items), success=bool(summaries))
+    
+    def _request_summary(self, content: str, title: str, route: Optional[SummaryRoute] = None) -> Optional[str]:
+        """
+        Request a summary of already cleaned content from the configured API.
+        
+        Args:
+            content (str): Cleaned article content
             title (str): Article title for context
+            route (SummaryRoute): Route to use; defaults to the 'default' route
             
         Returns:
-            Optional[str]: Generated summary or None if failed/disabled
+            Optional[str]: Generated summary or None if failed
         """
-        if not self.enabled:
-            logger.debug("Summarization is disabled")
-            return None
+        route = route or self.router.default
         
+        logger.info(f"Generating summary for article ({route.name} route): {title[:50]}...")
+        
+        # Determine which API to use based on URL
+        if self._uses_chat_api():
+            return self.generate_summary_openai(content, title, route)
+        return self.generate_summary_generic(content, title, route)
+    
+    def _prepare_content(self, content: str, input_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        Clean content for summarization, rejecting content that is too short.
+        
+        Args:
+            content (str): Raw article content
+            input_tokens (int): Token budget; defaults to SUMMARIZATION_INPUT_TOKENS
+            
+        Returns:
+            Optional[str]: Cleaned content, or None if there is nothing to summarize
+        """
         if not content or len(content.strip()) < 50:
             logger.debug("Content too short for summarization")
             return None
         
         # Clean the content
-        cleaned_content = self.clean_content(content)
+        cleaned_content = self.clean_content(content, input_tokens)
         
         if not cleaned_content:
             logger.debug("No content after cleaning")
             return None
         
-        logger.info(f"Generating summary for article: {title[:50]}...")
+        return cleaned_content
+    
+    def _local_summary(self, content: str, title: str) -> Optional[str]:
+        """
+        Summarize cleaned content with the local extractive summarizer.
         
-        # Determine which API to use based on URL
-        if 'openai.com' in self.api_url:
-            summary = self.generate_summary_openai(cleaned_content, title)
+        Args:
+            content (str): Cleaned article content
+            title (str): Article title for context
+            
+        Returns:
+            Optional[str]: Extractive summary or None if failed
+        """
+        started = time.monotonic()
+        try:
+            summary = extractive_summarizer.summarize(content, title)
+        except Exception as e:
+            logger.error(f"Error in extractive summarization: {str(e)}")
+            return None
+        
+        self.router.record(self.router.routes['local'], time.monotonic() - started, success=bool(summary))
+        if summary:
+            logger.info(f"Generated extractive summary ({len(summary)} characters)")
+        return summary
+    
+    def generate_local_summary(self, content: str, title: str = "") -> Optional[str]:
+        """
+        Summarize raw content with the local extractive summarizer, without calling the API.
+        
+        Args:
+            content (str): Article content to summarize
+            title (str): Article title for context
+            
+        Returns:
+            Optional[str]: Extractive summary, or None if the fallback is
+                disabled or there is nothing to summarize
+        """
+        if not self.fallback_enabled:
+            return None
+        
+        cleaned_content = self._prepare_content(content)
+        if cleaned_content is None:
+            return None
+        return self._local_summary(cleaned_content, title)
+    
+    def _prefers_local(self, content: str) -> bool:
+        """Check whether cleaned content is short enough to be summarized locally."""
+        return len(content) <= self.local_max_chars
+    
+    def generate_summary(self, content: str, title: str = "", retry_key: Optional[tuple] = None,
+                         fallback: bool = True, priority: Optional[float] = None) -> Optional[str]:
+        """
+        Generate a summary for the given content.
+        
+        Content up to SUMMARIZATION_LOCAL_MAX_CHARS is summarized locally.
+        Otherwise the model router picks the model, prompt and max_tokens
+        from the content length and priority. When the API is disabled or
+        fails, the local extractive summary is returned instead if
+        SUMMARIZATION_FALLBACK is 'extractive'.
+        
+        Args:
+            content (str): Article content to summarize
+            title (str): Article title for context
+            retry_key (tuple): Optional (source, source_id) of the article; if
+                the API fails the article is queued for a later retry pass
+            fallback (bool): Return the extractive summary when the API is
+                unavailable (disabled for retry passes)
+            priority (float): Optional priority score used for routing
+            
+        Returns:
+            Optional[str]: Generated summary or None if failed/disabled
+        """
+        route = self.router.select(content, priority)
+        cleaned_content = self._prepare_content(content, route.input_tokens)
+        if cleaned_content is None:
+            return None
+        
+        if not self.enabled:
+            logger.debug("Summarization is disabled")
+            return self._local_summary(cleaned_content, title) if fallback and self.fallback_enabled else None
+        
+        if self._prefers_local(cleaned_content):
+            return self._local_summary(cleaned_content, title)
+        
+        if self.cache is not None:
+            key = SummaryCache.make_key(cleaned_content, title, route.model, route.prompt_version)
+            summary = self.cache.get_or_compute(key, lambda: self._request_summary(cleaned_content, title, route))
         else:
-            summary = self.generate_summary_generic(cleaned_content, title)
+            summary = self._request_summary(cleaned_content, title, route)
         
         if summary:
             logger.info(f"Successfully generated summary ({len(summary)} characters)")
             return summary
         else:
             logger.warning("Failed to generate summary")
+            if retry_key is not None:
+                self.retry_queue.add(retry_key[0], retry_key[1], title)
+            if fallback and self.fallback_enabled:
+                return self._local_summary(cleaned_content, title)
             return None
     
+    def _time_left(self) -> Optional[float]:
+        """Get the seconds left before the current thread's iter_summaries deadline, or None without one."""
+        deadline = getattr(self._local, 'deadline', None)
+        return None if deadline is None else deadline - time.monotonic()
+    
+    def _run_until(self, deadline: Optional[float], func, *args):
+        """Run func in a worker thread with API requests bounded by deadline."""
+        self._local.deadline = deadline
+        try:
+            return func(*args)
+        finally:
+            self._local.deadline = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='summarize')
+            return self._executor
+    
+    def close(self):
+        """Shut down the worker pool, waiting for running requests to finish."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def _summarize_safely(self, article: dict, fallback: bool = True) -> Optional[str]:
+        """Generate a summary for an article dictionary, logging instead of raising."""
+        retry_key = (article['source'], article['id']) if article.get('source') and article.get('id') else None
+        try:
+            return self.generate_summary(article.get('content', ''), article.get('title', ''),
+                                         retry_key=retry_key, fallback=fallback, priority=article.get('priority'))
+        except Exception as e:
+            logger.error(f"Unexpected error summarizing {article.get('title', '')[:50]}: {str(e)}")
+            return None
+    
+    def _summarize_pack(self, pack: list, fallback: bool = True) -> list:
+        """
+        Summarize a pack of articles with packed requests, one per route.
+        
+        Cached articles are answered from the cache and too-short ones are
+        skipped. Articles the packed response does not cover, articles of
+        routes that are not packable, and packs of a single article use
+        normal single-article requests.
+        
+        Args:
+            pack (list): List of (index, article) tuples
+            fallback (bool): Passed on to generate_summary
+            
+        Returns:
+            list: List of (index, summary) tuples
+        """
+        results = {}
+        single = []
+        
+        if len(pack) == 1 or not self.enabled:
+            single, pack = list(pack), []
+        
+        by_route = {}
+        for index, article in pack:
+            title = article.get('title', '')
+            route = self.router.select(article.get('content', ''), article.get('priority'))
+            if not route.packable:
+                single.append((index, article))
+                continue
+            
+            cleaned_content = self._prepare_content(article.get('content', ''), route.input_tokens)
+            if cleaned_content is None:
+                results[index] = None
+                continue
+            
+            if self._prefers_local(cleaned_content):
+                results[index] = self._local_summary(cleaned_content, title)
+                continue
+            
+            key = SummaryCache.make_key(cleaned_content, title, route.model, route.prompt_version) if self.cache is not None else None
+            cached = self.cache.get(key) if key is not None else None
+            if cached is not None:
+                results[index] = cached
+                continue
+            
+            by_route.setdefault(route.name, (route, []))[1].append((index, article, cleaned_content, title, key))
+        
+        for route, pending in by_route.values():
+            packed = {}
+            if len(pending) > 1:
+                packed = self._request_packed([
+                    (str(n), cleaned_content, title)
+                    for n, (_, _, cleaned_content, title, _) in enumerate(pending, start=1)
+                ], route)
+                logger.info(f"Packed request returned {len(packed)} of {len(pending)} summaries")
+            
+            for n, (index, article, _, _, key) in enumerate(pending, start=1):
+                summary = packed.get(str(n))
+                if summary:
+                    results[index] = summary
+                    if key is not None:
+                        self.cache.put(key, summary)
+                else:
+                    single.append((index, article))
+        
+        for index, article in single:
+            results[index] = self._summarize_safely(article, fallback)
+        
+        return list(results.items())
+    
+    def iter_summaries(self, articles: list, fallback: bool = True, deadline: Optional[float] = None):
+        """
+        Generate summaries for multiple articles concurrently, yielding them as they complete.
+        
+        At most SUMMARIZATION_CONCURRENCY requests run at once across all
+        callers, and requests are paced by the per-minute request and token
+        limits, so throughput approaches the provider's rate limit. With
+        SUMMARIZATION_PACK_SIZE > 1 and a chat-completions endpoint, articles
+        are sent in packs of that size per request. Articles that also have
+        'source' and 'id' keys are queued for a retry pass when their summary
+        fails. Articles are started in list order, so callers can order them
+        by priority.
+        
+        Args:
+            articles (list): List of article dictionaries with 'content' and 'title' keys
+            fallback (bool): Passed on to generate_summary
+            deadline (float): Optional time.monotonic() value; iteration stops
+                there, articles not yet started are cancelled and running API
+                requests time out, so some articles may not be yielded at all.
+                Summaries of requests that complete are still cached.
+            
+        Yields:
+            tuple: (index, summary) - position of the article in the list and
+                its summary, or None if it could not be generated
+        """
+        if not articles:
+            return
+        
+        executor = self._get_executor()
+        
+        if self.pack_size > 1 and self.enabled and self._uses_chat_api():
+            indexed = list(enumerate(articles))
+            futures = [
+                executor.submit(self._run_until, deadline, self._summarize_pack, indexed[start:start + self.pack_size], fallback)
+                for start in range(0, len(indexed), self.pack_size)
+            ]
+        else:
+            futures = [
+                executor.submit(self._run_until, deadline, self._summarize_pack, [(i, article)], fallback)
+                for i, article in enumerate(articles)
+            ]
+        
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                yield from future.result()
+        except FuturesTimeoutError:
+            logger.warning("Summarization deadline reached; remaining articles were not summarized")
+        finally:
+            # Drop queued work if the caller stops iterating early
+            for future in futures:
+                future.cancel()
+    
     def generate_summaries_batch(self, articles: list) -> Dict[str, str]:
         """
-        Generate summaries for multiple articles with rate limiting.
+        Generate summaries for multiple articles with bounded concurrency and rate limiting.
         
         Args:
             articles (list): List of article dictionaries with 'content' and 'title' keys
@@ -229,18 +779,9 @@ Summary:"""
         """
         summaries = {}
         
-        for i, article in enumerate(articles):
-            article_id = article.get('id', f'article_{i}')
-            content = article.get('content', '')
-            title = article.get('title', '')
-            
-            summary = self.generate_summary(content, title)
+        for i, summary in self.iter_summaries(articles):
             if summary:
-                summaries[article_id] = summary
-            
-            # Rate limiting - wait between requests
-            if i < len(articles) - 1:  # Don't wait after the last request
-                time.sleep(1)  # 1 second delay between requests
+                summaries[articles[i].get('id', f'article_{i}')] = summary
         
         logger.info(f"Generated {len(summaries)} summaries out of {len(articles)} articles")
         return summaries
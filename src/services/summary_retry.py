@@ -0,0 +1,227 @@
+"""
+Retry queue for articles whose summaries could not be generated.
+
+When the summarization API fails (errors, exhausted retries or an open
+circuit breaker) the article is stored without a summary and its
+(source, source_id) is recorded here. A later retry pass
+(main.py --retry-summaries) summarizes the stored content again and
+updates the Content rows.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+
+from src.utils.config import SUMMARY_RETRY_FILE, SUMMARY_RETRY_MAX_ATTEMPTS
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('summary_retry')
+
+class SummaryRetryQueue:
+    """
+    JSON-backed queue of articles waiting for a summary.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the queue and load any previously saved entries.
+
+        Args:
+            path (str): Path of the JSON queue file. Defaults to SUMMARY_RETRY_FILE.
+        """
+        self.path = path or SUMMARY_RETRY_FILE
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    @staticmethod
+    def _key(source, source_id):
+        return f"{source}:{source_id}"
+
+    def _load(self):
+        """
+        Load the queue from disk.
+
+        Returns:
+            dict: Saved entries, or an empty dictionary if none are available.
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read summary retry queue from {self.path}: {str(e)}")
+            return {}
+
+    def add(self, source, source_id, title='', deferred=False, save=True):
+        """
+        Queue an article for a later summary retry and save the queue.
+
+        Args:
+            source (str): Source name (twitter, linkedin, rss).
+            source_id (str): Original ID from the source.
+            title (str): Article title, for logging.
+            deferred (bool): The article was not attempted (the time budget
+                ran out), so its failed attempt count is not increased.
+            save (bool): Save the queue to disk immediately.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(self._key(source, source_id), {
+                'source': source,
+                'source_id': str(source_id),
+                'title': title,
+                'attempts': 0
+            })
+            if deferred:
+                entry['last_deferred'] = datetime.utcnow().isoformat()
+            else:
+                entry['attempts'] += 1
+                entry['last_failed'] = datetime.utcnow().isoformat()
+
+        logger.info(f"Queued {source} item {source_id} for a summary {'backfill' if deferred else 'retry'}")
+        if save:
+            self.save()
+
+    def remove(self, source, source_id):
+        """
+        Remove an article from the queue. Call save() to persist the change.
+
+        Args:
+            source (str): Source name.
+            source_id (str): Original ID from the source.
+        """
+        with self._lock:
+            self._entries.pop(self._key(source, source_id), None)
+
+    def attempts(self, source, source_id):
+        """
+        Get the number of failed attempts recorded for an article.
+
+        Args:
+            source (str): Source name.
+            source_id (str): Original ID from the source.
+
+        Returns:
+            int: Failed attempts, or 0 if the article is not queued.
+        """
+        with self._lock:
+            return self._entries.get(self._key(source, source_id), {}).get('attempts', 0)
+
+    def entries(self):
+        """
+        Get a snapshot of the queued articles.
+
+        Returns:
+            list: Queue entries with source, source_id, title and attempts.
+        """
+        with self._lock:
+            return [dict(entry) for entry in self._entries.values()]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def save(self):
+        """
+        Write the queue to disk atomically.
+        """
+        with self._lock:
+            data = json.dumps(self._entries, indent=2, sort_keys=True)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving summary retry queue to {self.path}: {str(e)}")
+
+
+def retry_failed_summaries(service):
+    """
+    Summarize queued articles again and update their Content rows.
+
+    Articles that fail again stay queued until they have failed
+    SUMMARY_RETRY_MAX_ATTEMPTS times. Articles that are no longer in the
+    database are dropped.
+
+    Args:
+        service (SummarizationService): Service used to generate summaries.
+
+    Returns:
+        dict: Counts of queued, updated, failed and dropped articles.
+    """
+    from src.models.storage import ContentStorage
+
+    queue = service.retry_queue
+    entries = queue.entries()
+    result = {'queued': len(entries), 'updated': 0, 'failed': 0, 'dropped': 0}
+
+    if not entries:
+        logger.info("Summary retry queue is empty")
+        return result
+
+    if not service.enabled:
+        logger.warning("Summarization is disabled; leaving the retry queue untouched")
+        result['failed'] = len(entries)
+        return result
+
+    by_source = {}
+    for entry in entries:
+        by_source.setdefault(entry['source'], []).append(entry)
+
+    for source, source_entries in by_source.items():
+        stored = ContentStorage.get_content_by_source_ids(source, [entry['source_id'] for entry in source_entries])
+
+        articles = []
+        for entry in source_entries:
+            item = stored.get(entry['source_id'])
+            if item is None:
+                logger.warning(f"Dropping {source} item {entry['source_id']} from the retry queue: not in the database")
+                queue.remove(source, entry['source_id'])
+                result['dropped'] += 1
+                continue
+
+            articles.append({
+                'id': entry['source_id'],
+                'source': source,
+                'title': item['title'] or '',
+                'content': item['content'] or '',
+                'attempts': entry['attempts']
+            })
+
+        summaries = {}
+        # No extractive fallback here: only real summaries clear the queue
+        for i, summary in service.iter_summaries(articles, fallback=False):
+            article = articles[i]
+            if summary:
+                summaries[article['id']] = summary
+                queue.remove(source, article['id'])
+                continue
+
+            # A failed request re-queues the article with one more attempt;
+            # an unchanged count means the content was skipped as too short
+            attempts = queue.attempts(source, article['id'])
+            if attempts == article['attempts']:
+                logger.info(f"Dropping {source} item {article['id']} from the retry queue: nothing to summarize")
+                queue.remove(source, article['id'])
+                result['dropped'] += 1
+            elif attempts >= SUMMARY_RETRY_MAX_ATTEMPTS:
+                logger.warning(f"Giving up on summary for {source} item {article['id']} after {attempts} attempts")
+                queue.remove(source, article['id'])
+                result['dropped'] += 1
+            else:
+                result['failed'] += 1
+
+        if summaries:
+            result['updated'] += ContentStorage.update_summaries(source, summaries)
+
+    queue.save()
+    logger.info(f"Summary retry pass: {json.dumps(result)}")
+    return result
@@ -0,0 +1,180 @@
+"""
+Deadline-aware scheduling of summarization work.
+
+Entries are summarized in priority order (recent entries from important
+sources with substantial content first) within a global time budget. When
+the budget runs out the remaining entries are not sent to the API: they get
+a local extractive summary, if enabled, and are queued in the summary retry
+queue so a later backfill pass (main.py --retry-summaries) can summarize them.
+"""
+import json
+import time
+from datetime import datetime
+
+from src.utils.config import SUMMARIZATION_TIME_BUDGET, SUMMARY_SOURCE_WEIGHTS, SUMMARY_RECENCY_HALF_LIFE
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('summary_scheduler')
+
+# Content with at least this many words gets the full length weight
+FULL_LENGTH_WORDS = 300
+
+
+def summary_priority(entry, now=None, source_weights=None):
+    """
+    Score an entry for summarization; higher scores are summarized first.
+
+    The score is the source weight, halved for every SUMMARY_RECENCY_HALF_LIFE
+    hours of age, and scaled from 0.5 to 1.0 by content length so that short
+    teasers come after full articles of the same age.
+
+    Args:
+        entry (dict): Entry with 'published' (ISO format, UTC), 'feed_name'
+            or 'source', and 'content' keys.
+        now (datetime): Reference time as a naive UTC datetime. Defaults to now.
+        source_weights (dict): Weights by feed name or source. Defaults to
+            SUMMARY_SOURCE_WEIGHTS; unlisted sources weigh 1.0.
+
+    Returns:
+        float: Priority score.
+    """
+    weights = SUMMARY_SOURCE_WEIGHTS if source_weights is None else source_weights
+    weight = weights.get(entry.get('feed_name'), weights.get(entry.get('source'), 1.0))
+
+    age_hours = 0.0
+    try:
+        published = datetime.fromisoformat(entry['published'])
+        age_hours = max(0.0, ((now or datetime.utcnow()) - published).total_seconds() / 3600)
+    except (KeyError, TypeError, ValueError):
+        pass
+    recency = 0.5 ** (age_hours / SUMMARY_RECENCY_HALF_LIFE) if SUMMARY_RECENCY_HALF_LIFE > 0 else 1.0
+
+    words = len((entry.get('content') or '').split())
+    length = 0.5 + 0.5 * min(1.0, words / FULL_LENGTH_WORDS)
+
+    return weight * recency * length
+
+
+class SummaryScheduler:
+    """
+    Orders summarization work by priority and enforces a global time budget.
+    """
+
+    def __init__(self, service=None, time_budget=None, source_weights=None, clock=None):
+        """
+        Initialize the scheduler. The budget starts counting at start().
+
+        Args:
+            service (SummarizationService): Service used to generate summaries.
+                Defaults to the global summarization service.
+            time_budget (float): Seconds available from start() until work is
+                deferred. Defaults to SUMMARIZATION_TIME_BUDGET; 0 = unlimited.
+            source_weights (dict): Weights by feed name or source. Defaults to
+                SUMMARY_SOURCE_WEIGHTS.
+            clock (callable): Returns the current time in seconds; must match
+                the clock the service checks the deadline against. Defaults
+                to time.monotonic.
+        """
+        if service is None:
+            from src.services.summarization_service import summarization_service as service
+        self.service = service
+        self.time_budget = SUMMARIZATION_TIME_BUDGET if time_budget is None else time_budget
+        self.source_weights = source_weights
+        self.clock = clock or time.monotonic
+        self.deadline = None
+
+    def start(self):
+        """Start the time budget."""
+        if self.time_budget > 0:
+            self.deadline = self.clock() + self.time_budget
+            logger.info(f"Summarization time budget: {self.time_budget:.0f}s")
+
+    def remaining(self):
+        """
+        Get the time left in the budget.
+
+        Returns:
+            float: Seconds left (at least 0), or None if there is no deadline.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self.clock())
+
+    def expired(self):
+        """Check whether the time budget has run out."""
+        return self.deadline is not None and self.clock() >= self.deadline
+
+    def priority(self, entry):
+        """
+        Score an entry with summary_priority using this scheduler's source weights.
+
+        Args:
+            entry (dict): Entry to score.
+
+        Returns:
+            float: Priority score.
+        """
+        return summary_priority(entry, source_weights=self.source_weights)
+
+    def order(self, entries):
+        """
+        Sort entries by descending priority, storing each entry's score in its
+        'priority' field (used for model routing).
+
+        Args:
+            entries (list): Entries to sort.
+
+        Returns:
+            list: The entries, highest priority first.
+        """
+        now = datetime.utcnow()
+        for entry in entries:
+            entry['priority'] = round(summary_priority(entry, now, self.source_weights), 4)
+        return sorted(entries, key=lambda entry: entry['priority'], reverse=True)
+
+    def defer(self, entry, save=True):
+        """
+        Defer an entry to the backfill queue, giving it a local summary meanwhile.
+
+        Args:
+            entry (dict): Entry with 'source', 'id', 'title' and 'content' keys.
+            save (bool): Save the retry queue to disk immediately.
+        """
+        entry['summary'] = self.service.generate_local_summary(entry.get('content', ''), entry.get('title', ''))
+        if entry.get('source') and entry.get('id'):
+            self.service.retry_queue.add(entry['source'], entry['id'], entry.get('title', ''), deferred=True, save=save)
+
+    def summarize(self, entries, on_summary=None):
+        """
+        Summarize entries in priority order until the time budget runs out.
+
+        Entries not summarized by the deadline are deferred.
+
+        Args:
+            entries (list): Entries produced by the collectors; their
+                'summary' field is set in place.
+            on_summary (callable): Optional callback called with each entry
+                once it has been summarized.
+
+        Returns:
+            dict: Counts of summarized and deferred entries.
+        """
+        ordered = self.order(entries)
+        done = set()
+
+        for i, summary in self.service.iter_summaries(ordered, deadline=self.deadline):
+            ordered[i]['summary'] = summary
+            done.add(i)
+            if on_summary is not None:
+                on_summary(ordered[i])
+
+        deferred = [entry for i, entry in enumerate(ordered) if i not in done]
+        if deferred:
+            logger.warning(f"Summarization time budget exhausted; deferring {len(deferred)} of {len(ordered)} entries to the backfill queue")
+            for entry in deferred:
+                self.defer(entry, save=False)
+            self.service.retry_queue.save()
+
+        logger.info(f"Summarization usage by route: {json.dumps(self.service.route_stats(), sort_keys=True)}")
+        return {'summarized': len(done), 'deferred': len(deferred)}
@@ -26,6 +26,59 @@ SUMMARIZATION_API_URL = os.getenv('SUMMARIZATION_API_URL', 'https://api.openai.c
 SUMMARIZATION_MODEL = os.getenv('SUMMARIZATION_MODEL', 'gpt-3.5-turbo')
 SUMMARIZATION_MAX_TOKENS = int(os.getenv('SUMMARIZATION_MAX_TOKENS', '150'))
 SUMMARIZATION_ENABLED = os.getenv('SUMMARIZATION_ENABLED', 'true').lower() == 'true'
+SUMMARIZATION_INPUT_TOKENS = int(os.getenv('SUMMARIZATION_INPUT_TOKENS', '500'))  # Article text sent per summary (lead paragraphs)
+SUMMARIZATION_FALLBACK = os.getenv('SUMMARIZATION_FALLBACK', 'extractive').lower()  # 'extractive' or 'none' when the API is unavailable
+SUMMARIZATION_LOCAL_MAX_CHARS = int(os.getenv('SUMMARIZATION_LOCAL_MAX_CHARS', '0'))  # Summarize shorter content locally; 0 = always use the API
+SUMMARIZATION_CONCURRENCY = int(os.getenv('SUMMARIZATION_CONCURRENCY', '4'))  # Parallel API requests in batches
+SUMMARIZATION_RPM = int(os.getenv('SUMMARIZATION_RPM', '500'))  # Requests per minute; 0 = unlimited
+SUMMARIZATION_TPM = int(os.getenv('SUMMARIZATION_TPM', '90000'))  # Estimated tokens per minute; 0 = unlimited
+SUMMARIZATION_PACK_SIZE = int(os.getenv('SUMMARIZATION_PACK_SIZE', '1'))  # Articles per chat-completions request; 1 = no packing
+SUMMARIZATION_TIMEOUT = int(os.getenv('SUMMARIZATION_TIMEOUT', '30'))  # Read timeout per request, in seconds
+SUMMARIZATION_MAX_RETRIES = int(os.getenv('SUMMARIZATION_MAX_RETRIES', '3'))  # Retries on 429, 5xx and network errors
+SUMMARIZATION_BACKOFF_BASE = float(os.getenv('SUMMARIZATION_BACKOFF_BASE', '1.0'))
+SUMMARIZATION_BACKOFF_MAX = float(os.getenv('SUMMARIZATION_BACKOFF_MAX', '30.0'))  # Longer Retry-After values are not waited out
+SUMMARIZATION_BREAKER_THRESHOLD = int(os.getenv('SUMMARIZATION_BREAKER_THRESHOLD', '5'))  # Consecutive failures that open the circuit
+SUMMARIZATION_BREAKER_RESET = float(os.getenv('SUMMARIZATION_BREAKER_RESET', '60'))  # Seconds before a trial request
+# Model routing: a cheaper model for most items, SUMMARIZATION_MODEL for high-priority items,
+# and a larger input budget for long ones
+SUMMARIZATION_ROUTING_ENABLED = os.getenv('SUMMARIZATION_ROUTING_ENABLED', 'false').lower() == 'true'
+SUMMARIZATION_SMALL_MODEL = os.getenv('SUMMARIZATION_SMALL_MODEL', 'gpt-4o-mini')
+SUMMARIZATION_SMALL_MAX_TOKENS = int(os.getenv('SUMMARIZATION_SMALL_MAX_TOKENS', '120'))
+SUMMARIZATION_HIGH_PRIORITY = float(os.getenv('SUMMARIZATION_HIGH_PRIORITY', '1.5'))  # Priority score routed to SUMMARIZATION_MODEL
+SUMMARIZATION_LONG_CONTENT_CHARS = int(os.getenv('SUMMARIZATION_LONG_CONTENT_CHARS', '20000'))  # Raw content length of long pieces; 0 = no long route
+SUMMARIZATION_LONG_INPUT_TOKENS = int(os.getenv('SUMMARIZATION_LONG_INPUT_TOKENS', '1500'))
+SUMMARIZATION_LONG_MAX_TOKENS = int(os.getenv('SUMMARIZATION_LONG_MAX_TOKENS', '250'))
+# USD per 1K input:output tokens by model, for cost accounting, e.g. "gpt-4o-mini=0.00015:0.0006"
+SUMMARIZATION_MODEL_COSTS = {
+    name.strip(): tuple(float(price) for price in prices.split(':', 1))
+    for name, prices in (
+        item.split('=', 1) for item in os.getenv(
+            'SUMMARIZATION_MODEL_COSTS', 'gpt-3.5-turbo=0.0005:0.0015,gpt-4o-mini=0.00015:0.0006'
+        ).split(',') if '=' in item
+    )
+}
+SUMMARY_RETRY_FILE = os.getenv('SUMMARY_RETRY_FILE', 'data/summary_retry.json')
+SUMMARY_RETRY_MAX_ATTEMPTS = int(os.getenv('SUMMARY_RETRY_MAX_ATTEMPTS', '5'))
+
+# Feed-provided summaries (stored instead of calling the API when adequate)
+FEED_SUMMARY_ENABLED = os.getenv('FEED_SUMMARY_ENABLED', 'true').lower() == 'true'
+FEED_SUMMARY_MIN_WORDS = int(os.getenv('FEED_SUMMARY_MIN_WORDS', '20'))
+FEED_SUMMARY_MAX_WORDS = int(os.getenv('FEED_SUMMARY_MAX_WORDS', '120'))
+FEED_SUMMARY_MIN_SCORE = float(os.getenv('FEED_SUMMARY_MIN_SCORE', '0.6'))  # Product of the length, boilerplate and truncation scores (0-1)
+
+# Summarization Scheduling (priority order and time budget per collection run)
+SUMMARIZATION_TIME_BUDGET = float(os.getenv('SUMMARIZATION_TIME_BUDGET', '0'))  # Seconds; later work goes to the retry queue; 0 = unlimited
+SUMMARY_RECENCY_HALF_LIFE = float(os.getenv('SUMMARY_RECENCY_HALF_LIFE', '24'))  # Hours after which an entry's priority halves
+# Priority weights by feed name or source, e.g. "openai_blog=2,deepmind_ai=2,theaireport=0.5"; others weigh 1
+SUMMARY_SOURCE_WEIGHTS = {
+    name.strip(): float(weight)
+    for name, weight in (item.split('=', 1) for item in os.getenv('SUMMARY_SOURCE_WEIGHTS', '').split(',') if '=' in item)
+}
+
+# Summary Cache Configuration (summaries reused across runs and feeds)
+SUMMARY_CACHE_ENABLED = os.getenv('SUMMARY_CACHE_ENABLED', 'true').lower() == 'true'
+SUMMARY_CACHE_PATH = os.getenv('SUMMARY_CACHE_PATH', 'data/summary_cache.db')
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv('SUMMARY_CACHE_MAX_ENTRIES', '50000'))
 
 # Database Configuration - SQL Server only
 # Remove SQLite fallback, use SQL Server exclusively
@@ -38,6 +91,10 @@ DB_NAME = os.getenv('DB_NAME', 'ai_dashboard')
 DB_USER = os.getenv('DB_USER', '')
 DB_PASSWORD = os.getenv('DB_PASSWORD', '')
 
+# Bulk storage: rows per INSERT executemany, and pyodbc's array binding (needs a driver that supports parameter arrays)
+DB_BULK_BATCH_SIZE = int(os.getenv('DB_BULK_BATCH_SIZE', '1000'))
+DB_FAST_EXECUTEMANY = os.getenv('DB_FAST_EXECUTEMANY', 'true').lower() == 'true'
+
 # Function to build SQL Server connection string
 def get_sqlserver_connection_string():
     """Build SQL Server connection string from environment variables."""
@@ -74,6 +131,36 @@ TWITTER_KEY_ACCOUNTS = [
     # 'Midjourney'
 ]
 
+# Politeness / Rate Limiting Configuration (applied per host and per API key)
+RATE_LIMIT_PER_HOST = float(os.getenv('RATE_LIMIT_PER_HOST', '1.0'))  # Requests per second; 0 = unlimited
+RATE_LIMIT_BURST = float(os.getenv('RATE_LIMIT_BURST', '1'))
+
+# RSS Collection Configuration
+RSS_MAX_WORKERS = int(os.getenv('RSS_MAX_WORKERS', '8'))  # 1 = collect feeds sequentially
+RSS_PARSE_WORKERS = int(os.getenv('RSS_PARSE_WORKERS', '0'))  # Processes for feed parsing; 0 = parse in-thread
+RSS_REQUEST_TIMEOUT = int(os.getenv('RSS_REQUEST_TIMEOUT', '30'))
+RSS_CACHE_ENABLED = os.getenv('RSS_CACHE_ENABLED', 'true').lower() == 'true'  # Skip unchanged feeds
+RSS_STATE_FILE = os.getenv('RSS_STATE_FILE', 'data/feed_state.json')
+RSS_INCREMENTAL = os.getenv('RSS_INCREMENTAL', 'true').lower() == 'true'  # Skip entries below each feed's high-water mark
+RSS_ADAPTIVE_POLLING = os.getenv('RSS_ADAPTIVE_POLLING', 'true').lower() == 'true'  # Only fetch feeds that are due
+RSS_MIN_POLL_MINUTES = int(os.getenv('RSS_MIN_POLL_MINUTES', '60'))
+RSS_MAX_POLL_HOURS = int(os.getenv('RSS_MAX_POLL_HOURS', '24'))
+RSS_POLL_GRACE_MINUTES = int(os.getenv('RSS_POLL_GRACE_MINUTES', '30'))
+
+# Near-duplicate detection (syndicated copies reuse the canonical item's summary)
+DEDUP_ENABLED = os.getenv('DEDUP_ENABLED', 'true').lower() == 'true'
+DEDUP_INDEX_PATH = os.getenv('DEDUP_INDEX_PATH', 'data/near_duplicates.db')
+DEDUP_MAX_DISTANCE = int(os.getenv('DEDUP_MAX_DISTANCE', '6'))  # Max differing SimHash bits out of 64
+DEDUP_RETENTION_DAYS = int(os.getenv('DEDUP_RETENTION_DAYS', '30'))
+
+# Raw payload archive used by --archive / --replay
+PAYLOAD_ARCHIVE_DIR = os.getenv('PAYLOAD_ARCHIVE_DIR', 'data/archive')
+
+# Streaming Pipeline Configuration (--stream)
+PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', '100'))  # Max entries buffered between stages
+PIPELINE_SUMMARY_WORKERS = int(os.getenv('PIPELINE_SUMMARY_WORKERS', '4'))
+PIPELINE_BATCH_SIZE = int(os.getenv('PIPELINE_BATCH_SIZE', '20'))  # Entries written per database commit
+
 # RSS Feed URLs
 RSS_FEEDS = {
     'wired_ai': 'https://www.wired.com/feed/tag/artificial-intelligence/latest/rss',
@@ -0,0 +1,163 @@
+"""
+Date normalization utilities for the AI Dashboard.
+
+Feed dates are normalized to naive UTC datetimes, which is how they are
+stored in the database. This module only depends on the standard library and
+dateutil so it can be used from feed parsing worker processes.
+"""
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from dateutil import parser as date_parser
+
+# Formats seen in practice in RSS/Atom feeds that neither datetime.fromisoformat
+# nor the RFC 822 parser accept
+STRPTIME_FORMATS = (
+    '%a, %d %b %Y %H:%M:%S %Z',
+    '%a, %d %b %Y %H:%M %z',
+    '%d %b %Y %H:%M:%S %z',
+    '%Y-%m-%d %H:%M:%S %z',
+    '%Y-%m-%d %H:%M:%S',
+    '%B %d, %Y',
+)
+
+
+def to_utc(value):
+    """
+    Convert a datetime to a naive UTC datetime.
+
+    Args:
+        value (datetime): Aware or naive datetime. Naive values are assumed
+            to already be in UTC.
+
+    Returns:
+        datetime: Naive datetime in UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def struct_to_datetime(value):
+    """
+    Convert a feedparser *_parsed struct (always UTC) to a naive UTC datetime.
+
+    Args:
+        value (time.struct_time): Parsed date from feedparser.
+
+    Returns:
+        datetime: Naive datetime in UTC.
+    """
+    return datetime(*value[:6])
+
+
+def _parse_iso(value):
+    return datetime.fromisoformat(value)
+
+
+def _parse_rfc822(value):
+    parsed = parsedate_to_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Not an RFC 822 date: {value}")
+    return parsed
+
+
+def _make_strptime(fmt):
+    def parse(value):
+        return datetime.strptime(value, fmt)
+    return parse
+
+
+# Cheap parsers, tried in order. dateutil is only used if all of them fail.
+PARSERS = (_parse_rfc822, _parse_iso) + tuple(_make_strptime(fmt) for fmt in STRPTIME_FORMATS)
+
+
+class DateNormalizer:
+    """
+    Normalizes feed entry dates, remembering which parser works for each feed.
+
+    Feeds use one date format consistently, so after the first entry the
+    matching parser is tried first and the others are rarely touched.
+    """
+
+    def __init__(self):
+        """Initialize the normalizer with an empty per-feed format memory."""
+        self._feed_parsers = {}
+        self._lock = threading.Lock()
+
+    def parse(self, value, feed_name=None):
+        """
+        Parse a date string into a naive UTC datetime.
+
+        Args:
+            value (str): Date string from the feed.
+            feed_name (str): Feed the value came from, used to remember the
+                parser that worked.
+
+        Returns:
+            datetime: Naive datetime in UTC, or None if the value cannot be parsed.
+        """
+        value = value.strip()
+        if not value:
+            return None
+
+        remembered = self._feed_parsers.get(feed_name)
+        if remembered is not None:
+            try:
+                return to_utc(PARSERS[remembered](value))
+            except (ValueError, TypeError, OverflowError):
+                pass
+
+        for index, parser in enumerate(PARSERS):
+            if index == remembered:
+                continue
+            try:
+                parsed = parser(value)
+            except (ValueError, TypeError, OverflowError):
+                continue
+            if feed_name is not None:
+                with self._lock:
+                    self._feed_parsers[feed_name] = index
+            return to_utc(parsed)
+
+        # Last resort: the slow but very lenient dateutil parser
+        try:
+            return to_utc(date_parser.parse(value))
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    def entry_date(self, entry, feed_name=None):
+        """
+        Get the publication date of a feedparser entry.
+
+        feedparser's already parsed published_parsed/updated_parsed structs
+        are used when present; the raw strings are parsed otherwise.
+
+        Args:
+            entry (feedparser.FeedParserDict): Parsed feed entry.
+            feed_name (str): Feed the entry came from.
+
+        Returns:
+            datetime: Naive datetime in UTC, or None if the entry has no
+                usable date.
+        """
+        for field in ('published', 'updated'):
+            parsed = entry.get(f"{field}_parsed")
+            if parsed:
+                try:
+                    return struct_to_datetime(parsed)
+                except (ValueError, TypeError):
+                    pass
+
+            raw = entry.get(field)
+            if raw:
+                result = self.parse(raw, feed_name)
+                if result is not None:
+                    return result
+
+        return None
+
+
+# Shared instance
+date_normalizer = DateNormalizer()
@@ -0,0 +1,70 @@
+"""
+CPU-bound RSS parsing for the AI Dashboard.
+
+This module deliberately has no dependencies on configuration, logging or
+network code: parse_feed_body takes a raw feed body and returns plain
+dictionaries, so it can run inside a worker process of a process pool. It
+lives outside the collectors package because importing that package loads
+every collector, and with them the configuration and summarization service.
+"""
+import feedparser
+from datetime import datetime
+
+from src.utils.date_utils import date_normalizer
+
+
+def parse_feed_body(body, feed_name, cutoff_date):
+    """
+    Parse a raw feed body into compact entry records.
+
+    Args:
+        body (bytes): Raw feed document.
+        feed_name (str): Name of the feed for identification.
+        cutoff_date (datetime): Entries published before this (naive UTC)
+            are dropped.
+
+    Returns:
+        tuple: (records, total) - list of entry dictionaries with the keys
+            id, title, link, published (naive UTC datetime), has_date, content,
+            feed_summary and author, and the number of entries in the feed
+            before filtering.
+    """
+    feed = feedparser.parse(body)
+    feed_title = feed.feed.get('title', feed_name)
+
+    records = []
+    for entry in feed.entries:
+        # Publication date in UTC; fall back to the current time if missing
+        pub_date = date_normalizer.entry_date(entry, feed_name)
+        has_date = pub_date is not None
+        if not has_date:
+            pub_date = datetime.utcnow()
+
+        # Skip entries older than cutoff date - both are naive UTC
+        if pub_date < cutoff_date:
+            continue
+
+        # Extract content
+        content = ""
+        if hasattr(entry, 'content'):
+            content = entry.content[0].value
+        elif hasattr(entry, 'summary'):
+            content = entry.summary
+        elif hasattr(entry, 'description'):
+            content = entry.description
+
+        # The feed's own summary (feedparser maps description to summary)
+        feed_summary = entry.get('summary', entry.get('description', ''))
+
+        records.append({
+            'id': entry.get('id', entry.get('link')),
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'published': pub_date,
+            'has_date': has_date,
+            'content': content,
+            'feed_summary': feed_summary,
+            'author': entry.get('author', feed_title)
+        })
+
+    return records, len(feed.entries)
@@ -0,0 +1,179 @@
+"""
+Raw payload archive for the AI Dashboard collectors.
+
+Collectors can record every raw response they receive during a run. Payloads
+are stored gzip-compressed under their SHA-256 hash, so identical responses
+seen in different runs are only stored once, and each run gets a small JSON
+manifest mapping (kind, key) to a payload hash:
+
+    data/archive/blobs/ab/abcdef....gz
+    data/archive/runs/<run_id>.json
+
+A run can later be replayed offline from its manifest, giving identical
+inputs for parse, summarize and store benchmarks.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from src.utils.config import PAYLOAD_ARCHIVE_DIR
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('payload_archive')
+
+class PayloadArchive:
+    """
+    Content-addressed, compressed store of raw collector payloads.
+    """
+
+    def __init__(self, run_id=None, root=None, replay=False):
+        """
+        Initialize the archive for a run.
+
+        Args:
+            run_id (str): Run identifier. A timestamp-based ID is generated if
+                not provided.
+            root (str): Archive directory. Defaults to PAYLOAD_ARCHIVE_DIR.
+            replay (bool): True when serving payloads from a recorded run
+                instead of recording a new one.
+        """
+        self.root = root or PAYLOAD_ARCHIVE_DIR
+        self.run_id = run_id or datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        self.replay = replay
+        self.created_at = datetime.utcnow()
+        self._payloads = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, run_id, root=None):
+        """
+        Open a recorded run for replay.
+
+        Args:
+            run_id (str): Run identifier.
+            root (str): Archive directory. Defaults to PAYLOAD_ARCHIVE_DIR.
+
+        Returns:
+            PayloadArchive: Archive in replay mode.
+
+        Raises:
+            FileNotFoundError: If the run has no manifest.
+        """
+        archive = cls(run_id=run_id, root=root, replay=True)
+        with open(archive._manifest_path(), 'r') as f:
+            manifest = json.load(f)
+        archive._payloads = manifest.get('payloads', {})
+        archive.created_at = datetime.fromisoformat(manifest['created_at'])
+
+        total = sum(len(keys) for keys in archive._payloads.values())
+        logger.info(f"Loaded archived run {run_id} with {total} payloads")
+        return archive
+
+    def _manifest_path(self):
+        return os.path.join(self.root, 'runs', f"{self.run_id}.json")
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, 'blobs', digest[:2], f"{digest}.gz")
+
+    def put(self, kind, key, data):
+        """
+        Record a raw payload for this run.
+
+        Args:
+            kind (str): Payload type, e.g. 'rss' or 'linkedin'.
+            key (str): Identifier within the kind, e.g. the feed name.
+            data (bytes or str): Raw payload.
+
+        Returns:
+            str: SHA-256 hex digest of the payload.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with gzip.open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+
+            with self._lock:
+                self._payloads.setdefault(kind, {})[str(key)] = digest
+        except Exception as e:
+            logger.error(f"Error archiving {kind} payload {key}: {str(e)}")
+
+        return digest
+
+    def get(self, kind, key):
+        """
+        Get a recorded payload.
+
+        Args:
+            kind (str): Payload type.
+            key (str): Identifier within the kind.
+
+        Returns:
+            bytes: The raw payload, or None if it was not recorded.
+        """
+        digest = self._payloads.get(kind, {}).get(str(key))
+        if digest is None:
+            return None
+
+        with gzip.open(self._blob_path(digest), 'rb') as f:
+            return f.read()
+
+    def get_json(self, kind, key):
+        """
+        Get a recorded JSON payload.
+
+        Args:
+            kind (str): Payload type.
+            key (str): Identifier within the kind.
+
+        Returns:
+            The decoded payload, or None if it was not recorded.
+        """
+        data = self.get(kind, key)
+        return json.loads(data) if data is not None else None
+
+    def keys(self, kind):
+        """
+        List the keys recorded for a payload type, in recording order.
+
+        Args:
+            kind (str): Payload type.
+
+        Returns:
+            list: Recorded keys.
+        """
+        return list(self._payloads.get(kind, {}))
+
+    def save(self):
+        """
+        Write this run's manifest. Does nothing when replaying.
+        """
+        if self.replay:
+            return
+
+        with self._lock:
+            manifest = {
+                'run_id': self.run_id,
+                'created_at': self.created_at.isoformat(),
+                'payloads': self._payloads
+            }
+
+        path = self._manifest_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+        total = sum(len(keys) for keys in manifest['payloads'].values())
+        logger.info(f"Archived {total} payloads for run {self.run_id} in {self.root}")
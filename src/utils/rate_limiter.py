@@ -0,0 +1,189 @@
+"""
+Rate limiting utilities for the AI Dashboard.
+"""
+import hashlib
+import threading
+import time
+from urllib.parse import urlparse
+
+from src.utils.config import RATE_LIMIT_PER_HOST, RATE_LIMIT_BURST
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('rate_limiter')
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve tokens under a lock and sleep outside it, so concurrent
+    callers are queued behind each other and the configured rate is never
+    exceeded, while the bucket never blocks unrelated buckets.
+    """
+
+    def __init__(self, rate, capacity=1, clock=None):
+        """
+        Initialize the bucket. The bucket starts full.
+
+        Args:
+            rate (float): Tokens added per second. Must be positive; callers
+                that allow unlimited rates skip the bucket instead.
+            capacity (float): Maximum number of tokens the bucket can hold.
+            clock (callable): Returns the current time in seconds. Defaults
+                to time.monotonic.
+        """
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}; use no bucket for an unlimited rate")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock or time.monotonic
+        self._tokens = self.capacity
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost=1):
+        """
+        Take tokens from the bucket without waiting.
+
+        The balance may go negative; the returned delay is how long the caller
+        must wait before the reserved tokens are actually available.
+
+        Args:
+            cost (float): Number of tokens to take.
+
+        Returns:
+            float: Seconds to wait before proceeding.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= cost
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, cost=1):
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            cost (float): Number of tokens to take.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        delay = self.reserve(cost)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Keyed collection of token buckets, one per host and/or API key.
+
+    Requests to different keys never wait on each other; requests to the
+    same key are spaced according to that key's bucket. Keys with a rate of
+    0 or less are not limited.
+    """
+
+    def __init__(self, rate=None, capacity=None, clock=None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate (float): Default requests per second for each key; 0 or
+                less means unlimited. Defaults to RATE_LIMIT_PER_HOST.
+            capacity (float): Default burst size for each key.
+            clock (callable): Clock passed to every bucket. Defaults to
+                time.monotonic.
+        """
+        self.default_rate = RATE_LIMIT_PER_HOST if rate is None else rate
+        self.default_capacity = capacity or RATE_LIMIT_BURST
+        self._clock = clock
+        self._buckets = {}
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url_or_host, api_key=None):
+        """
+        Build the bucket key for a request.
+
+        Args:
+            url_or_host (str): Full URL or bare host name.
+            api_key (str): Optional API key; requests made with different keys
+                to the same host get separate buckets.
+
+        Returns:
+            str: Bucket key.
+        """
+        host = urlparse(url_or_host).netloc or url_or_host
+        host = host.lower()
+        if api_key:
+            # Never keep the raw key around in memory or logs
+            key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:12]
+            return f"{host}#{key_hash}"
+        return host
+
+    def set_limit(self, url_or_host, rate, capacity=1, api_key=None):
+        """
+        Override the limit for a specific host and/or API key.
+
+        Args:
+            url_or_host (str): Full URL or bare host name.
+            rate (float): Requests per second; 0 or less means unlimited.
+            capacity (float): Burst size.
+            api_key (str): Optional API key.
+        """
+        key = self.make_key(url_or_host, api_key)
+        with self._lock:
+            self._limits[key] = (rate, capacity)
+            self._buckets[key] = self._new_bucket(rate, capacity)
+
+    def _new_bucket(self, rate, capacity):
+        """Create a bucket for a key, or None if the rate is unlimited."""
+        return TokenBucket(rate, capacity, clock=self._clock) if rate > 0 else None
+
+    def bucket(self, url_or_host, api_key=None):
+        """
+        Get (or create) the bucket for a host and/or API key.
+
+        Args:
+            url_or_host (str): Full URL or bare host name.
+            api_key (str): Optional API key.
+
+        Returns:
+            TokenBucket: The bucket for this key, or None if it is unlimited.
+        """
+        key = self.make_key(url_or_host, api_key)
+        with self._lock:
+            if key not in self._buckets:
+                rate, capacity = self._limits.get(key, (self.default_rate, self.default_capacity))
+                self._buckets[key] = self._new_bucket(rate, capacity)
+            return self._buckets[key]
+
+    def acquire(self, url_or_host, api_key=None, cost=1):
+        """
+        Wait until a request to the given host and/or API key is allowed.
+
+        Args:
+            url_or_host (str): Full URL or bare host name.
+            api_key (str): Optional API key.
+            cost (float): Number of tokens the request consumes.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        bucket = self.bucket(url_or_host, api_key)
+        if bucket is None:
+            return 0.0
+
+        delay = bucket.acquire(cost)
+        if delay > 0:
+            logger.debug(f"Rate limited {self.make_key(url_or_host)} for {delay:.2f}s")
+        return delay
+
+
+# Global instance shared by all collectors
+rate_limiter = RateLimiter()
@@ -0,0 +1,194 @@
+"""
+Persistent summary cache for the AI Dashboard.
+
+Summaries are stored in a small SQLite database keyed by a hash of everything
+that determines the API output: the cleaned content, the title, the model and
+the prompt version. Re-runs, backfills and articles that arrive through more
+than one feed are then answered from disk instead of the summarization API.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+from src.utils.config import SUMMARY_CACHE_PATH, SUMMARY_CACHE_MAX_ENTRIES
+from src.utils.logger import setup_logger
+
+# Set up logger
+logger = setup_logger('summary_cache')
+
+# Evict down to this fraction of max_entries so eviction runs rarely
+EVICTION_TARGET = 0.9
+
+class SummaryCache:
+    """
+    SQLite-backed summary cache with size-bounded LRU eviction.
+
+    Concurrent lookups of the same key share a single in-flight computation,
+    so two workers summarizing the same article only make one API request.
+    """
+
+    def __init__(self, path=None, max_entries=None):
+        """
+        Initialize the cache. The database is opened on first use.
+
+        Args:
+            path (str): Path of the SQLite database. Defaults to SUMMARY_CACHE_PATH.
+            max_entries (int): Maximum number of cached summaries. Defaults to
+                SUMMARY_CACHE_MAX_ENTRIES.
+        """
+        self.path = path or SUMMARY_CACHE_PATH
+        self.max_entries = max_entries or SUMMARY_CACHE_MAX_ENTRIES
+        self._conn = None
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content, title, model, prompt_version):
+        """
+        Build the cache key for a summarization request.
+
+        Args:
+            content (str): Cleaned article content.
+            title (str): Article title.
+            model (str): Model used for summarization.
+            prompt_version (str): Version of the prompt template.
+
+        Returns:
+            str: SHA-256 hex digest identifying the request.
+        """
+        parts = (model or '', str(prompt_version), title or '', content or '')
+        return hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()
+
+    def _connect(self):
+        """Open the database and create the table if needed. Call with the lock held."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS summaries ('
+                'key TEXT PRIMARY KEY, summary TEXT NOT NULL, '
+                'created_at REAL NOT NULL, last_used REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS ix_summaries_last_used ON summaries (last_used)')
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key):
+        """
+        Look up a cached summary and mark it as recently used.
+
+        Args:
+            key (str): Cache key from make_key.
+
+        Returns:
+            str: Cached summary, or None if the key is not cached.
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute('SELECT summary FROM summaries WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute('UPDATE summaries SET last_used = ? WHERE key = ?', (time.time(), key))
+                conn.commit()
+                return row[0]
+        except sqlite3.Error as e:
+            logger.error(f"Error reading summary cache {self.path}: {str(e)}")
+            return None
+
+    def put(self, key, summary):
+        """
+        Store a summary, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): Cache key from make_key.
+            summary (str): Summary to store.
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO summaries (key, summary, created_at, last_used) VALUES (?, ?, ?, ?)',
+                    (key, summary, now, now)
+                )
+
+                count = conn.execute('SELECT COUNT(*) FROM summaries').fetchone()[0]
+                if count > self.max_entries:
+                    evict = count - int(self.max_entries * EVICTION_TARGET)
+                    conn.execute(
+                        'DELETE FROM summaries WHERE key IN '
+                        '(SELECT key FROM summaries ORDER BY last_used LIMIT ?)',
+                        (evict,)
+                    )
+                    logger.info(f"Evicted {evict} least recently used summaries from cache")
+
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing summary cache {self.path}: {str(e)}")
+
+    def get_or_compute(self, key, compute):
+        """
+        Get a cached summary, computing and caching it on a miss.
+
+        If another thread is already computing the same key, this waits for
+        its result instead of starting a second computation. Only non-empty
+        results are cached, so failed requests are retried next time.
+
+        Args:
+            key (str): Cache key from make_key.
+            compute (callable): Function with no arguments returning the
+                summary or None.
+
+        Returns:
+            str: The summary, or None if it could not be generated.
+        """
+        summary = self.get(key)
+        if summary is not None:
+            self.hits += 1
+            logger.debug(f"Summary cache hit for {key[:12]}")
+            return summary
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            logger.debug(f"Waiting for in-flight summary {key[:12]}")
+            return future.result()
+
+        self.misses += 1
+        summary = None
+        try:
+            summary = compute()
+            if summary:
+                self.put(key, summary)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_result(summary)
+
+        return summary
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM summaries').fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
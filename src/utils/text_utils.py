@@ -0,0 +1,176 @@
+"""
+Text preparation utilities for the AI Dashboard.
+
+extract_text turns feed HTML into plain text for summarization. It streams
+the document through html.parser and stops as soon as the token budget is
+filled, so very large content:encoded bodies cost no more than the lead
+paragraphs that are actually sent to the model.
+"""
+import re
+from html.parser import HTMLParser
+
+# Average characters per token for English text; used by the fast estimator
+CHARS_PER_TOKEN = 4
+
+# Documents are fed to the parser in chunks of this many characters so
+# parsing can stop early once the budget is filled
+FEED_CHUNK_SIZE = 16384
+
+# Tags whose text is never part of the article
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'head', 'object'}
+
+# Tags that end a paragraph-like block of text
+BLOCK_TAGS = {
+    'p', 'div', 'section', 'article', 'header', 'footer', 'aside', 'main',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'ul', 'ol', 'dl', 'dt', 'dd',
+    'blockquote', 'pre', 'table', 'tr', 'td', 'th', 'figure', 'figcaption', 'hr'
+}
+
+# Escaped markup (e.g. "&lt;p&gt;") decodes to tags inside text data
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Sentence endings used to cut the last block cleanly
+SENTENCE_END_RE = re.compile(r'[.!?]["\')\]]?(?=\s)')
+
+
+def estimate_tokens(text):
+    """
+    Roughly estimate the number of tokens in a text (about 4 characters per token).
+
+    Args:
+        text (str): Text to measure.
+
+    Returns:
+        int: Estimated token count.
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class _StopParsing(Exception):
+    """Raised inside the parser once the budget is filled."""
+
+
+class _BudgetedTextExtractor(HTMLParser):
+    """
+    HTML parser that collects visible text block by block up to a character budget.
+    """
+
+    def __init__(self, max_chars):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.blocks = []
+        self.length = 0
+        self.truncated = False
+        self._current = []
+        self._current_length = 0
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.end_block()
+        elif tag == 'br':
+            self._current.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif tag in BLOCK_TAGS:
+            self.end_block()
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if '<' in data:
+            data = TAG_RE.sub(' ', data)
+
+        self._current.append(data)
+        self._current_length += len(data)
+
+        # Very long blocks (or documents without block tags) are checked
+        # against the budget before the block ends
+        if self.length + self._current_length > self.max_chars:
+            self.end_block()
+
+    def end_block(self):
+        """Finish the current block, cutting it if it does not fit the budget."""
+        text = ' '.join(''.join(self._current).split())
+        self._current = []
+        self._current_length = 0
+        if not text:
+            return
+
+        # One character for the space joining this block to the previous one
+        remaining = self.max_chars - self.length - (1 if self.blocks else 0)
+        if len(text) <= remaining:
+            self.blocks.append(text)
+            self.length += len(text) + (1 if len(self.blocks) > 1 else 0)
+            return
+
+        cut = _cut_text(text, remaining)
+        if cut:
+            self.blocks.append(cut)
+        self.truncated = True
+        raise _StopParsing()
+
+
+def _cut_text(text, max_chars):
+    """
+    Cut text to at most max_chars, preferring a sentence and then a word boundary.
+
+    Args:
+        text (str): Normalized text.
+        max_chars (int): Maximum length of the result.
+
+    Returns:
+        str: The cut text (possibly empty).
+    """
+    if max_chars <= 0:
+        return ''
+
+    head = text[:max_chars]
+    sentence_ends = [match.end() for match in SENTENCE_END_RE.finditer(text, 0, max_chars + 1)]
+    if sentence_ends and sentence_ends[-1] >= max_chars // 2:
+        return head[:sentence_ends[-1]]
+
+    space = head.rfind(' ')
+    if space >= max_chars // 2:
+        return head[:space]
+    return head
+
+
+def extract_text(html, max_tokens):
+    """
+    Extract the visible text of an HTML fragment, up to a token budget.
+
+    Text is collected in document order, so the lead paragraphs are kept.
+    Script, style and similar elements are dropped, entities are decoded and
+    whitespace is collapsed. Parsing stops as soon as the budget is filled;
+    the last block is cut at a sentence or word boundary and "..." appended.
+
+    Args:
+        html (str): HTML (or plain text) content.
+        max_tokens (int): Token budget for the result, as measured by
+            estimate_tokens.
+
+    Returns:
+        str: Extracted text.
+    """
+    if not html:
+        return ''
+
+    extractor = _BudgetedTextExtractor(max_tokens * CHARS_PER_TOKEN)
+    try:
+        for start in range(0, len(html), FEED_CHUNK_SIZE):
+            extractor.feed(html[start:start + FEED_CHUNK_SIZE])
+        extractor.close()
+        extractor.end_block()
+    except _StopParsing:
+        pass
+
+    text = ' '.join(extractor.blocks)
+    if extractor.truncated:
+        text += '...'
+    return text
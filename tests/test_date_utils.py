@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for feed date normalization.
+
+Usage:
+    python tests/test_date_utils.py
+"""
+import sys
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil import parser as date_parser
+
+from src.utils.date_utils import DateNormalizer
+
+def test_date_normalization():
+    """Test that common feed date formats are converted to naive UTC."""
+    print("\n=== Testing Date Normalization ===")
+
+    normalizer = DateNormalizer()
+    expected = datetime(2025, 5, 27, 12, 0, 0)
+
+    samples = [
+        'Tue, 27 May 2025 12:00:00 +0000',
+        'Tue, 27 May 2025 14:00:00 +0200',
+        'Tue, 27 May 2025 12:00:00 GMT',
+        '2025-05-27T12:00:00Z',
+        '2025-05-27T08:00:00-04:00',
+        '2025-05-27 12:00:00',
+    ]
+
+    try:
+        for sample in samples:
+            result = normalizer.parse(sample, 'test_feed')
+            if result != expected:
+                print(f"❌ {sample!r} parsed as {result}, expected {expected}")
+                return False
+            print(f"✅ {sample!r} -> {result.isoformat()}")
+
+        if normalizer.parse('not a date', 'test_feed') is not None:
+            print("❌ Invalid date was not rejected")
+            return False
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing date normalization: {str(e)}")
+        return False
+
+def build_fixture(count=10000):
+    """Build a fixture of feed-style date strings spread over a few formats."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    values = []
+    for i in range(count):
+        value = start + timedelta(minutes=17 * i)
+        if i % 2:
+            values.append(('rfc822_feed', format_datetime(value)))
+        else:
+            values.append(('iso_feed', value.isoformat()))
+    return values
+
+def test_date_normalization_benchmark(count=10000):
+    """Compare the normalizer against dateutil on a 10k-entry fixture."""
+    print(f"\n=== Benchmarking Date Normalization ({count} entries) ===")
+
+    fixture = build_fixture(count)
+    normalizer = DateNormalizer()
+
+    try:
+        start = time.perf_counter()
+        baseline = [date_parser.parse(value).astimezone(timezone.utc).replace(tzinfo=None) for _, value in fixture]
+        dateutil_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = [normalizer.parse(value, feed_name) for feed_name, value in fixture]
+        fast_time = time.perf_counter() - start
+
+        if fast != baseline:
+            print("❌ Normalizer results differ from dateutil")
+            return False
+
+        print(f"dateutil:   {dateutil_time * 1000:.1f} ms")
+        print(f"normalizer: {fast_time * 1000:.1f} ms")
+        print(f"Speedup:    {dateutil_time / fast_time:.1f}x")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error benchmarking date normalization: {str(e)}")
+        return False
+
+def main():
+    """Run all date normalization tests."""
+    print("Date Normalization Test Suite")
+    print("=" * 40)
+
+    tests = [
+        ("Date Normalization", test_date_normalization),
+        ("Date Normalization Benchmark", test_date_normalization_benchmark)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    return all(result == "PASS" for result in results.values())
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-feed state kept between RSS collection runs.
+
+Feeds are served by a mocked requests.get and the state is written to a
+temporary file, so no network access or real state file is used.
+
+Usage:
+    python tests/test_feed_state.py
+"""
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors import rss_collector
+from collectors.feed_state import FeedStateStore
+from collectors.near_duplicates import NearDuplicateIndex
+from collectors.rss_collector import RSSCollector
+from collectors.seen_filter import SeenIdFilter
+from src.utils.config import RSS_MAX_POLL_HOURS, RSS_MIN_POLL_MINUTES, RSS_POLL_GRACE_MINUTES
+from src.utils.rate_limiter import RateLimiter
+
+FEED_URL = 'https://example.com/feed.xml'
+
+def rss_body(*item_ids):
+    """Build an RSS document with one item per ID, item N published N hours ago."""
+    items = ''.join(
+        f"<item><guid>item-{n}</guid><title>Item {n}</title><link>https://example.com/{n}</link>"
+        f"<pubDate>{format_datetime(datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=n), usegmt=True)}</pubDate>"
+        f"<description>Body of item {n}.</description></item>"
+        for n in item_ids
+    )
+    return f"<?xml version='1.0'?><rss version='2.0'><channel><title>Test</title>{items}</channel></rss>".encode('utf-8')
+
+def response(status_code=200, body=b'', headers=None):
+    """Build a mock requests response."""
+    return mock.Mock(status_code=status_code, content=body, headers=headers or {}, raise_for_status=mock.Mock())
+
+def collector(path):
+    """Build an RSS collector for the test feed, backed by a state file at path."""
+    return RSSCollector(
+        feeds={'test': FEED_URL}, max_workers=1, use_cache=True, state=FeedStateStore(path),
+        incremental=True, seen_filter=SeenIdFilter(), parse_workers=0, adaptive_polling=False,
+        near_duplicates=NearDuplicateIndex(path=':memory:'), use_feed_summaries=False
+    )
+
+def collect(path, get_response):
+    """Run extract_entries once with requests.get answering get_response."""
+    rss = collector(path)
+    with mock.patch.object(rss_collector.requests, 'get', return_value=get_response) as get, \
+            mock.patch.object(rss_collector, 'rate_limiter', RateLimiter(rate=0)):
+        entries = rss.extract_entries(FEED_URL, 'test', days_ago=7)
+    return rss, entries, get
+
+def test_stage_and_commit():
+    """Test that staged values are kept only by commit and never written to disk."""
+    print("\n=== Testing Stage and Commit ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'feed_state.json')
+            store = FeedStateStore(path)
+            store.update('kept', etag='"v1"')
+            store.stage('kept', etag='"v2"')
+            store.stage('dropped', etag='"v1"')
+            store.save()
+
+            if FeedStateStore(path).get('kept') != {'etag': '"v1"'} or FeedStateStore(path).get('dropped'):
+                print("❌ Staged values were written to disk")
+                return False
+            print("✅ Staged values are not saved")
+
+            store.commit('kept')
+            store.discard('dropped')
+            store.save()
+            reloaded = FeedStateStore(path)
+            if reloaded.get('kept') != {'etag': '"v2"'} or reloaded.get('dropped') or store.staged_feeds():
+                print(f"❌ Unexpected state after commit and discard: {reloaded.get('kept')}, {reloaded.get('dropped')}")
+                return False
+            print("✅ Committed values saved, discarded values dropped")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing stage and commit: {str(e)}")
+        return False
+
+def test_validators():
+    """Test that ETag and Last-Modified are kept once stored and sent on the next run."""
+    print("\n=== Testing ETag / Last-Modified Persistence ===")
+
+    headers = {'ETag': '"abc"', 'Last-Modified': 'Tue, 27 May 2025 12:00:00 GMT'}
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'feed_state.json')
+
+            rss, entries, _ = collect(path, response(body=rss_body(1, 2), headers=headers))
+            rss.commit_state(entries)
+            saved = FeedStateStore(path).get('test')
+            if saved.get('etag') != '"abc"' or saved.get('modified') != headers['Last-Modified']:
+                print(f"❌ Validators were not saved: {saved}")
+                return False
+            print("✅ Validators saved after the entries were stored")
+
+            rss, entries, get = collect(path, response(status_code=304))
+            sent = get.call_args.kwargs['headers']
+            if sent.get('If-None-Match') != '"abc"' or sent.get('If-Modified-Since') != headers['Last-Modified']:
+                print(f"❌ Conditional GET headers not sent: {sent}")
+                return False
+            if entries:
+                print("❌ A 304 response produced entries")
+                return False
+            print("✅ Next run sent a conditional GET and skipped the unchanged feed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing validators: {str(e)}")
+        return False
+
+def test_high_water_mark():
+    """Test that the high-water mark only advances for stored entries and skips older ones."""
+    print("\n=== Testing High-Water Mark ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'feed_state.json')
+
+            # Items 2 and 3 are stored, but the newest item 1 is not
+            rss, entries, _ = collect(path, response(body=rss_body(1, 2, 3)))
+            rss.commit_state(entries, stored_ids={'item-2', 'item-3'})
+            saved = FeedStateStore(path).get('test')
+            if 'high_water' in saved or 'next_due' in saved:
+                print(f"❌ State advanced although an entry was not stored: {saved}")
+                return False
+            print("✅ State not advanced while an entry is unstored")
+
+            rss, entries, _ = collect(path, response(body=rss_body(1, 2, 3)))
+            if sorted(entry['id'] for entry in entries) != ['item-1', 'item-2', 'item-3']:
+                print(f"❌ Unstored entries were not offered again: {[entry['id'] for entry in entries]}")
+                return False
+            rss.commit_state(entries)
+            high_water = FeedStateStore(path).get('test').get('high_water', {})
+            if high_water.get('id') != 'item-1':
+                print(f"❌ High-water mark not set to the newest stored entry: {high_water}")
+                return False
+            print("✅ High-water mark set once every entry was stored")
+
+            # Item 0 is newer than the mark; the others are at or below it
+            rss, entries, _ = collect(path, response(body=rss_body(0, 1, 2, 3)))
+            if [entry['id'] for entry in entries] != ['item-0']:
+                print(f"❌ Expected only the new entry, got {[entry['id'] for entry in entries]}")
+                return False
+            print("✅ Entries at or below the high-water mark skipped")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing high-water mark: {str(e)}")
+        return False
+
+def test_poll_backoff():
+    """Test that the poll interval follows the feed's cadence within the configured bounds."""
+    print("\n=== Testing Poll Backoff ===")
+
+    now = datetime(2025, 5, 27, 12, 0)
+    min_interval = timedelta(minutes=RSS_MIN_POLL_MINUTES)
+    max_interval = timedelta(hours=RSS_MAX_POLL_HOURS)
+    grace = timedelta(minutes=RSS_POLL_GRACE_MINUTES)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = FeedStateStore(os.path.join(tmp_dir, 'feed_state.json'))
+
+            cases = [
+                ('quiet', [], max_interval),
+                ('hourly', [now - timedelta(hours=n) for n in range(5)], max(timedelta(hours=1), min_interval)),
+                ('frequent', [now - timedelta(minutes=5 * n) for n in range(5)], min_interval),
+                ('weekly', [now - timedelta(days=7 * n) for n in range(3)], max_interval),
+            ]
+            for feed_name, publish_times, expected in cases:
+                next_due = store.record_poll(feed_name, publish_times, now=now)
+                if next_due - now != expected:
+                    print(f"❌ {feed_name} feed scheduled {next_due - now} ahead, expected {expected}")
+                    return False
+            print("✅ Interval follows the publish cadence, clamped to the configured bounds")
+
+            next_due = now + max_interval
+            if store.is_due('weekly', now=next_due - grace - timedelta(minutes=1)):
+                print("❌ Feed was due before its grace period")
+                return False
+            if not store.is_due('weekly', now=next_due - grace) or not store.is_due('never-polled', now=now):
+                print("❌ Feed was not due within its grace period")
+                return False
+            print("✅ Feeds are due within the grace period, unpolled feeds always")
+
+            store.save()
+            if FeedStateStore(store.path).get('hourly').get('next_due') != store.get('hourly')['next_due']:
+                print("❌ Schedule was not persisted")
+                return False
+            print("✅ Schedule persisted")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing poll backoff: {str(e)}")
+        return False
+
+def main():
+    """Run all feed state tests."""
+    print("Feed State Test Suite")
+    print("=" * 40)
+
+    tests = [
+        ("Stage and Commit", test_stage_and_commit),
+        ("Validators", test_validators),
+        ("High-Water Mark", test_high_water_mark),
+        ("Poll Backoff", test_poll_backoff)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    return all(result == "PASS" for result in results.values())
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
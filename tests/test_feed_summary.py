@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test script for scoring feed-provided summaries.
+
+Usage:
+    python tests/test_feed_summary.py
+"""
+import sys
+import os
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.feed_summary import OVERLONG_FACTOR, select_feed_summary
+from src.utils.config import FEED_SUMMARY_MAX_WORDS
+
+ARTICLE = (
+    "The research lab released a new open language model on Tuesday, saying it matches larger systems on "
+    "reasoning and coding benchmarks while running on a single graphics card. The team trained the model on a "
+    "filtered mix of web text, books and source code, and published the weights under a permissive license. "
+    "Early users reported strong results on math word problems but noted that long documents still cause it to "
+    "lose track of earlier details."
+)
+
+def words(count):
+    """Build a summary of exactly count words from repeated article text, ending in a full stop."""
+    text = ' '.join((ARTICLE.split() * (count // len(ARTICLE.split()) + 1))[:count])
+    return text.rstrip('.,') + '.'
+
+def test_adequate_summary():
+    """Test that a clean editorial summary is accepted and that empty or title-only ones are not."""
+    print("\n=== Testing Adequate Summaries ===")
+
+    try:
+        decision = select_feed_summary(f"<p>{ARTICLE}</p>", "New open model")
+        if not decision['accepted'] or decision['score'] != 1.0 or decision['summary'] != ARTICLE:
+            print(f"❌ Clean summary was not accepted as is: {decision}")
+            return False
+        print("✅ Clean summary accepted with score 1.0")
+
+        for feed_summary, title, reason in ((None, '', 'missing'), ('New open model.', 'New open model', 'title_only')):
+            decision = select_feed_summary(feed_summary, title)
+            if decision['accepted'] or decision['reason'] != reason:
+                print(f"❌ Expected {reason} for {feed_summary!r}, got {decision}")
+                return False
+        print("✅ Missing and title-only summaries rejected")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing adequate summaries: {str(e)}")
+        return False
+
+def test_boilerplate():
+    """Test that "Read more" and "appeared first on" phrases are removed and penalized."""
+    print("\n=== Testing Boilerplate ===")
+
+    try:
+        decision = select_feed_summary(f"<p>{ARTICLE}</p><p>The post New open model appeared first on Example News.</p>")
+        if not decision['accepted'] or 'appeared first' in decision['summary'] or decision['score'] >= 1.0:
+            print(f"❌ Footer was not stripped and penalized: {decision}")
+            return False
+        print(f"✅ \"appeared first on\" footer stripped (score {decision['score']})")
+
+        decision = select_feed_summary(
+            "<p>The lab released a model. Read the full story at Example News, where our reporters cover "
+            "every release, benchmark and funding round in the industry.</p>"
+        )
+        if decision['accepted'] or decision['reason'] != 'boilerplate':
+            print(f"❌ Mostly \"Read more\" text was not rejected as boilerplate: {decision}")
+            return False
+        print("✅ Mostly \"Read more\" text rejected as boilerplate")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing boilerplate: {str(e)}")
+        return False
+
+def test_truncated_copy():
+    """Test that an excerpt cut from the content is trimmed to its last complete sentence."""
+    print("\n=== Testing Truncated Copies of the Content ===")
+
+    try:
+        excerpt = ' '.join(ARTICLE.split()[:45]) + ' […]'
+        decision = select_feed_summary(excerpt)
+        first_sentence = ARTICLE[:ARTICLE.index('card.') + len('card.')]
+        if not decision['accepted'] or decision['summary'] != first_sentence or decision['score'] >= 1.0:
+            print(f"❌ Excerpt was not trimmed to its last sentence: {decision}")
+            return False
+        print(f"✅ Excerpt trimmed to its last complete sentence (score {decision['score']})")
+
+        decision = select_feed_summary(' '.join(ARTICLE.split()[:12]) + '...')
+        if decision['accepted'] or decision['reason'] != 'truncated':
+            print(f"❌ Excerpt without a complete sentence was not rejected: {decision}")
+            return False
+        print("✅ Excerpt without a complete sentence rejected as truncated")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing truncated copies: {str(e)}")
+        return False
+
+def test_length_limits():
+    """Test that summaries somewhat over the maximum are penalized and far over it are rejected."""
+    print("\n=== Testing Length Limits ===")
+
+    try:
+        decision = select_feed_summary(words(FEED_SUMMARY_MAX_WORDS))
+        if not decision['accepted'] or decision['score'] != 1.0:
+            print(f"❌ Summary at the maximum length was penalized: {decision}")
+            return False
+
+        decision = select_feed_summary(words(int(FEED_SUMMARY_MAX_WORDS * 1.25)))
+        if not decision['accepted'] or decision['score'] >= 1.0:
+            print(f"❌ Summary a little over the maximum was not accepted with a penalty: {decision}")
+            return False
+        print(f"✅ Summary a little over the maximum accepted with score {decision['score']}")
+
+        decision = select_feed_summary(words(int(FEED_SUMMARY_MAX_WORDS * OVERLONG_FACTOR) + 10))
+        if decision['accepted'] or decision['reason'] != 'too_long' or decision['score'] != 0.0:
+            print(f"❌ Summary far over the maximum was not rejected: {decision}")
+            return False
+        print("✅ Summary far over the maximum rejected as too long")
+
+        decision = select_feed_summary("A new open model.")
+        if decision['accepted'] or decision['reason'] != 'too_short':
+            print(f"❌ Very short summary was not rejected: {decision}")
+            return False
+        print("✅ Very short summary rejected as too short")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing length limits: {str(e)}")
+        return False
+
+def main():
+    """Run all feed summary tests."""
+    print("Feed Summary Test Suite")
+    print("=" * 40)
+
+    tests = [
+        ("Adequate Summary", test_adequate_summary),
+        ("Boilerplate", test_boilerplate),
+        ("Truncated Copy", test_truncated_copy),
+        ("Length Limits", test_length_limits)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    return all(result == "PASS" for result in results.values())
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Test script for SimHash near-duplicate detection.
+
+Every check uses an index in a temporary directory, so the real index in
+data/ is never touched.
+
+Usage:
+    python tests/test_near_duplicates.py
+"""
+import sys
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from unittest import mock
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.near_duplicates import HASH_BITS, NearDuplicateIndex, _to_signed, _to_unsigned, simhash
+
+ARTICLE = (
+    "The research lab released a new open language model on Tuesday, saying it matches larger systems on "
+    "reasoning and coding benchmarks while running on a single graphics card. The team trained the model on a "
+    "filtered mix of web text, books and source code, and published the weights under a permissive license. "
+    "Early users reported strong results on math word problems but noted that long documents still cause it to "
+    "lose track of earlier details. The lab plans to release a larger version later this year along with the "
+    "evaluation suite it used to compare the model against commercial alternatives."
+)
+
+# The same story as republished by an aggregator
+SYNDICATED = f"<p>Syndicated from Example News.</p><p>{ARTICLE}</p><p>Read more at example.com.</p>"
+
+UNRELATED = (
+    "City officials approved a budget for repairing bridges and roads after a winter of heavy storms damaged "
+    "several main routes into the downtown area. Crews will begin work in the spring, starting with the river "
+    "crossing that has been closed to trucks since January, and residents can expect detours on weekends. The "
+    "council also voted to expand bus service to the northern suburbs and to add protected bike lanes along two "
+    "busy avenues, though some business owners worry about losing parking in front of their shops."
+)
+
+def test_simhash():
+    """Test that SimHash is stable, 64-bit, and close for near-identical texts."""
+    print("\n=== Testing SimHash ===")
+
+    try:
+        if simhash("Too short to compare") is not None:
+            print("❌ Short text was hashed")
+            return False
+
+        value = simhash(ARTICLE)
+        if value != simhash(ARTICLE) or not 0 <= value < 1 << HASH_BITS:
+            print(f"❌ Hash is not a stable unsigned 64-bit value: {value}")
+            return False
+        print("✅ Hash is a stable unsigned 64-bit value")
+
+        near = bin(value ^ simhash(f"Syndicated from Example News. {ARTICLE} Read more at example.com.")).count('1')
+        far = bin(value ^ simhash(UNRELATED)).count('1')
+        print(f"Distance to a syndicated copy: {near}, to an unrelated article: {far}")
+        if near > 6 or far <= 6:
+            print("❌ Distances do not separate copies from unrelated articles")
+            return False
+        print("✅ Syndicated copy is close, unrelated article is far")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing SimHash: {str(e)}")
+        return False
+
+def test_band_split():
+    """Test that the bands cover the hash and satisfy the pigeonhole property."""
+    print("\n=== Testing LSH Band Split ===")
+
+    rng = random.Random(7)
+    try:
+        # 5, 6 and 11 bands do not divide 64 evenly
+        for max_distance in (3, 4, 5, 7, 10):
+            index = NearDuplicateIndex(path=':memory:', max_distance=max_distance)
+            widths = [bin(mask).count('1') for _, mask in index._bands]
+            offsets = [offset for offset, _ in index._bands]
+            if len(widths) != max_distance + 1 or sum(widths) != HASH_BITS or max(widths) - min(widths) > 1:
+                print(f"❌ max_distance={max_distance}: unexpected band widths {widths}")
+                return False
+            if offsets != [sum(widths[:i]) for i in range(len(widths))]:
+                print(f"❌ max_distance={max_distance}: bands are not contiguous {offsets}")
+                return False
+
+            # Any hash within max_distance bits shares at least one band exactly
+            for _ in range(200):
+                value = rng.getrandbits(HASH_BITS)
+                other = value
+                for bit in rng.sample(range(HASH_BITS), max_distance):
+                    other ^= 1 << bit
+                shared = set(index._band_values(value)) & set(index._band_values(other))
+                if not shared:
+                    print(f"❌ max_distance={max_distance}: hashes {max_distance} bits apart share no band")
+                    return False
+            print(f"✅ max_distance={max_distance}: bands {widths} cover all 64 bits and always share one")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing band split: {str(e)}")
+        return False
+
+def test_signed_round_trip():
+    """Test that hashes with bit 63 set survive SQLite's signed INTEGER storage."""
+    print("\n=== Testing Signed Storage Round Trip ===")
+
+    top = 1 << (HASH_BITS - 1)
+    try:
+        for value in (0, 1, top - 1, top, top | 5, (1 << HASH_BITS) - 1):
+            signed = _to_signed(value)
+            if not -top <= signed < top or _to_unsigned(signed) != value:
+                print(f"❌ {value:#x} did not round-trip (stored as {signed})")
+                return False
+        print("✅ Values round-trip through the signed range")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'index.db')
+            index = NearDuplicateIndex(path=path, max_distance=3)
+            with mock.patch('collectors.near_duplicates.simhash', return_value=top | 0b101):
+                index.find_or_add('rss:a', ARTICLE)
+            index.confirm(['rss:a'])
+            index.close()
+
+            index = NearDuplicateIndex(path=path, max_distance=3)
+            with mock.patch('collectors.near_duplicates.simhash', return_value=top | 0b100):
+                match = index.find_or_add('rss:b', ARTICLE)
+            index.close()
+
+        if match != 'rss:a':
+            print(f"❌ Stored hash with bit 63 set was not matched after reopening: {match}")
+            return False
+        print("✅ Stored hash with bit 63 set matched after reopening")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing signed round trip: {str(e)}")
+        return False
+
+def test_confirm_and_pending():
+    """Test that only confirmed items are offered as canonical to later runs."""
+    print("\n=== Testing Confirm and Pending Items ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'index.db')
+
+            index = NearDuplicateIndex(path=path, max_distance=6)
+            if index.find_or_add('rss:original', ARTICLE) is not None:
+                print("❌ First article was reported as a duplicate")
+                return False
+            if index.find_or_add('rss:copy', SYNDICATED) != 'rss:original':
+                print("❌ Copy in the same run did not match the pending item")
+                return False
+            if index.find_or_add('rss:other', UNRELATED) is not None:
+                print("❌ Unrelated article was reported as a duplicate")
+                return False
+            print("✅ Copy matched within the run, unrelated article did not")
+
+            index.set_summary('rss:original', "A new open model.")
+            index.confirm(['rss:original'])
+            # rss:other was never stored and stays unconfirmed
+            index.close()
+
+            index = NearDuplicateIndex(path=path, max_distance=6)
+            if index.find_or_add('rss:copy-2', SYNDICATED) != 'rss:original':
+                print("❌ Confirmed item was not found after reopening")
+                return False
+            if index.get_summary('rss:original') != "A new open model.":
+                print("❌ Summary of the confirmed item was not persisted")
+                return False
+            print("✅ Confirmed item and its summary persisted")
+
+            if index.find_or_add('rss:other-2', UNRELATED) is not None:
+                print("❌ Unconfirmed item was offered as canonical after reopening")
+                return False
+            print("✅ Unconfirmed item was not offered as canonical after reopening")
+            index.close()
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing confirm and pending items: {str(e)}")
+        return False
+
+def test_retention():
+    """Test that items older than the retention period are pruned on open."""
+    print("\n=== Testing Retention Pruning ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'index.db')
+
+            index = NearDuplicateIndex(path=path, max_distance=6, retention_days=7)
+            index.find_or_add('rss:old', ARTICLE)
+            index.find_or_add('rss:recent', UNRELATED)
+            index.confirm(['rss:old', 'rss:recent'])
+            index.close()
+
+            conn = sqlite3.connect(path)
+            conn.execute("UPDATE items SET added_at = ? WHERE item_key = 'rss:old'", (time.time() - 8 * 86400,))
+            conn.commit()
+            conn.close()
+
+            index = NearDuplicateIndex(path=path, max_distance=6, retention_days=7)
+            old_match = index.find_or_add('rss:old-copy', SYNDICATED)
+            recent_match = index.find_or_add('rss:recent-copy', UNRELATED)
+            index.close()
+
+            conn = sqlite3.connect(path)
+            orphaned = conn.execute("SELECT COUNT(*) FROM bands WHERE item_key = 'rss:old'").fetchone()[0]
+            conn.close()
+
+        if old_match is not None or orphaned:
+            print(f"❌ Expired item was not pruned (match: {old_match}, bands left: {orphaned})")
+            return False
+        if recent_match != 'rss:recent':
+            print("❌ Item inside the retention period was pruned")
+            return False
+        print("✅ Expired item and its bands pruned, recent item kept")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing retention: {str(e)}")
+        return False
+
+def main():
+    """Run all near-duplicate tests."""
+    print("Near-Duplicate Detection Test Suite")
+    print("=" * 40)
+
+    tests = [
+        ("SimHash", test_simhash),
+        ("Band Split", test_band_split),
+        ("Signed Round Trip", test_signed_round_trip),
+        ("Confirm and Pending", test_confirm_and_pending),
+        ("Retention", test_retention)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    return all(result == "PASS" for result in results.values())
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
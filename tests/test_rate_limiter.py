@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for the token bucket and per-host rate limiter.
+
+A fake clock is injected, so the checks never sleep.
+
+Usage:
+    python tests/test_rate_limiter.py
+"""
+import sys
+import os
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.rate_limiter import RateLimiter, TokenBucket
+
+class FakeClock:
+    """Clock that only moves when advanced."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+def test_refill():
+    """Test bursts, waiting times and refill of a single bucket."""
+    print("\n=== Testing Token Bucket Refill ===")
+
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    try:
+        delays = [bucket.reserve() for _ in range(3)]
+        if delays != [0.0, 0.0, 0.5]:
+            print(f"❌ Expected a burst of 2 then a 0.5s wait, got {delays}")
+            return False
+        print("✅ Burst of 2 allowed, third request waits 0.5s")
+
+        # The reserved token is available after 0.5s; another 0.5s refills one more
+        clock.advance(1.0)
+        if bucket.reserve() != 0.0 or bucket.reserve() != 0.5:
+            print("❌ Bucket did not refill at 2 tokens per second")
+            return False
+        print("✅ Bucket refilled at the configured rate")
+
+        # Refill is capped at the capacity
+        clock.advance(3600)
+        delays = [bucket.reserve() for _ in range(3)]
+        if delays != [0.0, 0.0, 0.5]:
+            print(f"❌ Idle bucket refilled past its capacity: {delays}")
+            return False
+        print("✅ Idle bucket refilled only up to its capacity")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing refill: {str(e)}")
+        return False
+
+def test_per_host_isolation():
+    """Test that hosts and API keys get separate buckets and overrides apply."""
+    print("\n=== Testing Per-Host Isolation ===")
+
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, capacity=1, clock=clock)
+
+    try:
+        feed = limiter.bucket('https://Example.com/feed.xml')
+        if feed.reserve() != 0.0 or limiter.bucket('https://example.com/other.xml').reserve() != 1.0:
+            print("❌ URLs on the same host did not share a bucket")
+            return False
+        print("✅ URLs on the same host share a bucket")
+
+        if limiter.bucket('https://another.example.org/rss').reserve() != 0.0:
+            print("❌ A busy host delayed requests to another host")
+            return False
+        if limiter.bucket('https://example.com/api', api_key='secret').reserve() != 0.0:
+            print("❌ A busy host delayed requests made with an API key")
+            return False
+        print("✅ Other hosts and API keys are not delayed")
+
+        limiter.set_limit('fast.example.com', rate=10, capacity=1)
+        fast = limiter.bucket('https://fast.example.com/feed')
+        if fast.reserve() != 0.0 or fast.reserve() != 0.1:
+            print("❌ Per-host override was not applied")
+            return False
+        print("✅ Per-host override applied")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing per-host isolation: {str(e)}")
+        return False
+
+def test_unlimited_rate():
+    """Test that a rate of 0 or less disables limiting instead of failing."""
+    print("\n=== Testing Unlimited Rates ===")
+
+    try:
+        for rate in (0, -1):
+            limiter = RateLimiter(rate=rate)
+            if limiter.bucket('https://example.com/feed') is not None:
+                print(f"❌ Rate {rate} created a bucket")
+                return False
+            if any(limiter.acquire('https://example.com/feed') != 0.0 for _ in range(100)):
+                print(f"❌ Rate {rate} delayed requests")
+                return False
+        print("✅ Rates of 0 or less do not limit requests")
+
+        limiter = RateLimiter(rate=1, capacity=1)
+        limiter.set_limit('unlimited.example.com', rate=0)
+        if limiter.bucket('https://unlimited.example.com/feed') is not None:
+            print("❌ Override with rate 0 still limits the host")
+            return False
+        print("✅ Override with rate 0 makes a single host unlimited")
+
+        try:
+            TokenBucket(0)
+        except ValueError as e:
+            print(f"✅ TokenBucket rejects rate 0: {e}")
+            return True
+        print("❌ TokenBucket accepted rate 0")
+        return False
+
+    except Exception as e:
+        print(f"❌ Error testing unlimited rates: {str(e)}")
+        return False
+
+def main():
+    """Run all rate limiter tests."""
+    print("Rate Limiter Test Suite")
+    print("=" * 40)
+
+    tests = [
+        ("Refill", test_refill),
+        ("Per-Host Isolation", test_per_host_isolation),
+        ("Unlimited Rate", test_unlimited_rate)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    return all(result == "PASS" for result in results.values())
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Test script for the bulk storage, upsert, daily rollup and pagination paths
+of ContentStorage.
+
+The checks run against a temporary SQLite database, so no SQL Server is
+needed. SQLite takes the same INSERT ... ON CONFLICT upsert path as
+PostgreSQL; the SQL Server MERGE is checked with scripts/check_query_plans.py.
+"""
+import sys
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, func, text
+from sqlalchemy.orm import sessionmaker
+
+from src.models import database, storage
+from src.models.content import Content, ContentDailyStats
+from src.models.storage import ContentStorage, encode_cursor, decode_cursor
+
+@contextmanager
+def sqlite_database():
+    """Point the storage layer at a fresh SQLite database for the duration of a test."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'content.db')}")
+
+        # Let SQLAlchemy emit BEGIN itself so savepoints behave as on a server database
+        @event.listens_for(engine, 'connect')
+        def do_connect(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def do_begin(connection):
+            connection.exec_driver_sql('BEGIN')
+
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        with mock.patch.object(database, 'engine', engine), mock.patch.object(storage, 'get_db', get_db):
+            database.init_db()
+            yield session_factory
+        engine.dispose()
+
+def rss_entry(n, published=None, summary=None, **extra):
+    """Build an RSS entry in the shape produced by RSSCollector.extract_entries."""
+    entry = {
+        'id': f"entry-{n}",
+        'title': f"Entry {n}",
+        'link': f"https://example.com/{n}",
+        'published': (published or datetime(2024, 5, 1, 12, 0)).isoformat(),
+        'content': f"Content of entry {n}",
+        'summary': summary,
+        'author': 'Test Author',
+        'canonical_source_id': None
+    }
+    entry.update(extra)
+    return entry
+
+def daily_counts(db):
+    """Get content_daily_stats as {(day, source): count}."""
+    return {(row.day, row.source): row.count for row in db.query(ContentDailyStats)}
+
+def published_at_counts(db):
+    """Count canonical items per (day of published_at, source) with a plain GROUP BY."""
+    day = func.date(Content.published_at)
+    rows = db.query(day, Content.source, func.count()).filter(
+        Content.canonical_source_id.is_(None)
+    ).group_by(day, Content.source)
+    return {(date.fromisoformat(row_day), source): count for row_day, source, count in rows}
+
+def test_chunked_lookup():
+    """Test that existing source IDs are found across several IN chunks."""
+    print("\n=== Testing Chunked Source ID Lookup ===")
+
+    try:
+        with sqlite_database() as session_factory, mock.patch.object(storage, 'IN_CHUNK_SIZE', 3):
+            db = session_factory()
+            try:
+                ContentStorage.save_rss_data(db, [rss_entry(n) for n in range(7)])
+
+                existing = ContentStorage.get_existing_source_ids(db, 'rss', [f"entry-{n}" for n in range(10)])
+                if existing != {f"entry-{n}" for n in range(7)}:
+                    print(f"❌ Expected 7 existing IDs, got {sorted(existing)}")
+                    return False
+                print("✅ 7 of 10 IDs found with chunks of 3")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing chunked lookup: {str(e)}")
+        return False
+
+def test_batch_fallback():
+    """Test that a failing batch is retried row by row, losing only the bad row."""
+    print("\n=== Testing Savepoint Row-by-Row Fallback ===")
+
+    try:
+        with sqlite_database() as session_factory, mock.patch.object(storage, 'DB_BULK_BATCH_SIZE', 4):
+            db = session_factory()
+            try:
+                entries = [rss_entry(n) for n in range(10)]
+                entries[5]['link'] = None  # content.url is NOT NULL
+
+                stored_ids = set()
+                count = ContentStorage.save_rss_data(db, entries, stored_ids=stored_ids)
+
+                if count != 9 or db.query(Content).count() != 9 or 'entry-5' in stored_ids:
+                    print(f"❌ Expected 9 stored entries without entry-5, got {count}")
+                    return False
+                print("✅ Bad row skipped, the rest of its batch stored")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing batch fallback: {str(e)}")
+        return False
+
+def test_upsert_in_place():
+    """Test that entries collected again update the stored row instead of adding one."""
+    print("\n=== Testing Upsert Update-in-Place ===")
+
+    try:
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                ContentStorage.save_rss_data(db, [rss_entry(1, summary='First summary')])
+                row_id = db.query(Content.id).scalar()
+
+                # A missing summary keeps the stored one (COALESCE)
+                count = ContentStorage.save_rss_data(db, [rss_entry(1, summary=None)])
+                db.expire_all()
+                if count != 0 or db.query(Content).count() != 1 or db.query(Content.summary).scalar() != 'First summary':
+                    print("❌ Re-saving without a summary changed the stored row")
+                    return False
+                print("✅ Missing summary kept the stored value")
+
+                ContentStorage.save_rss_data(db, [rss_entry(1, summary='Second summary')])
+                db.expire_all()
+                row = db.query(Content).one()
+                if row.summary != 'Second summary' or row.id != row_id:
+                    print("❌ New summary was not written to the existing row")
+                    return False
+                print("✅ New summary updated the existing row")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing upsert: {str(e)}")
+        return False
+
+def test_duplicate_migration():
+    """Test that init_db removes duplicate rows left by racing runs and builds the unique index."""
+    print("\n=== Testing Migration of Duplicate Rows ===")
+
+    try:
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                # A database from before the unique index, with the same entry stored twice
+                db.execute(text("DROP INDEX ux_content_source_source_id"))
+                db.commit()
+                db.execute(Content.__table__.insert(), [
+                    ContentStorage._content_row(Content.from_rss(rss_entry(n))) for n in (1, 2, 1)
+                ])
+                db.commit()
+
+                database.init_db()
+
+                if db.query(Content).count() != 2:
+                    print(f"❌ Expected 2 rows after migration, got {db.query(Content).count()}")
+                    return False
+                print("✅ Duplicate row removed")
+
+                if ContentStorage.save_rss_data(db, [rss_entry(1), rss_entry(3)]) != 1 or db.query(Content).count() != 3:
+                    print("❌ Upserts failed after migration")
+                    return False
+                print("✅ Upserts work against the new unique index")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing duplicate migration: {str(e)}")
+        return False
+
+def test_published_date_backfill():
+    """Test that published_date is set on insert and backfilled by init_db."""
+    print("\n=== Testing published_date Backfill ===")
+
+    try:
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                published = datetime(2024, 5, 1, 23, 30)
+                ContentStorage.save_rss_data(db, [rss_entry(1, published=published)])
+                if db.query(Content.published_date).scalar() != published.date():
+                    print("❌ published_date was not set on insert")
+                    return False
+
+                # Rows stored before the column existed
+                db.execute(text("UPDATE content SET published_date = NULL"))
+                db.commit()
+                database.backfill_published_date()
+
+                db.expire_all()
+                if db.query(Content.published_date).scalar() != published.date():
+                    print("❌ published_date was not backfilled")
+                    return False
+                print("✅ published_date set on insert and backfilled")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing published_date backfill: {str(e)}")
+        return False
+
+def test_daily_stats():
+    """Test rollup increments, idempotence on re-save, and rebuild."""
+    print("\n=== Testing Daily Stats Rollup ===")
+
+    try:
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                day_one, day_two = datetime(2024, 5, 1, 9, 0), datetime(2024, 5, 2, 9, 0)
+                entries = [rss_entry(n, published=day_one) for n in range(3)]
+                entries += [rss_entry(n, published=day_two) for n in range(3, 5)]
+                entries.append(rss_entry(5, published=day_two, canonical_source_id='entry-3'))
+                ContentStorage.save_rss_data(db, entries)
+
+                expected = {(day_one.date(), 'rss'): 3, (day_two.date(), 'rss'): 2}
+                if daily_counts(db) != expected:
+                    print(f"❌ Expected {expected}, got {daily_counts(db)}")
+                    return False
+                print("✅ New canonical items counted per day")
+
+                # Updates are not counted again
+                ContentStorage.save_rss_data(db, entries)
+                if daily_counts(db) != expected:
+                    print(f"❌ Re-saving changed the rollup to {daily_counts(db)}")
+                    return False
+                print("✅ Re-saving the same entries left the rollup unchanged")
+
+                # An overlapping run looked the keys up before the first run inserted them
+                with mock.patch.object(ContentStorage, 'get_existing_source_ids', return_value=set()):
+                    count = ContentStorage.save_rss_data(db, entries)
+                if count != 0 or daily_counts(db) != expected:
+                    print(f"❌ Rows inserted by another run were counted again: {daily_counts(db)}")
+                    return False
+                print("✅ Rows inserted by another run were not counted again")
+
+                dates = ContentStorage.get_available_dates()
+                if dates != [{'date': '2024-05-02', 'count': 2}, {'date': '2024-05-01', 'count': 3}]:
+                    print(f"❌ Unexpected available dates: {dates}")
+                    return False
+                print("✅ Available dates read from the rollup")
+
+                # Drift is repaired by a rebuild
+                db.query(ContentDailyStats).update({ContentDailyStats.count: 99})
+                db.commit()
+                ContentStorage.rebuild_daily_stats()
+                db.expire_all()
+                if daily_counts(db) != expected:
+                    print(f"❌ Rebuild produced {daily_counts(db)}")
+                    return False
+                print("✅ Rebuild recomputed the rollup")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing daily stats: {str(e)}")
+        return False
+
+def test_rollup_without_published_date():
+    """Test that rows stored without published_date are counted by rebuild and later increments."""
+    print("\n=== Testing Rollup of Rows Without published_date ===")
+
+    try:
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                # A row as written by the Node backend before it set published_date
+                row = ContentStorage._content_row(Content.from_rss(rss_entry(1, published=datetime(2024, 5, 1, 9, 0))))
+                row['published_date'] = None
+                db.execute(Content.__table__.insert(), [row])
+                db.commit()
+
+                ContentStorage.rebuild_daily_stats()
+                db.expire_all()
+                if daily_counts(db) != published_at_counts(db):
+                    print(f"❌ Rebuild produced {daily_counts(db)}, expected {published_at_counts(db)}")
+                    return False
+                print("✅ Rebuild counted the row without published_date")
+
+                ContentStorage.save_rss_data(db, [
+                    rss_entry(2, published=datetime(2024, 5, 1, 18, 0)),
+                    rss_entry(3, published=datetime(2024, 5, 2, 9, 0))
+                ])
+                expected = {(date(2024, 5, 1), 'rss'): 2, (date(2024, 5, 2), 'rss'): 1}
+                if published_at_counts(db) != expected or daily_counts(db) != expected:
+                    print(f"❌ Incremental counts {daily_counts(db)} differ from {published_at_counts(db)}")
+                    return False
+                print("✅ Incremental counts match a GROUP BY over published_at")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing rollup without published_date: {str(e)}")
+        return False
+
+def test_duplicate_of_unstored_item():
+    """Test that a near duplicate of an item that was never stored is stored as canonical."""
+    print("\n=== Testing Near Duplicate of an Unstored Item ===")
+
+    try:
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                ContentStorage.save_rss_data(db, [rss_entry(1, canonical_source_id='never-stored')])
+                if db.query(Content.canonical_source_id).scalar() is not None:
+                    print("❌ Entry still links to a missing canonical item")
+                    return False
+                if len(ContentStorage.get_recent_content()) != 1:
+                    print("❌ Entry is hidden from recent content")
+                    return False
+                print("✅ Entry stored as canonical and listed")
+                return True
+            finally:
+                db.close()
+
+    except Exception as e:
+        print(f"❌ Error testing near duplicate link: {str(e)}")
+        return False
+
+def test_cursor_pagination():
+    """Test cursor encoding and keyset paging, including ties on published_at."""
+    print("\n=== Testing Cursor Pagination ===")
+
+    try:
+        published = datetime(2024, 5, 1, 12, 0)
+        if decode_cursor(encode_cursor(published, 'abc')) != (published, 'abc'):
+            print("❌ Cursor did not round-trip")
+            return False
+        print("✅ Cursor round-trips")
+
+        for cursor in ('not-a-cursor', encode_cursor(published, 'abc')[:-4], 'WzFd'):
+            try:
+                decode_cursor(cursor)
+                print(f"❌ Malformed cursor {cursor!r} was accepted")
+                return False
+            except ValueError:
+                pass
+        print("✅ Malformed cursors raise ValueError")
+
+        with sqlite_database() as session_factory:
+            db = session_factory()
+            try:
+                # Pairs of entries share a published_at so pages break ties by id
+                entries = [rss_entry(n, published=published - timedelta(hours=n // 2)) for n in range(7)]
+                ContentStorage.save_rss_data(db, entries)
+            finally:
+                db.close()
+
+            seen = []
+            after = None
+            pages = 0
+            while True:
+                page = ContentStorage.get_content_page(limit=3, after=after)
+                seen.extend(item['id'] for item in page['items'])
+                pages += 1
+                after = page['next_cursor']
+                if after is None:
+                    break
+
+            expected = [item['id'] for item in ContentStorage.get_recent_content(limit=10)]
+            if pages != 3 or seen != expected or len(set(seen)) != 7:
+                print(f"❌ Paging returned {len(seen)} items in {pages} pages, expected 7 in 3")
+                return False
+            print("✅ 7 items paged in order without gaps or repeats")
+
+            # The API script rejects a malformed --after cursor with a usage error
+            from backend.api import get_content
+            with mock.patch.object(sys, 'argv', ['get_content.py', '--after', 'not-a-cursor']):
+                try:
+                    get_content.main()
+                    print("❌ get_content.py accepted a malformed --after cursor")
+                    return False
+                except SystemExit as e:
+                    if e.code != 2:
+                        print(f"❌ get_content.py exited with {e.code}, expected 2")
+                        return False
+            print("✅ get_content.py rejects a malformed --after cursor")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error testing cursor pagination: {str(e)}")
+        return False
+
+def main():
+    """Run all storage tests."""
+    print("🚀 Starting Storage Tests (SQLite)")
+    print("=" * 40)
+
+    tests = [
+        ("Chunked Lookup", test_chunked_lookup),
+        ("Batch Fallback", test_batch_fallback),
+        ("Upsert In Place", test_upsert_in_place),
+        ("Duplicate Migration", test_duplicate_migration),
+        ("published_date Backfill", test_published_date_backfill),
+        ("Daily Stats", test_daily_stats),
+        ("Rollup Without published_date", test_rollup_without_published_date),
+        ("Duplicate of Unstored Item", test_duplicate_of_unstored_item),
+        ("Cursor Pagination", test_cursor_pagination)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    all_passed = all(result == "PASS" for result in results.values())
+    if all_passed:
+        print("\n🎉 All tests passed!")
+    else:
+        print("\n⚠️ Some tests failed.")
+
+    return all_passed
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
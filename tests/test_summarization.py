@@ -4,12 +4,22 @@ Test script for the summarization service.
 """
 import sys
 import os
+import re
+import tempfile
+import threading
+import time
+from html import unescape
+from unittest import mock
 
 # Add the root directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.services.summarization_service import summarization_service
+from scripts.mock_llm_server import MockLLMServer
+from src.services.extractive_summarizer import extractive_summarizer, split_sentences
+from src.services.summarization_service import SummarizationService, summarization_service
+from src.services.summary_retry import SummaryRetryQueue
 from src.utils.logger import setup_logger
+from src.utils.summary_cache import SummaryCache
 
 # Set up logger
 logger = setup_logger('test_summarization')
@@ -106,6 +116,113 @@ def test_content_cleaning():
         print(f"❌ Error testing content cleaning: {str(e)}")
         return False
 
+def regex_clean_content(content):
+    """The previous regex-based clean_content, kept as a benchmark baseline."""
+    content = unescape(content)
+    content = re.sub(r'<[^>]+>', '', content)
+    content = re.sub(r'\s+', ' ', content).strip()
+    if len(content) > 2000:
+        content = content[:2000] + "..."
+    return content
+
+def build_large_fixture(paragraphs=5000):
+    """Build a large content:encoded style HTML body (close to 1 MB)."""
+    parts = [
+        '<style>.post { color: red; }</style>',
+        '<script>var tracking = "do not include this";</script>',
+        '<p><strong>Lead:</strong> Researchers released an open model that matches larger systems on reasoning benchmarks.</p>'
+    ]
+    for i in range(paragraphs):
+        parts.append(
+            f'<p>Paragraph {i} discusses training data, evaluation &amp; deployment of the model. '
+            f'<a href="https://example.com/{i}">Read more</a> about <em>results</em> and limitations.</p>\n'
+        )
+    return ''.join(parts)
+
+def test_content_cleaning_benchmark(runs=20):
+    """Compare the streaming extractor against the regex implementation on a large fixture."""
+    print("\n=== Benchmarking Content Cleaning ===")
+    
+    fixture = build_large_fixture()
+    budget_chars = summarization_service.input_tokens * 4
+    
+    try:
+        start = time.perf_counter()
+        for _ in range(runs):
+            baseline = regex_clean_content(fixture)
+        regex_time = (time.perf_counter() - start) / runs
+        
+        start = time.perf_counter()
+        for _ in range(runs):
+            cleaned = summarization_service.clean_content(fixture)
+        stream_time = (time.perf_counter() - start) / runs
+        
+        print(f"Fixture size: {len(fixture) / 1024:.0f} KB")
+        print(f"regex:     {regex_time * 1000:.2f} ms per document ({len(baseline)} characters)")
+        print(f"streaming: {stream_time * 1000:.2f} ms per document ({len(cleaned)} characters)")
+        print(f"Speedup:   {regex_time / stream_time:.1f}x")
+        
+        if not cleaned.startswith("Lead: Researchers released an open model"):
+            print(f"❌ Lead paragraph not kept: {cleaned[:80]!r}")
+            return False
+        
+        if 'tracking' in cleaned or 'color: red' in cleaned:
+            print("❌ Script or style content leaked into the text")
+            return False
+        
+        if len(cleaned) > budget_chars + 3 or not cleaned.endswith('...'):
+            print(f"❌ Text not cut to the token budget ({len(cleaned)} characters)")
+            return False
+        
+        print("✅ Lead paragraphs kept within the token budget")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error benchmarking content cleaning: {str(e)}")
+        return False
+
+def test_extractive_summarization():
+    """Test the local extractive summarizer used when the API is unavailable."""
+    print("\n=== Testing Extractive Summarization ===")
+    
+    title = "Open model matches larger systems on reasoning benchmarks"
+    content = (
+        "Researchers released an open model that matches much larger systems on reasoning benchmarks. "
+        "The team trained the model on a curated mix of code, mathematics and scientific papers. "
+        "Lunch at the conference was served in the main hall on both days. "
+        "On reasoning benchmarks the open model scored within two points of the largest closed systems. "
+        "The weights are available under a permissive license for research and commercial use. "
+        "Several attendees said the venue was hard to find from the train station."
+    )
+    
+    try:
+        start = time.perf_counter()
+        summary = extractive_summarizer.summarize(content, title)
+        elapsed = time.perf_counter() - start
+        
+        print(f"Summary: {summary}")
+        print(f"Time: {elapsed * 1000:.2f} ms")
+        
+        sentences = split_sentences(summary or "")
+        if not sentences or len(sentences) > 3:
+            print(f"❌ Expected 1-3 sentences, got {len(sentences)}")
+            return False
+        
+        if any(sentence not in content for sentence in sentences):
+            print("❌ Summary contains text that is not in the article")
+            return False
+        
+        if not summary.startswith("Researchers released an open model") or "Lunch" in summary:
+            print("❌ Summary did not favour the lead and on-topic sentences")
+            return False
+        
+        print("✅ Extractive summary generated")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error testing extractive summarization: {str(e)}")
+        return False
+
 def test_batch_summarization():
     """Test batch summarization functionality."""
     print("\n=== Testing Batch Summarization ===")
@@ -147,6 +264,152 @@ def test_batch_summarization():
         print(f"❌ Error testing batch summarization: {str(e)}")
         return False
 
+def test_mock_endpoint_batch():
+    """Test batch summarization offline against the mock summarization API."""
+    print("\n=== Testing Batch Summarization Against the Mock API ===")
+    
+    articles = [
+        {'title': f"Mock article {i}", 'content': f"<p>Article {i} describes a new model release and its benchmark results in detail.</p>"}
+        for i in range(12)
+    ]
+    
+    server = MockLLMServer(latency=0.05, throttle_rate=0.2, seed=1).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = {}
+            for name, url in (('chat', server.chat_url), ('generic', server.generic_url)):
+                service = SummarizationService(cache=None, retry_queue=SummaryRetryQueue(os.path.join(tmp, 'retry.json')))
+                service.cache = None
+                service.enabled = True
+                service.api_key = 'mock'
+                service.api_url = url
+                service.fallback_enabled = False
+                
+                summaries = dict(service.iter_summaries(articles))
+                service.close()
+                results[name] = sum(1 for summary in summaries.values() if summary and summary.startswith('Mock summary'))
+                print(f"{name}: {results[name]}/{len(articles)} summaries, {service.route_stats()['default']['requests']} requests")
+        
+        print(f"Mock server: {server.stats}")
+        if all(count == len(articles) for count in results.values()) and server.stats['throttled'] > 0:
+            print("✅ Every article summarized through both API formats despite 429 responses")
+            return True
+        
+        print("❌ Some articles were not summarized")
+        return False
+        
+    except Exception as e:
+        print(f"❌ Error testing the mock endpoint: {str(e)}")
+        return False
+    finally:
+        server.stop()
+
+class CountingBucket:
+    """Stand-in for a TokenBucket that records every acquire without waiting."""
+    
+    def __init__(self):
+        self.costs = []
+    
+    def acquire(self, cost=1):
+        self.costs.append(cost)
+        return 0.0
+
+def test_rate_limit_per_attempt():
+    """Test that retried API requests are charged against the rate limits on every attempt."""
+    print("\n=== Testing Rate Limits Per Attempt ===")
+    
+    server = MockLLMServer(latency=0.01, throttle_rate=0.5, seed=3).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            service = SummarizationService(cache=None, retry_queue=SummaryRetryQueue(os.path.join(tmp, 'retry.json')))
+            service.enabled = True
+            service.api_key = 'mock'
+            service.api_url = server.chat_url
+            service.request_bucket = CountingBucket()
+            service.token_bucket = CountingBucket()
+            
+            # Retry immediately instead of honoring Retry-After
+            with mock.patch('src.services.summarization_service.parse_retry_after', return_value=0.0), \
+                    mock.patch('src.services.summarization_service.backoff_delay', return_value=0.0):
+                for i in range(8):
+                    service._request_summary(f"Article {i} describes a new model release in detail.", f"Article {i}")
+            service.close()
+        
+        requests_made = server.stats['requests']
+        print(f"Mock server: {server.stats}")
+        if server.stats['throttled'] == 0 or len(service.request_bucket.costs) != requests_made:
+            print(f"❌ {len(service.request_bucket.costs)} request tokens taken for {requests_made} requests")
+            return False
+        print(f"✅ One request token taken for each of {requests_made} attempts, retries included")
+        
+        token_costs = service.token_bucket.costs
+        if len(token_costs) != requests_made or min(token_costs) <= 0:
+            print(f"❌ Token estimate charged {len(token_costs)} times for {requests_made} requests")
+            return False
+        print(f"✅ Token estimate charged for every attempt ({sum(token_costs)} tokens)")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error testing rate limits per attempt: {str(e)}")
+        return False
+    finally:
+        server.stop()
+
+def test_summary_cache():
+    """Test summary caching, LRU eviction and in-flight request sharing."""
+    print("\n=== Testing Summary Cache ===")
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = SummaryCache(path=os.path.join(tmp_dir, 'cache.db'), max_entries=10)
+            calls = []
+            
+            def slow_summary():
+                calls.append(1)
+                time.sleep(0.2)
+                return "A cached summary."
+            
+            # Concurrent requests for the same key share one computation
+            key = SummaryCache.make_key("content", "title", "model", "1")
+            threads = [threading.Thread(target=cache.get_or_compute, args=(key, slow_summary)) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            if len(calls) != 1:
+                print(f"❌ Expected 1 computation for concurrent requests, got {len(calls)}")
+                return False
+            print("✅ Concurrent requests shared one computation")
+            
+            # A second lookup is answered from the cache
+            if cache.get_or_compute(key, slow_summary) != "A cached summary." or len(calls) != 1:
+                print("❌ Cached summary was not reused")
+                return False
+            print("✅ Cached summary reused")
+            
+            # A different prompt version is a different key
+            if SummaryCache.make_key("content", "title", "model", "2") == key:
+                print("❌ Prompt version is not part of the cache key")
+                return False
+            
+            # Filling the cache past its bound evicts the least recently used entries
+            for i in range(20):
+                cache.put(f"key_{i}", f"summary {i}")
+                cache.get(key)
+            
+            if len(cache) > 10 or cache.get(key) is None or cache.get("key_0") is not None:
+                print("❌ LRU eviction did not keep the most recently used entries")
+                return False
+            print(f"✅ LRU eviction kept the cache at {len(cache)} entries")
+            
+            cache.close()
+            return True
+            
+    except Exception as e:
+        print(f"❌ Error testing summary cache: {str(e)}")
+        return False
+
 def main():
     """Run all summarization tests."""
     print("Summarization Service Test Suite")
@@ -154,8 +417,13 @@ def main():
     
     tests = [
         ("Content Cleaning", test_content_cleaning),
+        ("Content Cleaning Benchmark", test_content_cleaning_benchmark),
+        ("Summary Cache", test_summary_cache),
+        ("Extractive Summarization", test_extractive_summarization),
         ("Summarization Service", test_summarization_service),
-        ("Batch Summarization", test_batch_summarization)
+        ("Batch Summarization", test_batch_summarization),
+        ("Mock Endpoint Batch", test_mock_endpoint_batch),
+        ("Rate Limit Per Attempt", test_rate_limit_per_attempt)
     ]
     
     results = {}
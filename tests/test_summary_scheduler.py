@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Test script for deadline-aware summary scheduling and model routing.
+
+The scheduler runs against a fake summarization service that advances an
+injected clock, so the time budget runs out without waiting or API calls.
+
+Usage:
+    python tests/test_summary_scheduler.py
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add the root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.model_router import ModelRouter, SummaryRoute
+from src.services.summary_scheduler import SummaryScheduler
+
+class FakeClock:
+    """Clock that only moves when advanced."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class FakeRetryQueue:
+    """Records deferred entries instead of writing them to disk."""
+
+    def __init__(self):
+        self.added = []
+        self.saves = 0
+
+    def add(self, source, source_id, title, deferred=False, save=True):
+        self.added.append((source, source_id, deferred))
+
+    def save(self):
+        self.saves += 1
+
+class FakeService:
+    """Summarization service whose every summary takes one second on the fake clock."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.retry_queue = FakeRetryQueue()
+        self.requested = []
+
+    def iter_summaries(self, articles, deadline=None):
+        for i, article in enumerate(articles):
+            if deadline is not None and self.clock() >= deadline:
+                return
+            self.requested.append(article['id'])
+            self.clock.now += 1
+            yield i, f"Summary of {article['title']}"
+
+    def generate_local_summary(self, content, title=''):
+        return f"Local summary of {title}"
+
+    def route_stats(self):
+        return {}
+
+def entries(count):
+    """Build entries whose priority falls with their number: entry 0 is the newest."""
+    now = datetime.utcnow()
+    return [
+        {
+            'id': f"entry-{n}",
+            'source': 'rss',
+            'feed_name': 'test',
+            'title': f"Entry {n}",
+            'content': ' '.join(['word'] * 300),
+            'published': (now - timedelta(hours=n)).isoformat()
+        }
+        for n in reversed(range(count))
+    ]
+
+def test_deadline_expiry():
+    """Test that the budget starts at start() and expires on the injected clock."""
+    print("\n=== Testing Deadline Expiry ===")
+
+    clock = FakeClock()
+    try:
+        scheduler = SummaryScheduler(FakeService(clock), time_budget=10, clock=clock)
+        if scheduler.remaining() is not None or scheduler.expired():
+            print("❌ Budget was running before start()")
+            return False
+
+        scheduler.start()
+        clock.now += 4
+        if scheduler.remaining() != 6 or scheduler.expired():
+            print(f"❌ Expected 6s left, got {scheduler.remaining()}")
+            return False
+        clock.now += 6
+        if scheduler.remaining() != 0 or not scheduler.expired():
+            print("❌ Budget did not expire at the deadline")
+            return False
+        print("✅ Budget counted from start() and expired at the deadline")
+
+        unlimited = SummaryScheduler(FakeService(clock), time_budget=0, clock=clock)
+        unlimited.start()
+        clock.now += 10 ** 6
+        if unlimited.remaining() is not None or unlimited.expired():
+            print("❌ A budget of 0 expired")
+            return False
+        print("✅ A budget of 0 never expires")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing deadline expiry: {str(e)}")
+        return False
+
+def test_deferral():
+    """Test that work past the deadline is deferred to the backfill queue, in priority order."""
+    print("\n=== Testing Deferral to the Backfill Queue ===")
+
+    clock = FakeClock()
+    service = FakeService(clock)
+    try:
+        scheduler = SummaryScheduler(service, time_budget=2.5, source_weights={}, clock=clock)
+        batch = entries(5)
+        scheduler.start()
+        counts = scheduler.summarize(batch)
+
+        if counts != {'summarized': 3, 'deferred': 2}:
+            print(f"❌ Expected 3 summarized and 2 deferred, got {counts}")
+            return False
+        if service.requested != ['entry-0', 'entry-1', 'entry-2']:
+            print(f"❌ Entries were not summarized newest first: {service.requested}")
+            return False
+        print("✅ Highest priority entries summarized before the deadline")
+
+        deferred = sorted(entry['id'] for entry in batch if entry['summary'].startswith('Local summary'))
+        if deferred != ['entry-3', 'entry-4']:
+            print(f"❌ Deferred entries did not get a local summary: {deferred}")
+            return False
+        if service.retry_queue.added != [('rss', 'entry-3', True), ('rss', 'entry-4', True)] or service.retry_queue.saves != 1:
+            print(f"❌ Deferred entries not queued for backfill: {service.retry_queue.added}")
+            return False
+        print("✅ Remaining entries got a local summary and were queued for backfill once")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing deferral: {str(e)}")
+        return False
+
+def test_routing_thresholds():
+    """Test route selection by content length and priority."""
+    print("\n=== Testing Routing Thresholds ===")
+
+    def route(name):
+        return SummaryRoute(name, f"model-{name}", "{title}\n{content}", 100, 1000, name)
+
+    routes = {name: route(name) for name in ('default', 'small', 'large', 'long')}
+    router = ModelRouter(routes, long_content_chars=1000, high_priority=0.8)
+
+    cases = [
+        ('x' * 1000, 0.9, 'long'),
+        ('x' * 999, 0.8, 'large'),
+        ('x' * 999, 0.79, 'small'),
+        ('x' * 999, None, 'small'),
+        (None, None, 'small'),
+    ]
+    try:
+        for content, priority, expected in cases:
+            selected = router.select(content, priority).name
+            if selected != expected:
+                print(f"❌ {len(content or '')} chars at priority {priority}: expected {expected}, got {selected}")
+                return False
+        print("✅ Long content, high priority and other articles routed by the thresholds")
+
+        disabled = [
+            (ModelRouter(routes, long_content_chars=0, high_priority=None), 'small'),
+            (ModelRouter({'default': routes['default'], 'small': routes['small']}, high_priority=0.8), 'small'),
+            (ModelRouter({'default': routes['default']}, long_content_chars=1000, high_priority=0.8), 'default'),
+        ]
+        for disabled_router, expected in disabled:
+            selected = disabled_router.select('x' * 5000, 1.0).name
+            if selected != expected:
+                print(f"❌ Expected {expected} with routes {sorted(disabled_router.routes)}, got {selected}")
+                return False
+        print("✅ Disabled thresholds and missing routes fall back to small or default")
+
+        router.record(routes['small'], 0.2, prompt_tokens=300, completion_tokens=50)
+        router.record(routes['small'], 0.4, prompt_tokens=300, completion_tokens=0, success=False)
+        small = router.report()['small']
+        if (small['requests'], small['failures'], small['prompt_tokens'], small['mean_latency']) != (2, 1, 600, 0.3):
+            print(f"❌ Unexpected usage report: {small}")
+            return False
+        print("✅ Usage accounted per route")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error testing routing thresholds: {str(e)}")
+        return False
+
+def main():
+    """Run all scheduling and routing tests."""
+    print("Summary Scheduling Test Suite")
+    print("=" * 40)
+
+    tests = [
+        ("Deadline Expiry", test_deadline_expiry),
+        ("Deferral", test_deferral),
+        ("Routing Thresholds", test_routing_thresholds)
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        print(f"\nRunning test: {test_name}")
+        result = test_func()
+        results[test_name] = "PASS" if result else "FAIL"
+
+    # Print summary
+    print("\n" + "=" * 40)
+    print("Test Results Summary")
+    print("=" * 40)
+    for test_name, result in results.items():
+        status_icon = "✅" if result == "PASS" else "❌"
+        print(f"{status_icon} {test_name}: {result}")
+
+    return all(result == "PASS" for result in results.values())
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)